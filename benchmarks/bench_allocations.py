@@ -0,0 +1,112 @@
+"""Allocation count benchmark of the conversion of S-Expressions into objects
+
+Counts how many objects of the kiutils dataclasses ``from_sexpr()`` creates for every board,
+schematic, footprint and symbol library of the test corpus and compares this to the number of
+objects that are reachable from the result. Every object that is created but not part of the
+result (e.g. a default value that is replaced by the parser) is reported as wasted. The script
+exits with an error if any allocation is wasted.
+
+Usage (from the repository root):
+    python benchmarks/bench_allocations.py
+
+License identifier:
+    GPL-3.0
+"""
+
+import collections
+import dataclasses
+import glob
+import importlib
+import os
+import pkgutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import kiutils  # noqa: E402
+from kiutils.board import Board  # noqa: E402
+from kiutils.footprint import Footprint  # noqa: E402
+from kiutils.schematic import Schematic  # noqa: E402
+from kiutils.symbol import SymbolLib  # noqa: E402
+from kiutils.utils.sexpr import parse_sexp  # noqa: E402
+
+CORPUS = (
+    ("Board", Board, os.path.join("tests", "testdata", "board", "**", "*")),
+    ("Schematic", Schematic, os.path.join("tests", "testdata", "schematic", "**", "*")),
+    ("Footprint", Footprint, os.path.join("tests", "testdata", "footprint", "**", "*")),
+    ("SymbolLib", SymbolLib, os.path.join("tests", "testdata", "symbol", "**", "*")),
+)
+
+allocations = collections.Counter()
+
+
+def counting_new(cls, *args, **kwargs):
+    """Replacement of ``__new__`` that counts the created objects per class"""
+    allocations[cls.__name__] += 1
+    return object.__new__(cls)
+
+
+def install_counters():
+    """Count the objects created of every dataclass of kiutils"""
+    for module in pkgutil.walk_packages(kiutils.__path__, "kiutils."):
+        for value in vars(importlib.import_module(module.name)).values():
+            if (
+                isinstance(value, type)
+                and dataclasses.is_dataclass(value)
+                and value.__module__.startswith("kiutils")
+            ):
+                value.__new__ = counting_new
+
+
+def count_reachable(root) -> collections.Counter:
+    """Count the dataclass objects reachable from the given object per class"""
+    reachable = collections.Counter()
+    seen = set()
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            reachable[type(value).__name__] += 1
+            stack.extend(getattr(value, f.name) for f in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+    return reachable
+
+
+def main():
+    install_counters()
+    wasted = collections.Counter()
+    for name, cls, pattern in CORPUS:
+        created = reachable = 0
+        for file in sorted(glob.glob(pattern, recursive=True)):
+            if not os.path.isfile(file) or file.endswith(".expected"):
+                continue
+            with open(file, "r", encoding="utf-8") as infile:
+                exp = parse_sexp(infile.read())
+            allocations.clear()
+            try:
+                result = cls.from_sexpr(exp)
+            except Exception:
+                continue
+            live = count_reachable(result)
+            created += sum(allocations.values())
+            reachable += sum(live.values())
+            wasted.update(allocations - live)
+        print(
+            f"{name:10s} {created:7d} objects created {reachable:7d} reachable "
+            f"{created - reachable:7d} wasted"
+        )
+
+    for cls, count in wasted.most_common():
+        print(f"  wasted {cls}: {count}")
+    if wasted:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark of the conversion of S-Expressions into objects
+
+Parses every board, schematic, footprint and symbol library of the test corpus once and then
+measures how long ``from_sexpr()`` of the respective class takes to build the objects. Files that
+cannot be loaded (e.g. test files for unsupported tokens) are skipped.
+
+Every class is measured twice: once with the token handler tables (``tokenHandlers``) and once
+with a reference that looks up the handlers like the ``if item[0] == ...`` chains did before the
+tables were introduced, i.e. by comparing the token with every known token in turn. The handlers
+themselves are the same in both runs, so the difference is the cost of the lookup.
+
+Usage (from the repository root):
+    python benchmarks/bench_from_sexpr.py
+
+License identifier:
+    GPL-3.0
+"""
+
+import glob
+import os
+import sys
+import timeit
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from kiutils.board import Board  # noqa: E402
+from kiutils.footprint import Footprint  # noqa: E402
+from kiutils.schematic import Schematic  # noqa: E402
+from kiutils.symbol import SymbolLib  # noqa: E402
+from kiutils.utils.dispatch import TokenDispatch  # noqa: E402
+from kiutils.utils.sexpr import parse_sexp  # noqa: E402
+
+CORPUS = (
+    ("Board", Board, os.path.join("tests", "testdata", "board", "**", "*")),
+    ("Schematic", Schematic, os.path.join("tests", "testdata", "schematic", "**", "*")),
+    ("Footprint", Footprint, os.path.join("tests", "testdata", "footprint", "**", "*")),
+    ("SymbolLib", SymbolLib, os.path.join("tests", "testdata", "symbol", "**", "*")),
+)
+
+
+def load_corpus(cls, pattern):
+    """Parse all files matching the pattern that can be converted by the given class"""
+    expressions = []
+    for file in sorted(glob.glob(pattern, recursive=True)):
+        if not os.path.isfile(file) or file.endswith(".expected"):
+            continue
+        try:
+            with open(file, "r", encoding="utf-8") as infile:
+                exp = parse_sexp(infile.read())
+            cls.from_sexpr(exp)
+        except Exception:
+            continue
+        expressions.append(exp)
+    return expressions
+
+
+class SequentialHandlers:
+    """Handler table of the reference, which compares the token with every known token in the
+    order of the table, like the ``if item[0] == ...`` chains did"""
+
+    def __init__(self, handlers):
+        lines = ["def get(token):"]
+        for index, token in enumerate(handlers):
+            lines.append(f"    if token == {token!r}: return handlers[{index}]")
+        namespace = {"handlers": list(handlers.values())}
+        exec("\n".join(lines), namespace)
+        self.get = namespace["get"]
+
+
+def dispatch_classes(cls=TokenDispatch):
+    """Get all subclasses of ``TokenDispatch`` that have their own handler table"""
+    for subclass in cls.__subclasses__():
+        if "tokenHandlers" in subclass.__dict__:
+            yield subclass
+        yield from dispatch_classes(subclass)
+
+
+@contextmanager
+def reference_lookup():
+    """Replace the handler tables of all classes with the sequential reference lookup"""
+    tables = {cls: cls.__dict__["tokenHandlers"] for cls in dispatch_classes()}
+    try:
+        for cls, handlers in tables.items():
+            cls.tokenHandlers = SequentialHandlers(handlers)
+        yield
+    finally:
+        for cls, handlers in tables.items():
+            cls.tokenHandlers = handlers
+
+
+def measure(cls, expressions):
+    """Get the time of converting all expressions once with the reference lookup and with the
+    handler tables. The runs alternate, so that both see the same load of the machine.
+    """
+    results = {"reference": [], "tokenHandlers": []}
+    for _ in range(7):
+        with reference_lookup():
+            results["reference"].append(
+                timeit.timeit(
+                    lambda: [cls.from_sexpr(exp) for exp in expressions], number=5
+                )
+            )
+        results["tokenHandlers"].append(
+            timeit.timeit(
+                lambda: [cls.from_sexpr(exp) for exp in expressions], number=5
+            )
+        )
+    return min(results["reference"]) / 5, min(results["tokenHandlers"]) / 5
+
+
+def main():
+    totals = {"reference": 0.0, "tokenHandlers": 0.0}
+    for name, cls, pattern in CORPUS:
+        expressions = load_corpus(cls, pattern)
+        expected = [repr(cls.from_sexpr(exp)) for exp in expressions]
+        with reference_lookup():
+            if [repr(cls.from_sexpr(exp)) for exp in expressions] != expected:
+                raise Exception("Output differs from the reference lookup")
+        reference, result = measure(cls, expressions)
+        totals["reference"] += reference
+        totals["tokenHandlers"] += result
+        print(
+            f"{name:10s} {len(expressions):4d} files "
+            f"reference {reference * 1000:8.2f} ms/pass "
+            f"tokenHandlers {result * 1000:8.2f} ms/pass "
+            f"speedup {reference / result:.2f}x"
+        )
+    print(
+        f"{'Total':10s} {'':10s} "
+        f"reference {totals['reference'] * 1000:8.2f} ms/pass "
+        f"tokenHandlers {totals['tokenHandlers'] * 1000:8.2f} ms/pass "
+        f"speedup {totals['reference'] / totals['tokenHandlers']:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark of loading and saving numeric-heavy boards with and without exact numbers
+
+Generates a board with many tracks and a zone with a large fill, then compares loading and
+saving it with ``Board.from_file()`` (numbers converted to ``int``/``float``) and
+``Board.from_file(exact=True)`` (numbers kept as ``sexpr.Number``).
+
+Usage (from the repository root):
+    python benchmarks/bench_numbers.py [TRACKS] [FILL_POINTS]
+
+License identifier:
+    GPL-3.0
+"""
+
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from kiutils.board import Board  # noqa: E402
+
+
+def coordinate(rng):
+    """A coordinate in the number format KiCad writes"""
+    return f"{rng.randrange(0, 300000) / 1000:g}"
+
+
+def generate_board(tracks: int, points: int) -> str:
+    """Generate a board with the given number of tracks and zone fill points"""
+    rng = random.Random(0)
+    board = Board.create_new()
+    content = board.to_sexpr().rstrip()[:-1]
+    for _ in range(tracks):
+        content += (
+            f"  (segment (start {coordinate(rng)} {coordinate(rng)}) "
+            f'(end {coordinate(rng)} {coordinate(rng)}) (width 0.25) (layer "F.Cu") (net 0) '
+            f"(tstamp 0f6b57bb-a5d6-4b28-a5b9-07a7dd2e2b09))\n"
+        )
+    xys = " ".join(f"(xy {coordinate(rng)} {coordinate(rng)})" for _ in range(points))
+    content += (
+        '  (zone (net 0) (net_name "") (layer "F.Cu") '
+        "(tstamp 36c1c3c2-8ea4-4e46-8d2a-4c86f3a8d8b3) (hatch edge 0.508)\n"
+        "    (connect_pads (clearance 0.508))\n"
+        "    (min_thickness 0.254) (filled_areas_thickness no)\n"
+        "    (fill yes (thermal_gap 0.508) (thermal_bridge_width 0.508))\n"
+        "    (polygon\n      (pts\n        (xy 0 0) (xy 300 0) (xy 300 300) (xy 0 300)\n"
+        "      )\n    )\n"
+        f'    (filled_polygon\n      (layer "F.Cu")\n      (pts\n        {xys}\n'
+        "      )\n    )\n  )\n)\n"
+    )
+    return content
+
+
+def main(tracks: int, points: int):
+    directory = tempfile.mkdtemp()
+    filepath = os.path.join(directory, "board.kicad_pcb")
+    with open(filepath, "w", encoding="utf-8") as outfile:
+        outfile.write(generate_board(tracks, points))
+    size = os.path.getsize(filepath)
+    print(f"Board with {tracks} tracks and {points} fill points ({size / 1e6:.2f} MB)")
+
+    for exact in (False, True):
+        board = Board.from_file(filepath, exact=exact)
+        load = min(
+            timeit.repeat(
+                lambda: Board.from_file(filepath, exact=exact), number=1, repeat=5
+            )
+        )
+        save = min(timeit.repeat(lambda: board.to_sexpr(), number=1, repeat=5))
+        print(
+            f"exact={str(exact):5s} load {load * 1000:8.2f} ms save {save * 1000:8.2f} ms"
+        )
+    os.remove(filepath)
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    arguments = [int(argument) for argument in sys.argv[1:3]]
+    main(*(arguments + [20000, 100000][len(arguments) :]))
@@ -0,0 +1,83 @@
+"""Benchmark of the S-Expression parser
+
+Compares ``kiutils.utils.sexpr.parse_sexp`` against the original groupdict based implementation
+on the board test files, checks that both produce identical output and prints the speedup.
+
+Usage (from the repository root):
+    python benchmarks/bench_sexpr.py [FILE ...]
+
+License identifier:
+    GPL-3.0
+"""
+
+import glob
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from kiutils.utils.sexpr import parse_sexp, term_regex  # noqa: E402
+
+DEFAULT_FILES = os.path.join("tests", "testdata", "board", "**", "*")
+
+
+def parse_sexp_reference(sexp):
+    """The parser as it was before the token engine rewrite, used as reference"""
+    stack = []
+    out = []
+    for termtypes in re.finditer(term_regex, sexp):
+        term, value = [(t, v) for t, v in termtypes.groupdict().items() if v][0]
+        if term == "brackl":
+            stack.append(out)
+            out = []
+        elif term == "brackr":
+            assert stack, "Trouble with nesting of brackets"
+            tmpout, out = out, stack.pop(-1)
+            out.append(tmpout)
+        elif term == "num":
+            v = float(value)
+            if v.is_integer():
+                v = int(v)
+            out.append(v)
+        elif term == "sq":
+            out.append(value[1:-1].replace(r"\"", '"'))
+        elif term == "s":
+            out.append(value)
+        else:
+            raise NotImplementedError("Error: %r %r" % (term, value))
+    assert not stack, "Trouble with nesting of brackets"
+    return out[0]
+
+
+def main(files):
+    contents = []
+    for file in files:
+        with open(file, "r", encoding="utf-8") as infile:
+            contents.append(infile.read())
+    size = sum(len(c) for c in contents)
+
+    for content in contents:
+        if repr(parse_sexp(content)) != repr(parse_sexp_reference(content)):
+            raise Exception("Parser output differs from the reference implementation")
+
+    results = {}
+    for name, parser in (
+        ("reference", parse_sexp_reference),
+        ("parse_sexp", parse_sexp),
+    ):
+        runs = timeit.repeat(lambda: [parser(c) for c in contents], number=5, repeat=7)
+        results[name] = min(runs) / 5
+        print(
+            f"{name:12s} {results[name] * 1000:8.2f} ms/pass "
+            f"{size / results[name] / 1e6:8.2f} MB/s"
+        )
+    print(f"Speedup: {results['reference'] / results['parse_sexp']:.2f}x")
+
+
+if __name__ == "__main__":
+    files = sys.argv[1:] or [
+        f for f in glob.glob(DEFAULT_FILES, recursive=True) if os.path.isfile(f)
+    ]
+    main(files)
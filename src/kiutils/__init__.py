@@ -22,7 +22,7 @@ __license__ = "GPL-3.0"
 # Main classes for easy import
 from .board import Board
 from .dru import Constraint, DesignRules, Rule
-from .footprint import Attributes, Footprint, Model, Pad
+from .footprint import Attributes, Footprint, FootprintLibrary, Model, Pad
 from .items.brditems import GeneralSettings, Segment, Target, Via
 
 # Commonly used items
@@ -47,7 +47,7 @@ from .items.schitems import (
     Text,
 )
 from .items.zones import FillSettings, KeepoutSettings, Zone
-from .libraries import Library, LibTable
+from .libraries import Library, LibraryCache, LibraryResolver, LibTable
 from .schematic import Schematic
 from .symbol import Symbol, SymbolLib, SymbolPin
 
@@ -61,6 +61,7 @@ __all__ = [
     "Board",
     "Schematic",
     "Footprint",
+    "FootprintLibrary",
     "Attributes",
     "Model",
     "Pad",
@@ -69,6 +70,8 @@ __all__ = [
     "SymbolPin",
     "Library",
     "LibTable",
+    "LibraryResolver",
+    "LibraryCache",
     "DesignRules",
     "Rule",
     "Constraint",
@@ -0,0 +1,88 @@
+"""Command line interface of kiutils to process many KiCad files at once
+
+Usage:
+    python -m kiutils {validate,reformat,stats} PATH [PATH ...] [-j WORKERS]
+
+Author:
+    (C) kiutils contributors - 2026
+
+License identifier:
+    GPL-3.0
+
+Major changes:
+    17.10.2026 - created
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from kiutils import __version__
+from kiutils.batch import OPERATIONS, find_files, process_files
+from kiutils.utils.stats import LoadStatistics
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command line interface
+
+    Args:
+        - argv (List[str], optional): Command line arguments without the program name. Defaults to
+                                      None (``sys.argv[1:]``).
+
+    Returns:
+        - int: Exit code, 0 if all files were processed successfully, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(
+        prog="kiutils",
+        description="Validate, reformat or count the items of many KiCad files in a pool of "
+        "worker processes. The loader is chosen by the file extension, directories are searched "
+        "recursively.",
+    )
+    parser.add_argument("operation", choices=OPERATIONS, help="operation to run")
+    parser.add_argument("paths", nargs="+", help="KiCad files or directories")
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of processors)",
+    )
+    parser.add_argument("--encoding", default=None, help="encoding of the files")
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="only print errors and the summary"
+    )
+    parser.add_argument("--version", action="version", version=__version__)
+    arguments = parser.parse_args(argv)
+
+    if arguments.workers is not None and arguments.workers < 1:
+        parser.error("the number of workers must be at least 1")
+
+    statistics = LoadStatistics()
+    errors = 0
+    paths = list(find_files(arguments.paths))
+    for result in process_files(
+        paths,
+        arguments.operation,
+        arguments.workers,
+        arguments.encoding,
+        statistics,
+    ):
+        if result.error is not None:
+            errors += 1
+            print(f"ERROR {result.filePath}: {result.error}", flush=True)
+        elif not arguments.quiet:
+            counts = " ".join(
+                f"{name}={count}" for name, count in result.counts.items()
+            )
+            print(
+                f"OK    {result.seconds * 1000:9.2f} ms {result.size / 1e6:8.3f} MB "
+                f"{result.filePath} {counts}".rstrip(),
+                flush=True,
+            )
+
+    print(f"{statistics.summary()}, {errors} failed")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""Batch processing of many KiCad files in a pool of worker processes
+
+Author:
+    (C) kiutils contributors - 2026
+
+License identifier:
+    GPL-3.0
+
+Major changes:
+    17.10.2026 - created
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from itertools import repeat
+from os import path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from kiutils.board import Board
+from kiutils.dru import DesignRules
+from kiutils.footprint import Footprint
+from kiutils.libraries import LibTable
+from kiutils.schematic import Schematic
+from kiutils.symbol import SymbolLib
+from kiutils.utils.aio import DEFAULT_MAX_WORKERS
+from kiutils.utils.stats import LoadStatistics
+from kiutils.wks import WorkSheet
+
+FILE_TYPES = {
+    ".kicad_pcb": Board,
+    ".kicad_sch": Schematic,
+    ".kicad_mod": Footprint,
+    ".kicad_sym": SymbolLib,
+    ".kicad_wks": WorkSheet,
+    ".kicad_dru": DesignRules,
+    "fp-lib-table": LibTable,
+    "sym-lib-table": LibTable,
+}
+"""The class used to load a file, by its extension or, for library tables, its name"""
+
+OPERATIONS = ("validate", "reformat", "stats")
+"""The operations of ``process_file()``"""
+
+
+@dataclass
+class FileResult:
+    """The ``FileResult`` token defines the outcome of processing a single file"""
+
+    filePath: str = ""
+    """The ``filePath`` token defines the path of the processed file"""
+
+    size: int = 0
+    """The ``size`` token defines the size of the file in bytes before it was processed"""
+
+    seconds: float = 0.0
+    """The ``seconds`` token defines the time spent processing the file"""
+
+    error: Optional[str] = None
+    """The ``error`` token defines the error message, if the file could not be processed"""
+
+    counts: Dict[str, int] = field(default_factory=dict)
+    """The ``counts`` token defines the number of items of every non-empty list attribute of the
+    loaded object, e.g. ``{"footprints": 12, "nets": 34}``. Only set by the ``stats``
+    operation."""
+
+
+def file_type(filepath: str) -> Optional[type]:
+    """Get the class used to load the given file
+
+    Args:
+        - filepath (str): Path of the file
+
+    Returns:
+        - type: The class (see ``FILE_TYPES``) or None, if the file is no supported KiCad file
+    """
+    name = path.basename(filepath)
+    return FILE_TYPES.get(name) or FILE_TYPES.get(path.splitext(name)[1])
+
+
+def find_files(paths: Iterable[str]) -> Iterator[str]:
+    """Find all supported KiCad files at the given paths. Directories (e.g. footprint libraries)
+    are searched recursively.
+
+    Args:
+        - paths (Iterable[str]): Paths of files or directories
+
+    Returns:
+        - Iterator[str]: Paths of the supported files, in sorted order per directory
+    """
+    for filepath in paths:
+        if path.isdir(filepath):
+            for root, directories, names in os.walk(filepath):
+                directories.sort()
+                for name in sorted(names):
+                    if file_type(name) is not None:
+                        yield path.join(root, name)
+        elif file_type(filepath) is not None:
+            yield filepath
+
+
+def process_file(
+    filepath: str, operation: str = "validate", encoding: Optional[str] = None
+) -> FileResult:
+    """Load a file and run an operation on it. Errors are returned instead of being raised, so the
+    function can process files in worker processes.
+
+    Operations:
+        - ``validate``: Load the file
+        - ``reformat``: Load the file and save it in place with ``to_file()``
+        - ``stats``: Load the file and count the items of its list attributes
+
+    Args:
+        - filepath (str): Path of the file
+        - operation (str): One of ``OPERATIONS``. Defaults to ``validate``.
+        - encoding (str, optional): Encoding of the file. Defaults to None (platform dependent
+                                    encoding).
+
+    Returns:
+        - FileResult: Size of the file, time spent and error or item counts
+    """
+    result = FileResult(filePath=filepath)
+    start = time.perf_counter()
+    try:
+        result.size = path.getsize(filepath)
+        cls = file_type(filepath)
+        if cls is None:
+            raise Exception("Unsupported file type")
+        item = cls.from_file(filepath, encoding)
+        if operation == "reformat":
+            if encoding is None:
+                item.to_file(filepath)
+            else:
+                item.to_file(filepath, encoding)
+        elif operation == "stats":
+            for itemField in fields(item):
+                value = getattr(item, itemField.name)
+                if isinstance(value, list) and value:
+                    result.counts[itemField.name] = len(value)
+        elif operation != "validate":
+            raise Exception(f"Unknown operation {operation}")
+    except Exception as exception:
+        result.error = f"{type(exception).__name__}: {exception}"
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def process_files(
+    paths: List[str],
+    operation: str = "validate",
+    workers: Optional[int] = None,
+    encoding: Optional[str] = None,
+    statistics: Optional[LoadStatistics] = None,
+) -> Iterator[FileResult]:
+    """Process the given files in a pool of worker processes (see ``process_file()``). The results
+    are yielded in the order of the files as soon as they are available.
+
+    Args:
+        - paths (List[str]): Paths of the files
+        - operation (str): One of ``OPERATIONS``. Defaults to ``validate``.
+        - workers (int, optional): Number of worker processes. Defaults to None (number of
+                                   processors). With one worker, the files are processed in this
+                                   process.
+        - encoding (str, optional): Encoding of the files. Defaults to None (platform dependent
+                                    encoding).
+        - statistics (LoadStatistics, optional): Statistics that the number of files, bytes and
+                                                 the wall-clock time are added to. Defaults to
+                                                 None.
+
+    Returns:
+        - Iterator[FileResult]: The result of every file
+    """
+    start = time.perf_counter()
+    arguments = (paths, repeat(operation), repeat(encoding))
+    files = 0
+    size = 0
+    if workers == 1:
+        pool = None
+        results = map(process_file, *arguments)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        chunksize = max(1, len(paths) // (16 * (workers or os.cpu_count() or 1)))
+        results = pool.map(process_file, *arguments, chunksize=chunksize)
+    try:
+        for result in results:
+            files += 1
+            size += result.size
+            yield result
+    finally:
+        if pool is not None:
+            # Do not start files that are still queued when the caller stops early
+            if sys.version_info >= (3, 9):
+                pool.shutdown(cancel_futures=True)
+            else:
+                pool.shutdown()
+        if statistics is not None:
+            statistics.add(files, size, time.perf_counter() - start)
+
+
+async def aload_files(
+    paths: List[str],
+    limit: int = DEFAULT_MAX_WORKERS,
+    encoding: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    return_exceptions: bool = False,
+) -> list:
+    """Load the given files without blocking the event loop, at most ``limit`` of them at once
+    (see ``AsyncFile.afrom_file()``). The class of every file is chosen by ``file_type()``.
+
+    If the awaiting task is cancelled or a file fails to load and ``return_exceptions`` is False,
+    all files that are still loading are cancelled.
+
+    Args:
+        - paths (List[str]): Paths of the files
+        - limit (int): Maximum number of files loaded at once. Defaults to
+                       ``kiutils.utils.aio.DEFAULT_MAX_WORKERS``.
+        - encoding (str, optional): Encoding of the files. Defaults to None (platform dependent
+                                    encoding).
+        - executor (Executor, optional): Thread pool to load the files in. Defaults to None
+                                         (``kiutils.utils.aio.default_executor()``).
+        - return_exceptions (bool): Return the exceptions of files that failed instead of
+                                    raising the first one. Defaults to False.
+
+    Raises:
+        - Exception: If a file has an unsupported type or could not be loaded, unless
+                     ``return_exceptions`` is True
+
+    Returns:
+        - list: The loaded objects (or exceptions), in the order of the files
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def load(filepath: str):
+        cls = file_type(filepath)
+        if cls is None:
+            raise Exception(f"Unsupported file type of {filepath}")
+        async with semaphore:
+            return await cls.afrom_file(filepath, encoding, executor=executor)
+
+    tasks = [asyncio.ensure_future(load(filepath)) for filepath in paths]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
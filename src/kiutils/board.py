@@ -17,7 +17,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from os import path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, ClassVar, Dict, Iterable, List, Optional, Tuple, Union
 
 from kiutils.footprint import Footprint
 from kiutils.items.brditems import (
@@ -27,6 +27,7 @@ from kiutils.items.brditems import (
     Segment,
     SetupData,
     Target,
+    TraceTable,
     Via,
 )
 from kiutils.items.common import Group, Image, Net, PageSettings, TitleBlock
@@ -47,11 +48,26 @@ from kiutils.misc.config import (
     KIUTILS_CREATE_NEW_VERSION_STR,
 )
 from kiutils.utils import sexpr
+from kiutils.utils.aio import AsyncFile
+from kiutils.utils.construct import fill_defaults, new_object
+from kiutils.utils.dispatch import TokenDispatch, TokenHandler
+from kiutils.utils.flyweight import FlyweightPool, pool_of, sharing
+from kiutils.utils.lazy import (
+    LazyList,
+    SourceForms,
+    pending,
+    source_text,
+    split_forms,
+)
 from kiutils.utils.strings import dequote
+from kiutils.utils.writer import SexprWritable, stream_writer
+
+if TYPE_CHECKING:
+    from kiutils.utils.cache import ParseCache
 
 
 @dataclass
-class Board:
+class Board(SexprWritable, AsyncFile, TokenDispatch):
     """The ``board`` token defines a KiCad layout according to the board file format used in
     ``.kicad_pcb`` files.
 
@@ -97,7 +113,8 @@ class Board:
     The ``Image`` token is supported since KiCad v7 and must be added into this list when used."""
 
     traceItems: List = field(default_factory=list)
-    """The ``traceItems`` token defines a list of segments, arcs and vias used in the layout"""
+    """The ``traceItems`` token defines a list of segments, arcs and vias used in the layout. Boards
+    loaded with ``columnar=True`` hold a ``TraceTable`` instead."""
 
     zones: List[Zone] = field(default_factory=list)
     """The ``zones`` token defines a list of zones used in the layout"""
@@ -115,6 +132,93 @@ class Board:
     """The ``filePath`` token defines the path-like string to the board file. Automatically set when
     ``self.from_file()`` is used. Allows the use of ``self.to_file()`` without parameters."""
 
+    tokenHandlers: ClassVar[Dict[str, TokenHandler]] = {
+        "version": lambda object, item: setattr(object, "version", item[1]),
+        "generator": lambda object, item: setattr(object, "generator", item[1]),
+        "general": lambda object, item: setattr(
+            object, "general", GeneralSettings.from_sexpr(item)
+        ),
+        "paper": lambda object, item: setattr(
+            object, "paper", PageSettings.from_sexpr(item)
+        ),
+        "title_block": lambda object, item: setattr(
+            object, "titleBlock", TitleBlock.from_sexpr(item)
+        ),
+        "layers": lambda object, item: object.layers.extend(
+            LayerToken.from_sexpr(layer) for layer in item[1:]
+        ),
+        "setup": lambda object, item: setattr(
+            object, "setup", SetupData.from_sexpr(item)
+        ),
+        "property": lambda object, item: object.properties.update({item[1]: item[2]}),
+        "net": lambda object, item: object.nets.append(Net.from_sexpr(item)),
+        "footprint": lambda object, item: object.footprints.append(
+            Footprint.from_sexpr(item)
+        ),
+        "gr_text": lambda object, item: object.graphicItems.append(
+            GrText.from_sexpr(item)
+        ),
+        "gr_text_box": lambda object, item: object.graphicItems.append(
+            GrTextBox.from_sexpr(item)
+        ),
+        "gr_line": lambda object, item: object.graphicItems.append(
+            GrLine.from_sexpr(item)
+        ),
+        "gr_rect": lambda object, item: object.graphicItems.append(
+            GrRect.from_sexpr(item)
+        ),
+        "gr_circle": lambda object, item: object.graphicItems.append(
+            GrCircle.from_sexpr(item)
+        ),
+        "gr_arc": lambda object, item: object.graphicItems.append(
+            GrArc.from_sexpr(item)
+        ),
+        "gr_poly": lambda object, item: object.graphicItems.append(
+            GrPoly.from_sexpr(item)
+        ),
+        "gr_curve": lambda object, item: object.graphicItems.append(
+            GrCurve.from_sexpr(item)
+        ),
+        "image": lambda object, item: object.graphicItems.append(
+            Image.from_sexpr(item)
+        ),
+        "dimension": lambda object, item: object.dimensions.append(
+            Dimension.from_sexpr(item)
+        ),
+        "target": lambda object, item: object.targets.append(Target.from_sexpr(item)),
+        "segment": lambda object, item: object.traceItems.append(
+            Segment.from_sexpr(item)
+        ),
+        "arc": lambda object, item: object.traceItems.append(Arc.from_sexpr(item)),
+        "via": lambda object, item: object.traceItems.append(Via.from_sexpr(item)),
+        "zone": lambda object, item: object.zones.append(Zone.from_sexpr(item)),
+        "group": lambda object, item: object.groups.append(Group.from_sexpr(item)),
+    }
+    """The ``tokenHandlers`` token defines the handler of every known token of the items
+    of ``(kicad_pcb ...)`` (see ``kiutils.utils.dispatch.TokenDispatch``)"""
+
+    parallelTokens: ClassVar[Tuple[str, ...]] = (
+        "footprint",
+        "gr_text",
+        "gr_text_box",
+        "gr_line",
+        "gr_rect",
+        "gr_circle",
+        "gr_arc",
+        "gr_poly",
+        "gr_curve",
+        "image",
+        "dimension",
+        "target",
+        "segment",
+        "arc",
+        "via",
+        "zone",
+        "group",
+    )
+    """The ``parallelTokens`` token defines the tokens of the items that are converted in worker
+    processes when a board is loaded using ``self.from_file(workers=N)``"""
+
     @classmethod
     def from_sexpr(cls, exp: list) -> Board:
         """Convert the given S-Expresstion into a Board object
@@ -132,69 +236,50 @@ class Board:
         if not isinstance(exp, list):
             raise Exception("Expression does not have the correct type")
 
-        if exp[0] != "kicad_pcb":
+        return cls.from_forms(exp)
+
+    @classmethod
+    def from_forms(cls, forms: Iterable) -> Board:
+        """Convert the items of a ``(kicad_pcb ...)`` expression into a Board object. The items are
+        consumed one by one, so they may be supplied by a generator like ``sexpr.iterforms()``
+        without ever building the whole parsed S-Expression.
+
+        Args:
+            - forms (Iterable): Items of the parsed S-Expression ``(kicad_pcb ...)``, starting with
+                                the ``kicad_pcb`` token itself
+
+        Raises:
+            - Exception: When the first item is not kicad_pcb
+
+        Returns:
+            - Board: Object of the class initialized with the given items
+        """
+        forms = iter(forms)
+        if next(forms, None) != "kicad_pcb":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
-        for item in exp:
-            if item[0] == "version":
-                object.version = item[1]
-            if item[0] == "generator":
-                object.generator = item[1]
-            if item[0] == "general":
-                object.general = GeneralSettings().from_sexpr(item)
-            if item[0] == "paper":
-                object.paper = PageSettings().from_sexpr(item)
-            if item[0] == "title_block":
-                object.titleBlock = TitleBlock().from_sexpr(item)
-            if item[0] == "layers":
-                for layer in item[1:]:
-                    object.layers.append(LayerToken().from_sexpr(layer))
-            if item[0] == "setup":
-                object.setup = SetupData().from_sexpr(item)
-            if item[0] == "property":
-                object.properties.update({item[1]: item[2]})
-            if item[0] == "net":
-                object.nets.append(Net().from_sexpr(item))
-            if item[0] == "footprint":
-                object.footprints.append(Footprint().from_sexpr(item))
-            if item[0] == "gr_text":
-                object.graphicItems.append(GrText().from_sexpr(item))
-            if item[0] == "gr_text_box":
-                object.graphicItems.append(GrTextBox().from_sexpr(item))
-            if item[0] == "gr_line":
-                object.graphicItems.append(GrLine().from_sexpr(item))
-            if item[0] == "gr_rect":
-                object.graphicItems.append(GrRect().from_sexpr(item))
-            if item[0] == "gr_circle":
-                object.graphicItems.append(GrCircle().from_sexpr(item))
-            if item[0] == "gr_arc":
-                object.graphicItems.append(GrArc().from_sexpr(item))
-            if item[0] == "gr_poly":
-                object.graphicItems.append(GrPoly().from_sexpr(item))
-            if item[0] == "gr_curve":
-                object.graphicItems.append(GrCurve().from_sexpr(item))
-            if item[0] == "image":
-                object.graphicItems.append(Image().from_sexpr(item))
-            if item[0] == "dimension":
-                object.dimensions.append(Dimension().from_sexpr(item))
-            if item[0] == "target":
-                object.targets.append(Target().from_sexpr(item))
-            if item[0] == "segment":
-                object.traceItems.append(Segment().from_sexpr(item))
-            if item[0] == "arc":
-                object.traceItems.append(Arc().from_sexpr(item))
-            if item[0] == "via":
-                object.traceItems.append(Via().from_sexpr(item))
-            if item[0] == "zone":
-                object.zones.append(Zone().from_sexpr(item))
-            if item[0] == "group":
-                object.groups.append(Group().from_sexpr(item))
-
-        return object
+        object = new_object(cls)
+        handlers = cls.tokenHandlers
+        for item in forms:
+            handler = handlers.get(item[0])
+            if handler is not None:
+                handler(object, item)
+
+        return fill_defaults(object)
 
     @classmethod
-    def from_file(cls, filepath: str, encoding: Optional[str] = None) -> Board:
+    def from_file(
+        cls,
+        filepath: str,
+        encoding: Optional[str] = None,
+        mmap: bool = False,
+        lazy: bool = False,
+        exact: bool = False,
+        workers: int = 1,
+        cache: Union[bool, ParseCache] = False,
+        share: Union[bool, FlyweightPool] = False,
+        columnar: bool = False,
+    ) -> Board:
         """Load a board directly from a KiCad board file (`.kicad_pcb`) and sets the
         ``self.filePath`` attribute to the given file path.
 
@@ -202,9 +287,49 @@ class Board:
             - filepath (str): Path or path-like object that points to the file
             - encoding (str, optional): Encoding of the input file. Defaults to None (platform
                                         dependent encoding).
+            - mmap (bool): Memory-map the file and parse its bytes in place instead of reading it
+                           as text. The file is decoded using ``encoding`` or UTF-8 if not
+                           given. Defaults to False.
+            - lazy (bool): Keep the footprints, trace items and zones as source text and build
+                           their objects when ``self.footprints``, ``self.traceItems`` or
+                           ``self.zones`` is accessed for the first time. ``self.to_file()``
+                           writes lists that were never accessed and all objects that were not
+                           changed back verbatim. The file is decoded using ``encoding`` or UTF-8
+                           if not given. Defaults to False.
+            - exact (bool): Keep numbers as ``sexpr.Number`` objects holding their original
+                            text, so that values that are not changed are written back exactly
+                            as they were read. Defaults to False.
+            - workers (int): Number of processes used to convert the footprints, graphical items,
+                             trace items, zones and groups (see ``self.parallelTokens``). The
+                             result is equal to loading the board in a single process. The file
+                             is decoded using ``encoding`` or UTF-8 if not given. Defaults to 1.
+            - cache (Union[bool, ParseCache]): Reuse the object stored for the file in the given
+                                               cache (``kiutils.utils.cache.default_cache`` if
+                                               True) as long as the file is unchanged, or store
+                                               the loaded object there. Defaults to False.
+            - share (Union[bool, FlyweightPool]): Share equal strokes, text effects, 3D models
+                                                  and the positions of footprint graphics and
+                                                  pads and pad drills between the items of the
+                                                  board and its footprints, or with all objects
+                                                  of the given pool (see
+                                                  ``kiutils.utils.flyweight``). Shared objects
+                                                  cannot be changed, assigning their fields
+                                                  raises ``SharedObjectError``. Replace them
+                                                  before changing them, e.g.
+                                                  ``writable(item, "stroke").width = 0.2``. Not
+                                                  applied to lists loaded lazily or by worker
+                                                  processes. Defaults to False.
+            - columnar (bool): Parse the segments, arcs and vias straight into the columns of a
+                               ``TraceTable`` without building an object per item.
+                               ``self.traceItems`` is the table, which returns views that
+                               read and write the columns when items are accessed. Defaults to
+                               False.
 
         Raises:
             - Exception: If the given path is not a file
+            - Exception: If ``lazy`` is combined with more than one worker
+            - Exception: If ``columnar`` is combined with ``lazy``, ``exact`` or more than one
+                         worker
 
         Returns:
             - Footprint: Object of the Schematic class initialized with the given KiCad schematic
@@ -212,10 +337,85 @@ class Board:
         if not path.isfile(filepath):
             raise Exception("Given path is not a file!")
 
-        with open(filepath, "r", encoding=encoding) as infile:
-            item = cls.from_sexpr(sexpr.parse_sexp(infile.read()))
-            item.filePath = filepath
-            return item
+        if cache:
+            from kiutils.utils.cache import load_cached
+
+            return load_cached(
+                cache,
+                cls,
+                filepath,
+                lambda: cls.from_file(
+                    filepath,
+                    encoding,
+                    mmap,
+                    lazy,
+                    exact,
+                    workers,
+                    share=share,
+                    columnar=columnar,
+                ),
+                encoding=encoding,
+                lazy=lazy,
+                exact=exact,
+                share=bool(share),
+                columnar=columnar,
+            )
+
+        if lazy and workers > 1:
+            raise Exception("Lazy loading cannot be combined with multiple workers")
+        if columnar and (lazy or exact or workers > 1):
+            raise Exception(
+                "Columnar trace items cannot be combined with lazy loading, exact numbers or "
+                "multiple workers"
+            )
+        traceTable = TraceTable() if columnar else None
+
+        def forms(source):
+            return traceTable.collect(source) if columnar else source
+
+        with sharing(pool_of(share), exact):
+            if workers > 1:
+                from kiutils.utils.parallel import load_parallel
+
+                item = load_parallel(
+                    cls,
+                    filepath,
+                    encoding or "utf-8",
+                    cls.parallelTokens,
+                    workers,
+                    exact,
+                )
+            elif lazy:
+                with open(filepath, "rb") as infile:
+                    data = infile.read()
+                encoding = encoding or "utf-8"
+                sections = {
+                    "footprints": SourceForms(
+                        data, encoding, {"footprint": Footprint}, exact=exact
+                    ),
+                    "traceItems": SourceForms(
+                        data,
+                        encoding,
+                        {"segment": Segment, "arc": Arc, "via": Via},
+                        exact=exact,
+                    ),
+                    "zones": SourceForms(data, encoding, {"zone": Zone}, exact=exact),
+                }
+                item = cls.from_forms(split_forms(data, encoding, sections, exact))
+                for name, section in sections.items():
+                    setattr(item, name, section)
+            elif mmap:
+                with sexpr.mapped_file(filepath) as data:
+                    item = cls.from_forms(
+                        forms(sexpr.iterforms(data, encoding or "utf-8", exact))
+                    )
+            else:
+                with open(filepath, "r", encoding=encoding) as infile:
+                    item = cls.from_forms(forms(sexpr.iterforms(infile, exact=exact)))
+        if columnar:
+            item.traceItems = traceTable
+        item.filePath = filepath
+        return item
 
     @classmethod
     def create_new(cls) -> Board:
@@ -307,86 +507,140 @@ class Board:
             filepath = self.filePath
 
         with open(filepath, "w", encoding=encoding) as outfile:
-            outfile.write(self.to_sexpr())
+            self.write_sexpr(outfile)
 
-    def to_sexpr(self, indent=0, newline=True) -> str:
-        """Generate the S-Expression representing this object
+    def write_sexpr(self, stream, indent=0, newline=True):
+        """Write the S-Expression representing this object to the given stream
 
         Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
             - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
+        write = stream_writer(stream)
         indents = " " * indent
         endline = "\n" if newline else ""
 
         addNewLine = False
 
-        expression = f"{indents}(kicad_pcb (version {self.version}) (generator {self.generator})\n\n"
-        expression += self.general.to_sexpr(indent + 2) + "\n"
-        expression += self.paper.to_sexpr(indent + 2)
+        write(
+            f"{indents}(kicad_pcb (version {self.version}) (generator {self.generator})\n\n"
+        )
+        self.general.write_sexpr(stream, indent + 2)
+        write("\n")
+        self.paper.write_sexpr(stream, indent + 2)
         if self.titleBlock is not None:
-            expression += self.titleBlock.to_sexpr(indent + 2) + "\n"
-        expression += f"{indents}  (layers\n"
+            self.titleBlock.write_sexpr(stream, indent + 2)
+            write("\n")
+        write(f"{indents}  (layers\n")
         for layer in self.layers:
-            expression += layer.to_sexpr(indent + 4)
-        expression += f"{indents}  )\n\n"
-        expression += self.setup.to_sexpr(indent + 2) + "\n"
+            layer.write_sexpr(stream, indent + 4)
+        write(f"{indents}  )\n\n")
+        self.setup.write_sexpr(stream, indent + 2)
+        write("\n")
         # Properties, if any
         if len(self.properties) > 0:
             for key, value in self.properties.items():
-                expression += f'  (property "{dequote(key)}" "{dequote(value)}")\n'
-            expression += "\n"
+                write(f'  (property "{dequote(key)}" "{dequote(value)}")\n')
+            write("\n")
 
         # Nets
         if len(self.nets) > 0:
             for net in self.nets:
-                expression += net.to_sexpr(indent=indent + 2, newline=True)
-            expression += "\n"
+                net.write_sexpr(stream, indent=indent + 2, newline=True)
+            write("\n")
 
         # Footprints
-        for footprint in self.footprints:
-            expression += footprint.to_sexpr(indent + 2, layerInFirstLine=True) + "\n"
+        footprints = pending(self, "footprints")
+        if footprints is not None:
+            footprints.write_sexpr(stream, indent + 2, separator="\n")
+        else:
+            for footprint in self.footprints:
+                text = source_text(self.footprints, footprint, indent + 2)
+                if text is None:
+                    footprint.write_sexpr(stream, indent + 2, layerInFirstLine=True)
+                else:
+                    write(text)
+                write("\n")
 
         # Lines, Texts, Arcs and other graphical items
         if len(self.graphicItems) > 0:
             addNewLine = True
             for item in self.graphicItems:
                 if isinstance(item, GrPoly):
-                    expression += item.to_sexpr(indent + 2, pts_newline=True)
+                    item.write_sexpr(stream, indent + 2, pts_newline=True)
                 else:
-                    expression += item.to_sexpr(indent + 2)
+                    item.write_sexpr(stream, indent + 2)
 
         # Dimensions
         if len(self.dimensions) > 0:
             addNewLine = True
             for dimension in self.dimensions:
-                expression += dimension.to_sexpr(indent + 2)
+                dimension.write_sexpr(stream, indent + 2)
 
         # Target markers:
         if len(self.targets) > 0:
             addNewLine = True
             for target in self.targets:
-                expression += target.to_sexpr(indent + 2)
+                target.write_sexpr(stream, indent + 2)
 
         if addNewLine:
-            expression += "\n"
+            write("\n")
 
         # Segments, vias and arcs
-        if len(self.traceItems) > 0:
+        traceItems = pending(self, "traceItems")
+        if traceItems is not None:
+            if len(traceItems) > 0:
+                traceItems.write_sexpr(stream, indent + 2)
+                write("\n")
+        elif isinstance(self.traceItems, TraceTable):
+            if len(self.traceItems) > 0:
+                self.traceItems.write_sexpr(stream, indent + 2)
+                write("\n")
+        elif len(self.traceItems) > 0:
             for item in self.traceItems:
-                expression += item.to_sexpr(indent + 2)
-            expression += "\n"
+                text = source_text(self.traceItems, item, indent + 2)
+                if text is None:
+                    item.write_sexpr(stream, indent + 2)
+                else:
+                    write(text)
+            write("\n")
 
         # Zones
-        for zone in self.zones:
-            expression += zone.to_sexpr(indent + 2)
+        zones = pending(self, "zones")
+        if zones is not None:
+            zones.write_sexpr(stream, indent + 2)
+        else:
+            for zone in self.zones:
+                text = source_text(self.zones, zone, indent + 2)
+                if text is None:
+                    zone.write_sexpr(stream, indent + 2)
+                else:
+                    write(text)
 
         # Groups
         for group in self.groups:
-            expression += group.to_sexpr(indent + 2)
+            group.write_sexpr(stream, indent + 2)
+
+        write(f"{indents}){endline}")
+
+    def to_sexpr(self, indent=0, newline=True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buffer = []
+        self.write_sexpr(buffer, indent=indent, newline=newline)
+        return "".join(buffer)
+
 
-        expression += f"{indents}){endline}"
-        return expression
+# Footprints, trace items and zones of boards loaded with ``Board.from_file(lazy=True)`` are built
+# when they are accessed for the first time
+Board.footprints = LazyList("footprints")
+Board.traceItems = LazyList("traceItems")
+Board.zones = LazyList("zones")
@@ -16,15 +16,21 @@ Documentation taken from:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from itertools import chain
 from os import path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from kiutils.utils import sexpr
+from kiutils.utils.aio import AsyncFile
 from kiutils.utils.strings import dequote
+from kiutils.utils.writer import SexprWritable, stream_writer
+
+if TYPE_CHECKING:
+    from kiutils.utils.cache import ParseCache
 
 
 @dataclass
-class Constraint:
+class Constraint(SexprWritable):
     """The ``Constraint`` token defines a design rule's constraint"""
 
     type: str = "clearance"
@@ -125,7 +131,7 @@ class Constraint:
 
 
 @dataclass
-class Rule:
+class Rule(SexprWritable):
     """The ``Rule`` token defines a custom design rule"""
 
     name: str = ""
@@ -172,7 +178,7 @@ class Rule:
         object.name = exp[1]
         for item in exp[2:]:
             if item[0] == "constraint":
-                object.constraints.append(Constraint().from_sexpr(item))
+                object.constraints.append(Constraint.from_sexpr(item))
             if item[0] == "condition":
                 object.condition = item[1]
             if item[0] == "layer":
@@ -205,7 +211,7 @@ class Rule:
 
 
 @dataclass
-class DesignRules:
+class DesignRules(SexprWritable, AsyncFile):
     """The ``DesignRules`` token defines a set of custom design rules (`.kicad_dru` files)"""
 
     version: int = 1
@@ -246,11 +252,16 @@ class DesignRules:
             if item[0] == "version":
                 object.version = item[1]
             if item[0] == "rule":
-                object.rules.append(Rule().from_sexpr(item))
+                object.rules.append(Rule.from_sexpr(item))
         return object
 
     @classmethod
-    def from_file(cls, filepath: str, encoding: Optional[str] = None) -> DesignRules:
+    def from_file(
+        cls,
+        filepath: str,
+        encoding: Optional[str] = None,
+        cache: Union[bool, ParseCache] = False,
+    ) -> DesignRules:
         """Load a custom design rules set directly from a KiCad design rules file (`.kicad_dru`) and
         sets the ``self.filePath`` attribute to the given file path.
 
@@ -258,6 +269,10 @@ class DesignRules:
             - filepath (str): Path or path-like object that points to the file
             - encoding (str, optional): Encoding of the input file. Defaults to None (platform
                                         dependent encoding).
+            - cache (Union[bool, ParseCache]): Reuse the object stored for the file in the given
+                                               cache (``kiutils.utils.cache.default_cache`` if
+                                               True) as long as the file is unchanged, or store
+                                               the loaded object there. Defaults to False.
         Raises:
             - Exception: If the given path is not a file
 
@@ -267,10 +282,21 @@ class DesignRules:
         if not path.isfile(filepath):
             raise Exception("Given path is not a file!")
 
+        if cache:
+            from kiutils.utils.cache import load_cached
+
+            return load_cached(
+                cache,
+                cls,
+                filepath,
+                lambda: cls.from_file(filepath, encoding),
+                encoding=encoding,
+            )
+
         with open(filepath, "r", encoding=encoding) as infile:
             # This dirty fix adds opening and closing brackets `(..)` to the read input to enable
             # the S-Expression parser to work for the DRU-format as well.
-            data = f"({infile.read()})"
+            data = chain(["("], sexpr.file_chunks(infile), [")"])
             item = cls.from_sexpr(sexpr.parse_sexp(data))
             item.filePath = filepath
             return item
@@ -302,26 +328,40 @@ class DesignRules:
             filepath = self.filePath
 
         with open(filepath, "w", encoding=encoding) as outfile:
-            outfile.write(self.to_sexpr())
+            self.write_sexpr(outfile)
 
-    def to_sexpr(self, indent=0, newline=False):
-        """Generate the S-Expression representing this object
+    def write_sexpr(self, stream, indent=0, newline=False):
+        """Write the S-Expression representing this object to the given stream
 
         Args:
+            stream: Text stream (e.g. an opened file) or ``list`` buffer
             indent (int, optional): Number of whitespaces used to indent the output. Defaults to 0.
             newline (bool, optional): Adds a newline to the end of the output. Defaults to False.
-
-        Returns:
-            str: S-Expression of this object
         """
+        write = stream_writer(stream)
         indents = " " * indent
         endline = "\n" if newline else ""
 
-        expression = f"{indents}(version {self.version})\n"
+        write(f"{indents}(version {self.version})\n")
 
         if len(self.rules):
-            expression += f"{indents}\n"
+            write(f"{indents}\n")
             for rule in self.rules:
-                expression += f"{indents}{rule.to_sexpr(indent=indent)}"
+                write(indents)
+                rule.write_sexpr(stream, indent=indent)
 
-        return expression + endline
+        write(endline)
+
+    def to_sexpr(self, indent=0, newline=False):
+        """Generate the S-Expression representing this object
+
+        Args:
+            indent (int, optional): Number of whitespaces used to indent the output. Defaults to 0.
+            newline (bool, optional): Adds a newline to the end of the output. Defaults to False.
+
+        Returns:
+            str: S-Expression of this object
+        """
+        buffer = []
+        self.write_sexpr(buffer, indent=indent, newline=newline)
+        return "".join(buffer)
@@ -17,10 +17,14 @@ from __future__ import annotations
 
 import calendar
 import datetime
+import os
 import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from itertools import repeat
 from os import path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Optional, Union
 
 from kiutils.items.common import Coordinate, Effects, Font, Group, Image, Net, Position
 from kiutils.items.fpitems import (
@@ -46,11 +50,26 @@ from kiutils.items.gritems import (
 from kiutils.items.zones import Zone
 from kiutils.misc.config import KIUTILS_CREATE_NEW_VERSION_STR
 from kiutils.utils import sexpr
+from kiutils.utils.aio import AsyncFile
+from kiutils.utils.construct import fill_defaults, new_object
+from kiutils.utils.dispatch import TokenDispatch, TokenHandler
+from kiutils.utils.flyweight import (
+    FlyweightPool,
+    pool_of,
+    shareable,
+    shared,
+    sharing,
+)
+from kiutils.utils.stats import LoadStatistics
 from kiutils.utils.strings import dequote, remove_prefix
+from kiutils.utils.writer import SexprWritable, stream_writer
+
+if TYPE_CHECKING:
+    from kiutils.utils.cache import ParseCache
 
 
 @dataclass
-class Attributes:
+class Attributes(SexprWritable):
     """The ``attr`` token defines the list of attributes of a footprint.
 
     Documentation:
@@ -162,7 +181,7 @@ class Attributes:
 
 
 @dataclass
-class Model:
+class Model(SexprWritable):
     """The ``model`` token defines the 3D model associated with a footprint.
 
     Documentation:
@@ -188,6 +207,7 @@ class Model:
     """The optional opacity token specifies the opacity of the 3D model on a scale between 1.0 and 0.0."""
 
     @classmethod
+    @shareable
     def from_sexpr(cls, exp: list) -> Model:
         """Convert the given S-Expresstion into a Model object
 
@@ -207,7 +227,7 @@ class Model:
         if exp[0] != "model":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.path = exp[1]
 
         if exp[2] == "hide":
@@ -222,7 +242,7 @@ class Model:
                 object.scale = Coordinate.from_sexpr(e[1])
             elif e[0] == "rotate":
                 object.rotate = Coordinate.from_sexpr(e[1])
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -249,7 +269,7 @@ class Model:
 
 
 @dataclass
-class DrillDefinition:
+class DrillDefinition(SexprWritable):
     """The ``drill`` token defines the drill attributes for a footprint pad.
 
     Documentation:
@@ -304,7 +324,7 @@ class DrillDefinition:
             if not isinstance(item, list):
                 continue
             if item[0] == "offset":
-                object.offset = Position().from_sexpr(item)
+                object.offset = Position.from_sexpr(item)
         return object
 
     def to_sexpr(self, indent: int = 0, newline: bool = False) -> str:
@@ -332,7 +352,7 @@ class DrillDefinition:
 
 
 @dataclass
-class PadOptions:
+class PadOptions(SexprWritable):
     """The ``options`` token attributes define the settings used for custom pads. This token is
     only used when a custom pad is defined.
 
@@ -393,7 +413,7 @@ class PadOptions:
 
 
 @dataclass
-class Pad:
+class Pad(SexprWritable):
     """The ``pad`` token defines a pad in a footprint definition.
 
     Documentation:
@@ -541,7 +561,7 @@ class Pad:
         if exp[0] != "pad":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.number = exp[1]
         object.type = exp[2]
         object.shape = exp[3]
@@ -552,11 +572,11 @@ class Pad:
                     object.locked = True
 
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = shared(Position, item)
             if item[0] == "size":
-                object.size = Position().from_sexpr(item)
+                object.size = shared(Position, item)
             if item[0] == "drill":
-                object.drill = DrillDefinition().from_sexpr(item)
+                object.drill = shared(DrillDefinition, item)
             if item[0] == "layers":
                 for layer in item[1:]:
                     object.layers.append(layer)
@@ -574,7 +594,7 @@ class Pad:
                 for chamfer in item[1:]:
                     object.chamfer.append(chamfer)
             if item[0] == "net":
-                object.net = Net().from_sexpr(item)
+                object.net = Net.from_sexpr(item)
             if item[0] == "tstamp":
                 object.tstamp = item[1]
             if item[0] == "pinfunction":
@@ -598,57 +618,46 @@ class Pad:
             if item[0] == "thermal_gap":
                 object.thermalGap = item[1]
             if item[0] == "options":
-                object.customPadOptions = PadOptions().from_sexpr(item)
+                object.customPadOptions = PadOptions.from_sexpr(item)
             if item[0] == "primitives":
                 for primitive in item[1:]:
                     if primitive[0] == "gr_text":
-                        object.customPadPrimitives.append(
-                            GrText().from_sexpr(primitive)
-                        )
+                        object.customPadPrimitives.append(GrText.from_sexpr(primitive))
                     if primitive[0] == "gr_text_box":
                         object.customPadPrimitives.append(
-                            GrTextBox().from_sexpr(primitive)
+                            GrTextBox.from_sexpr(primitive)
                         )
                     if primitive[0] == "gr_line":
-                        object.customPadPrimitives.append(
-                            GrLine().from_sexpr(primitive)
-                        )
+                        object.customPadPrimitives.append(GrLine.from_sexpr(primitive))
                     if primitive[0] == "gr_rect":
-                        object.customPadPrimitives.append(
-                            GrRect().from_sexpr(primitive)
-                        )
+                        object.customPadPrimitives.append(GrRect.from_sexpr(primitive))
                     if primitive[0] == "gr_circle":
                         object.customPadPrimitives.append(
-                            GrCircle().from_sexpr(primitive)
+                            GrCircle.from_sexpr(primitive)
                         )
                     if primitive[0] == "gr_arc":
-                        object.customPadPrimitives.append(GrArc().from_sexpr(primitive))
+                        object.customPadPrimitives.append(GrArc.from_sexpr(primitive))
                     if primitive[0] == "gr_poly":
-                        object.customPadPrimitives.append(
-                            GrPoly().from_sexpr(primitive)
-                        )
+                        object.customPadPrimitives.append(GrPoly.from_sexpr(primitive))
                     if primitive[0] == "gr_curve":
-                        object.customPadPrimitives.append(
-                            GrCurve().from_sexpr(primitive)
-                        )
+                        object.customPadPrimitives.append(GrCurve.from_sexpr(primitive))
 
                     # XXX: Are dimentions even implemented here?
                     if primitive[0] == "dimension":
                         raise NotImplementedError(
                             "Dimensions are not yet handled! Please report this bug along with the file being parsed."
                         )
-        return object
+        return fill_defaults(object)
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object
+    def write_sexpr(self, stream, indent: int = 2, newline: bool = True):
+        """Write the S-Expression representing this object to the given stream
 
         Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
+        write = stream_writer(stream)
         indents = " " * indent
         endline = "\n" if newline else ""
         champferFound, marginFound, schematicSymbolAssociated = False, False, False
@@ -734,42 +743,142 @@ class Pad:
             marginFound = True
             tg = f" (thermal_gap {self.thermalGap})"
 
-        expression = f'{indents}(pad "{dequote(str(self.number))}" {self.type} {self.shape}{locked} {position} (size {self.size.X} {self.size.Y}){drill}{ppty}{layers}{rul}{kel}{rrr}'
+        write(
+            f'{indents}(pad "{dequote(str(self.number))}" {self.type} {self.shape}{locked} {position} (size {self.size.X} {self.size.Y}){drill}{ppty}{layers}{rul}{kel}{rrr}'
+        )
         if champferFound:
             # Only one whitespace here as all temporary strings have at least one leading whitespace
-            expression += f"\n{indents} {cr}{c}"
+            write(f"\n{indents} {cr}{c}")
 
         if self.dieLength is not None:
-            expression += f"\n{indents}  (die_length {self.dieLength})"
+            write(f"\n{indents}  (die_length {self.dieLength})")
 
         if marginFound or schematicSymbolAssociated:
             # Only one whitespace here as all temporary strings have at least one leading whitespace
-            expression += f"\n{indents} {net}{pf}{pt}{smm}{spm}{spmr}{cl}{zc}{tw}{tg}"
+            write(f"\n{indents} {net}{pf}{pt}{smm}{spm}{spmr}{cl}{zc}{tw}{tg}")
 
         if self.customPadOptions is not None:
-            expression += f"\n{indents}  {self.customPadOptions.to_sexpr()}"
+            write(f"\n{indents}  {self.customPadOptions.to_sexpr()}")
 
         if self.customPadPrimitives is not None:
             if len(self.customPadPrimitives) > 0:
-                expression += f"\n{indents}  (primitives"
+                write(f"\n{indents}  (primitives")
                 for primitive in self.customPadPrimitives:
-                    expression += (
-                        f"\n{primitive.to_sexpr(newline=False, indent=indent + 4)}"
-                    )
-                expression += f"\n{indents}  )"
+                    write("\n")
+                    primitive.write_sexpr(stream, newline=False, indent=indent + 4)
+                write(f"\n{indents}  )")
 
-        expression += f"{tstamp}){endline}"
-        return expression
+        write(f"{tstamp}){endline}")
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buffer = []
+        self.write_sexpr(buffer, indent=indent, newline=newline)
+        return "".join(buffer)
+
+
+def _parse_dimension(footprint: Footprint, item: list):
+    """Token handler of ``dimension`` items of footprints, which are not supported yet
+
+    Raises:
+        - NotImplementedError: Always
+    """
+    raise NotImplementedError(
+        "Dimensions are not yet handled! Please report this bug along with the file being parsed."
+    )
 
 
 @dataclass
-class Footprint:
+class Footprint(SexprWritable, AsyncFile, TokenDispatch):
     """The ``footprint`` token defines a footprint.
 
     Documentation:
         https://dev-docs.kicad.org/en/file-formats/sexpr-intro/index.html#_footprint
     """
 
+    tokenHandlers: ClassVar[Dict[str, TokenHandler]] = {
+        "version": lambda object, item: setattr(object, "version", item[1]),
+        "generator": lambda object, item: setattr(object, "generator", item[1]),
+        "layer": lambda object, item: setattr(object, "layer", item[1]),
+        "tedit": lambda object, item: setattr(object, "tedit", item[1]),
+        "tstamp": lambda object, item: setattr(object, "tstamp", item[1]),
+        "descr": lambda object, item: setattr(object, "description", item[1]),
+        "tags": lambda object, item: setattr(object, "tags", item[1]),
+        "path": lambda object, item: setattr(object, "path", item[1]),
+        "at": lambda object, item: setattr(
+            object, "position", Position.from_sexpr(item)
+        ),
+        "autoplace_cost90": lambda object, item: setattr(
+            object, "autoplaceCost90", item[1]
+        ),
+        "autoplace_cost180": lambda object, item: setattr(
+            object, "autoplaceCost180", item[1]
+        ),
+        "solder_mask_margin": lambda object, item: setattr(
+            object, "solderMaskMargin", item[1]
+        ),
+        "solder_paste_margin": lambda object, item: setattr(
+            object, "solderPasteMargin", item[1]
+        ),
+        "solder_paste_ratio": lambda object, item: setattr(
+            object, "solderPasteRatio", item[1]
+        ),
+        "clearance": lambda object, item: setattr(object, "clearance", item[1]),
+        "zone_connect": lambda object, item: setattr(object, "zoneConnect", item[1]),
+        "thermal_width": lambda object, item: setattr(object, "thermalWidth", item[1]),
+        "thermal_gap": lambda object, item: setattr(object, "thermalGap", item[1]),
+        "attr": lambda object, item: setattr(
+            object, "attributes", Attributes.from_sexpr(item)
+        ),
+        "model": lambda object, item: object.models.append(Model.from_sexpr(item)),
+        "fp_text": lambda object, item: object.graphicItems.append(
+            FpText.from_sexpr(item)
+        ),
+        "fp_text_box": lambda object, item: object.graphicItems.append(
+            FpTextBox.from_sexpr(item)
+        ),
+        "fp_line": lambda object, item: object.graphicItems.append(
+            FpLine.from_sexpr(item)
+        ),
+        "fp_rect": lambda object, item: object.graphicItems.append(
+            FpRect.from_sexpr(item)
+        ),
+        "fp_circle": lambda object, item: object.graphicItems.append(
+            FpCircle.from_sexpr(item)
+        ),
+        "fp_arc": lambda object, item: object.graphicItems.append(
+            FpArc.from_sexpr(item)
+        ),
+        "fp_poly": lambda object, item: object.graphicItems.append(
+            FpPoly.from_sexpr(item)
+        ),
+        "fp_curve": lambda object, item: object.graphicItems.append(
+            FpCurve.from_sexpr(item)
+        ),
+        "image": lambda object, item: object.graphicItems.append(
+            Image.from_sexpr(item)
+        ),
+        "pad": lambda object, item: object.pads.append(Pad.from_sexpr(item)),
+        "zone": lambda object, item: object.zones.append(Zone.from_sexpr(item)),
+        "property": lambda object, item: object.properties.update({item[1]: item[2]}),
+        "group": lambda object, item: object.groups.append(Group.from_sexpr(item)),
+        "private_layers": lambda object, item: object.privateLayers.extend(item[1:]),
+        "net_tie_pad_groups": lambda object, item: object.netTiePadGroups.extend(
+            item[1:]
+        ),
+        "dimension": lambda object, item: _parse_dimension(object, item),
+    }
+    """The ``tokenHandlers`` token defines the handler of every known token of the items
+    of ``(footprint ...)`` (see ``kiutils.utils.dispatch.TokenDispatch``)"""
+
     @property
     def libId(self) -> str:
         """The ``lib_id`` token defines the link to footprint library of the footprint.
@@ -961,8 +1070,9 @@ class Footprint:
         if exp[0] != "module" and exp[0] != "footprint":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.libId = exp[1]
+        handlers = cls.tokenHandlers
         for item in exp[2:]:
             if not isinstance(item, list):
                 if item == "locked":
@@ -971,87 +1081,22 @@ class Footprint:
                     object.placed = True
                 continue
 
-            if item[0] == "version":
-                object.version = item[1]
-            if item[0] == "generator":
-                object.generator = item[1]
-            if item[0] == "layer":
-                object.layer = item[1]
-            if item[0] == "tedit":
-                object.tedit = item[1]
-            if item[0] == "tstamp":
-                object.tstamp = item[1]
-            if item[0] == "descr":
-                object.description = item[1]
-            if item[0] == "tags":
-                object.tags = item[1]
-            if item[0] == "path":
-                object.path = item[1]
-            if item[0] == "at":
-                object.position = Position().from_sexpr(item)
-            if item[0] == "autoplace_cost90":
-                object.autoplaceCost90 = item[1]
-            if item[0] == "autoplace_cost180":
-                object.autoplaceCost180 = item[1]
-            if item[0] == "solder_mask_margin":
-                object.solderMaskMargin = item[1]
-            if item[0] == "solder_paste_margin":
-                object.solderPasteMargin = item[1]
-            if item[0] == "solder_paste_ratio":
-                object.solderPasteRatio = item[1]
-            if item[0] == "clearance":
-                object.clearance = item[1]
-            if item[0] == "zone_connect":
-                object.zoneConnect = item[1]
-            if item[0] == "thermal_width":
-                object.thermalWidth = item[1]
-            if item[0] == "thermal_gap":
-                object.thermalGap = item[1]
-            if item[0] == "attr":
-                object.attributes = Attributes.from_sexpr(item)
-            if item[0] == "model":
-                object.models.append(Model.from_sexpr(item))
-            if item[0] == "fp_text":
-                object.graphicItems.append(FpText.from_sexpr(item))
-            if item[0] == "fp_text_box":
-                object.graphicItems.append(FpTextBox.from_sexpr(item))
-            if item[0] == "fp_line":
-                object.graphicItems.append(FpLine.from_sexpr(item))
-            if item[0] == "fp_rect":
-                object.graphicItems.append(FpRect.from_sexpr(item))
-            if item[0] == "fp_circle":
-                object.graphicItems.append(FpCircle.from_sexpr(item))
-            if item[0] == "fp_arc":
-                object.graphicItems.append(FpArc.from_sexpr(item))
-            if item[0] == "fp_poly":
-                object.graphicItems.append(FpPoly.from_sexpr(item))
-            if item[0] == "fp_curve":
-                object.graphicItems.append(FpCurve.from_sexpr(item))
-            if item[0] == "image":
-                object.graphicItems.append(Image.from_sexpr(item))
-            if item[0] == "pad":
-                object.pads.append(Pad.from_sexpr(item))
-            if item[0] == "zone":
-                object.zones.append(Zone.from_sexpr(item))
-            if item[0] == "property":
-                object.properties.update({item[1]: item[2]})
-            if item[0] == "group":
-                object.groups.append(Group.from_sexpr(item))
-            if item[0] == "private_layers":
-                for layer in item[1:]:
-                    object.privateLayers.append(layer)
-            if item[0] == "net_tie_pad_groups":
-                for layer in item[1:]:
-                    object.netTiePadGroups.append(layer)
-            if item[0] == "dimension":
-                raise NotImplementedError(
-                    "Dimensions are not yet handled! Please report this bug along with the file being parsed."
-                )
+            handler = handlers.get(item[0])
+            if handler is not None:
+                handler(object, item)
 
-        return object
+        return fill_defaults(object)
 
     @classmethod
-    def from_file(cls, filepath: str, encoding: Optional[str] = None) -> Footprint:
+    def from_file(
+        cls,
+        filepath: str,
+        encoding: Optional[str] = None,
+        mmap: bool = False,
+        exact: bool = False,
+        cache: Union[bool, ParseCache] = False,
+        share: Union[bool, FlyweightPool] = False,
+    ) -> Footprint:
         """Load a footprint directly from a KiCad footprint file (`.kicad_mod`) and sets the
         ``self.filePath`` attribute to the given file path.
 
@@ -1059,6 +1104,26 @@ class Footprint:
             - filepath (str): Path or path-like object that points to the file
             - encoding (str, optional): Encoding of the input file. Defaults to None (platform
                                         dependent encoding).
+            - mmap (bool): Memory-map the file and parse its bytes in place instead of reading it
+                           as text. The file is decoded using ``encoding`` or UTF-8 if not
+                           given. Defaults to False.
+            - exact (bool): Keep numbers as ``sexpr.Number`` objects holding their original
+                            text, so that values that are not changed are written back exactly
+                            as they were read. Defaults to False.
+            - cache (Union[bool, ParseCache]): Reuse the object stored for the file in the given
+                                               cache (``kiutils.utils.cache.default_cache`` if
+                                               True) as long as the file is unchanged, or store
+                                               the loaded object there. Defaults to False.
+            - share (Union[bool, FlyweightPool]): Share equal strokes, text effects, 3D models
+                                                  and the positions of graphics and pads and
+                                                  pad drills between the items of the
+                                                  footprint, or with all objects of the given
+                                                  pool (see ``kiutils.utils.flyweight``). Shared
+                                                  objects cannot be changed, assigning their
+                                                  fields raises ``SharedObjectError``. Replace
+                                                  them before changing them, e.g.
+                                                  ``writable(item, "stroke").width = 0.2``.
+                                                  Defaults to False.
 
         Raises:
             - Exception: If the given path is not a file
@@ -1069,11 +1134,28 @@ class Footprint:
         if not path.isfile(filepath):
             raise Exception("Given path is not a file!")
 
-        with open(filepath, "r", encoding=encoding) as infile:
-            rawFootprint = infile.read()
+        if cache:
+            from kiutils.utils.cache import load_cached
+
+            return load_cached(
+                cache,
+                cls,
+                filepath,
+                lambda: cls.from_file(filepath, encoding, mmap, exact, share=share),
+                encoding=encoding,
+                exact=exact,
+                share=bool(share),
+            )
 
-            fpData = sexpr.parse_sexp(rawFootprint)
-            return cls.from_sexpr(fpData)
+        with sharing(pool_of(share), exact):
+            if mmap:
+                with sexpr.mapped_file(filepath) as data:
+                    return cls.from_sexpr(
+                        sexpr.parse_sexp(data, encoding or "utf-8", exact)
+                    )
+
+            with open(filepath, "r", encoding=encoding) as infile:
+                return cls.from_sexpr(sexpr.parse_sexp(infile, exact=exact))
 
     @classmethod
     def create_new(
@@ -1149,19 +1231,18 @@ class Footprint:
             filepath = self.filePath
 
         with open(filepath, "w", encoding=encoding) as outfile:
-            outfile.write(self.to_sexpr())
+            self.write_sexpr(outfile)
 
-    def to_sexpr(self, indent=0, newline=True, layerInFirstLine=False) -> str:
-        """Generate the S-Expression representing this object
+    def write_sexpr(self, stream, indent=0, newline=True, layerInFirstLine=False):
+        """Write the S-Expression representing this object to the given stream
 
         Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
             - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
             - layerInFirstLine (bool): Prints the ``layer`` token in the first line. Defaults to False
-
-        Returns:
-            - str: S-Expression of this object
         """
+        write = stream_writer(stream)
         indents = " " * indent
         endline = "\n" if newline else ""
 
@@ -1173,74 +1254,291 @@ class Footprint:
         )
         tstamp = f" (tstamp {self.tstamp})" if self.tstamp is not None else ""
 
-        expression = f'{indents}(footprint "{dequote(self.libId)}"{locked}{placed}{version}{generator}'
+        write(
+            f'{indents}(footprint "{dequote(self.libId)}"{locked}{placed}{version}{generator}'
+        )
         if layerInFirstLine:
-            expression += f' (layer "{dequote(self.layer)}")\n'
+            write(f' (layer "{dequote(self.layer)}")\n')
         else:
-            expression += f'\n{indents}  (layer "{dequote(self.layer)}")\n'
-        expression += f"{indents}  (tedit {self.tedit}){tstamp}\n"
+            write(f'\n{indents}  (layer "{dequote(self.layer)}")\n')
+        write(f"{indents}  (tedit {self.tedit}){tstamp}\n")
 
         if self.position is not None:
             angle = f" {self.position.angle}" if self.position.angle is not None else ""
-            expression += (
-                f"{indents}  (at {self.position.X} {self.position.Y}{angle})\n"
-            )
+            write(f"{indents}  (at {self.position.X} {self.position.Y}{angle})\n")
         if self.description is not None:
-            expression += f'{indents}  (descr "{dequote(self.description)}")\n'
+            write(f'{indents}  (descr "{dequote(self.description)}")\n')
         if self.tags is not None:
-            expression += f'{indents}  (tags "{dequote(self.tags)}")\n'
+            write(f'{indents}  (tags "{dequote(self.tags)}")\n')
         for item in self.properties:
-            expression += f'{indents}  (property "{dequote(item)}" "{dequote(self.properties[item])}")\n'
+            write(
+                f'{indents}  (property "{dequote(item)}" "{dequote(self.properties[item])}")\n'
+            )
         if self.path is not None:
-            expression += f'{indents}  (path "{dequote(self.path)}")\n'
+            write(f'{indents}  (path "{dequote(self.path)}")\n')
 
         # Additional parameters used in board
         if self.autoplaceCost90 is not None:
-            expression += f"{indents}  (autoplace_cost90 {self.autoplaceCost90})\n"
+            write(f"{indents}  (autoplace_cost90 {self.autoplaceCost90})\n")
         if self.autoplaceCost180 is not None:
-            expression += f"{indents}  (autoplace_cost180 {self.autoplaceCost180})\n"
+            write(f"{indents}  (autoplace_cost180 {self.autoplaceCost180})\n")
         if self.solderMaskMargin is not None:
-            expression += f"{indents}  (solder_mask_margin {self.solderMaskMargin})\n"
+            write(f"{indents}  (solder_mask_margin {self.solderMaskMargin})\n")
         if self.solderPasteMargin is not None:
-            expression += f"{indents}  (solder_paste_margin {self.solderPasteMargin})\n"
+            write(f"{indents}  (solder_paste_margin {self.solderPasteMargin})\n")
         if self.solderPasteRatio is not None:
-            expression += f"{indents}  (solder_paste_ratio {self.solderPasteRatio})\n"
+            write(f"{indents}  (solder_paste_ratio {self.solderPasteRatio})\n")
         if self.clearance is not None:
-            expression += f"{indents}  (clearance {self.clearance})\n"
+            write(f"{indents}  (clearance {self.clearance})\n")
         if self.zoneConnect is not None:
-            expression += f"{indents}  (zone_connect {self.zoneConnect})\n"
+            write(f"{indents}  (zone_connect {self.zoneConnect})\n")
         if self.thermalWidth is not None:
-            expression += f"{indents}  (thermal_width {self.thermalWidth})\n"
+            write(f"{indents}  (thermal_width {self.thermalWidth})\n")
         if self.thermalGap is not None:
-            expression += f"{indents}  (thermal_gap {self.thermalGap})\n"
+            write(f"{indents}  (thermal_gap {self.thermalGap})\n")
 
         if self.attributes is not None:
             # Note: If the attribute object has only standard values in it, it will return an
             #       empty string. Therefore, it should create its own newline and indentations only
             #       when needed.
-            expression += self.attributes.to_sexpr(indent=indent + 2, newline=True)
+            self.attributes.write_sexpr(stream, indent=indent + 2, newline=True)
         if self.privateLayers:
-            expression += f"{indents}  (private_layers"
+            write(f"{indents}  (private_layers")
             for item in self.privateLayers:
-                expression += f' "{dequote(item)}"'
-            expression += ")\n"
+                write(f' "{dequote(item)}"')
+            write(")\n")
 
         if self.netTiePadGroups:
-            expression += f"{indents}  (net_tie_pad_groups"
+            write(f"{indents}  (net_tie_pad_groups")
             for item in self.netTiePadGroups:
-                expression += f' "{dequote(item)}"'
-            expression += ")\n"
+                write(f' "{dequote(item)}"')
+            write(")\n")
 
         for item in self.graphicItems:
-            expression += item.to_sexpr(indent=indent + 2)
+            item.write_sexpr(stream, indent=indent + 2)
         for item in self.pads:
-            expression += item.to_sexpr(indent=indent + 2)
+            item.write_sexpr(stream, indent=indent + 2)
         for item in self.zones:
-            expression += item.to_sexpr(indent=indent + 2)
+            item.write_sexpr(stream, indent=indent + 2)
         for item in self.models:
-            expression += item.to_sexpr(indent=indent + 2)
+            item.write_sexpr(stream, indent=indent + 2)
         for item in self.groups:
-            expression += item.to_sexpr(indent=indent + 2)
+            item.write_sexpr(stream, indent=indent + 2)
 
-        expression += f"{indents}){endline}"
-        return expression
+        write(f"{indents}){endline}")
+
+    def to_sexpr(self, indent=0, newline=True, layerInFirstLine=False) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+            - layerInFirstLine (bool): Prints the ``layer`` token in the first line. Defaults to False
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buffer = []
+        self.write_sexpr(
+            buffer, indent=indent, newline=newline, layerInFirstLine=layerInFirstLine
+        )
+        return "".join(buffer)
+
+
+FOOTPRINT_FILE_EXTENSION = ".kicad_mod"
+"""File extension of the footprints of a footprint library"""
+
+
+def _load_library_footprint(
+    filepath: str, encoding: Optional[str], exact: bool, cache
+) -> Footprint:
+    """Load a footprint of a library and set its file path. Runs in the worker processes of
+    ``FootprintLibrary.load_all()``."""
+    footprint = Footprint.from_file(filepath, encoding, exact=exact, cache=cache)
+    footprint.filePath = filepath
+    return footprint
+
+
+@dataclass
+class FootprintLibrary:
+    """The ``FootprintLibrary`` token defines a footprint library, which is a directory (usually
+    named ``<library>.pretty``) with one ``.kicad_mod`` file per footprint.
+
+    The footprints are listed by their name without being parsed. Single footprints are loaded on
+    demand using ``self.get()`` and kept in a cache of the ``self.cacheSize`` most recently used
+    footprints, ``self.load_all()`` loads all of them in a pool of worker processes. The time
+    spent loading footprints is collected in ``self.statistics``.
+    """
+
+    directory: Optional[str] = None
+    """The ``directory`` token defines the path of the library directory"""
+
+    encoding: Optional[str] = None
+    """The ``encoding`` token defines the encoding of the footprint files. If None, the platform
+    dependent encoding is used."""
+
+    exact: bool = False
+    """The ``exact`` token defines if numbers are kept as ``sexpr.Number`` objects (see
+    ``Footprint.from_file()``)"""
+
+    cache: Union[bool, ParseCache] = False
+    """The ``cache`` token defines the parse cache used to load the footprints (see
+    ``Footprint.from_file()``)"""
+
+    cacheSize: int = 128
+    """The ``cacheSize`` token defines how many of the most recently used footprints are kept in
+    memory by ``self.get()``"""
+
+    statistics: LoadStatistics = field(default_factory=LoadStatistics)
+    """The ``statistics`` token defines the number of footprints, bytes and time spent loading
+    them"""
+
+    recentlyUsed: "OrderedDict[str, Footprint]" = field(
+        default_factory=OrderedDict, repr=False, compare=False
+    )
+    """The ``recentlyUsed`` token defines the most recently used footprints by their name, the
+    most recently used one last"""
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: str,
+        encoding: Optional[str] = None,
+        exact: bool = False,
+        cache: Union[bool, ParseCache] = False,
+        cacheSize: int = 128,
+    ) -> FootprintLibrary:
+        """Open the footprint library in the given directory. No footprint is loaded yet.
+
+        Args:
+            - directory (str): Path or path-like object that points to the library directory
+            - encoding (str, optional): Encoding of the footprint files. Defaults to None
+                                        (platform dependent encoding).
+            - exact (bool): Keep numbers as ``sexpr.Number`` objects. Defaults to False.
+            - cache (Union[bool, ParseCache]): Parse cache used to load the footprints (see
+                                               ``Footprint.from_file()``). Defaults to False.
+            - cacheSize (int): Number of most recently used footprints kept in memory. Defaults
+                               to 128.
+
+        Raises:
+            - Exception: If the given path is not a directory
+
+        Returns:
+            - FootprintLibrary: The footprint library
+        """
+        if not path.isdir(directory):
+            raise Exception("Given path is not a directory!")
+
+        return cls(
+            directory=directory,
+            encoding=encoding,
+            exact=exact,
+            cache=cache,
+            cacheSize=cacheSize,
+        )
+
+    def names(self) -> List[str]:
+        """List the names of all footprints of the library without loading them
+
+        Returns:
+            - List[str]: Sorted names of the footprints, e.g. ``R_0805_2012Metric``
+        """
+        with os.scandir(self.directory) as entries:
+            return sorted(
+                entry.name[: -len(FOOTPRINT_FILE_EXTENSION)]
+                for entry in entries
+                if entry.name.endswith(FOOTPRINT_FILE_EXTENSION) and entry.is_file()
+            )
+
+    def footprint_path(self, name: str) -> str:
+        """Get the path of the file of the given footprint
+
+        Args:
+            - name (str): Name of the footprint
+
+        Returns:
+            - str: Path of the ``.kicad_mod`` file
+        """
+        return path.join(self.directory, f"{name}{FOOTPRINT_FILE_EXTENSION}")
+
+    def __contains__(self, name: str) -> bool:
+        return path.isfile(self.footprint_path(name))
+
+    def __len__(self) -> int:
+        return len(self.names())
+
+    def get(self, name: str) -> Footprint:
+        """Get a footprint of the library. Footprints are loaded on first access and kept in
+        memory while they are among the ``self.cacheSize`` most recently used ones.
+
+        Args:
+            - name (str): Name of the footprint, e.g. ``R_0805_2012Metric``
+
+        Raises:
+            - Exception: If the library has no footprint with the given name
+
+        Returns:
+            - Footprint: The footprint. Changes to it are kept while it stays in memory.
+        """
+        footprint = self.recentlyUsed.get(name)
+        if footprint is not None:
+            self.recentlyUsed.move_to_end(name)
+            return footprint
+
+        filepath = self.footprint_path(name)
+        if not path.isfile(filepath):
+            raise Exception(f"Footprint {name} not found in library {self.directory}")
+
+        start = time.perf_counter()
+        footprint = _load_library_footprint(
+            filepath, self.encoding, self.exact, self.cache
+        )
+        self.statistics.add(1, path.getsize(filepath), time.perf_counter() - start)
+
+        self.recentlyUsed[name] = footprint
+        while len(self.recentlyUsed) > self.cacheSize:
+            self.recentlyUsed.popitem(last=False)
+        return footprint
+
+    def load_all(self, workers: Optional[int] = None) -> Dict[str, Footprint]:
+        """Load all footprints of the library in a pool of worker processes. The footprints are
+        not added to the most recently used ones.
+
+        Args:
+            - workers (int, optional): Number of worker processes. Defaults to None (number of
+                                       processors). With one worker, the footprints are loaded
+                                       in this process.
+
+        Returns:
+            - Dict[str, Footprint]: All footprints by their name, sorted by name
+        """
+        names = self.names()
+        paths = [self.footprint_path(name) for name in names]
+        start = time.perf_counter()
+        arguments = (
+            paths,
+            repeat(self.encoding),
+            repeat(self.exact),
+            repeat(self.cache),
+        )
+        if workers == 1:
+            footprints = list(map(_load_library_footprint, *arguments))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                footprints = list(
+                    pool.map(
+                        _load_library_footprint,
+                        *arguments,
+                        chunksize=max(
+                            1, len(paths) // (4 * (workers or os.cpu_count() or 1))
+                        ),
+                    )
+                )
+        self.statistics.add(
+            len(paths),
+            sum(path.getsize(filepath) for filepath in paths),
+            time.perf_counter() - start,
+        )
+        return dict(zip(names, footprints))
@@ -26,6 +26,7 @@ from .brditems import (
     StackupLayer,
     StackupSubLayer,
     Target,
+    TraceTable,
     Via,
 )
 
@@ -42,6 +43,7 @@ from .common import (
     Net,
     PageSettings,
     Position,
+    PositionArray,
     ProjectInstance,
     Property,
     RenderCache,
@@ -101,6 +103,7 @@ from .zones import (
 __all__ = [
     # Common items
     "Position",
+    "PositionArray",
     "Coordinate",
     "ColorRGBA",
     "Stroke",
@@ -128,6 +131,7 @@ __all__ = [
     "Segment",
     "Via",
     "Arc",
+    "TraceTable",
     "Target",
     # Footprint items
     "FpText",
@@ -15,15 +15,23 @@ Documentation taken from:
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import MutableSequence
 from dataclasses import dataclass, field
-from typing import List, Optional
+from itertools import compress
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-from kiutils.items.common import Position
+from kiutils.items.common import Position, _number, _numpy
+from kiutils.utils.construct import fill_defaults, new_object
+from kiutils.utils.slots import slotted
 from kiutils.utils.strings import dequote
+from kiutils.utils.views import ViewList, ViewRegistry, new_view, view_class
+from kiutils.utils.writer import SexprWritable, stream_writer
 
 
 @dataclass
-class GeneralSettings:
+class GeneralSettings(SexprWritable):
     """The ``general`` token define general information about the board
 
     Documentation:
@@ -79,7 +87,7 @@ class GeneralSettings:
 
 
 @dataclass
-class LayerToken:
+class LayerToken(SexprWritable):
     """Intermediate type used for the ``layers`` token in a board
 
     Documentation:
@@ -144,7 +152,7 @@ class LayerToken:
 
 
 @dataclass
-class StackupSubLayer:
+class StackupSubLayer(SexprWritable):
     """The ``StackupSubLayer`` token defines a sublayer used when stacking dielectrics in a PCB"""
 
     thickness: float = 0.1
@@ -201,7 +209,7 @@ class StackupSubLayer:
 
 
 @dataclass
-class StackupLayer:
+class StackupLayer(SexprWritable):
     """The ``layer`` token defines the stack up setting of a single layer in the board stack up
     settings.
 
@@ -262,7 +270,7 @@ class StackupLayer:
             raise Exception("Expression does not have the correct type")
 
         parsingSublayer = False
-        tempSublayer = StackupSubLayer()
+        tempSublayer = None
         object = cls()
         object.name = exp[1]
         for item in exp[2:]:
@@ -277,6 +285,7 @@ class StackupLayer:
                     else:
                         # Change state of the parser to look for StackupSubLayer tokens
                         parsingSublayer = True
+                        tempSublayer = StackupSubLayer()
                 continue
 
             # Parse the tokens of StackupSubLayer for the current sublayer
@@ -349,7 +358,7 @@ class StackupLayer:
 
 
 @dataclass
-class Stackup:
+class Stackup(SexprWritable):
     """The ``stackup`` token defines the board stack up settings and is defined in the setup
     section.
 
@@ -403,7 +412,7 @@ class Stackup:
         object = cls()
         for item in exp:
             if item[0] == "layer":
-                object.layers.append(StackupLayer().from_sexpr(item))
+                object.layers.append(StackupLayer.from_sexpr(item))
             if item[0] == "copper_finish":
                 object.copperFinish = item[1]
             if item[0] == "dielectric_constraints":
@@ -449,7 +458,7 @@ class Stackup:
 
 
 @dataclass
-class PlotSettings:
+class PlotSettings(SexprWritable):
     """The ``pcbplotparams`` token defines the plotting and printing settings used for the last
     plot and is defined in the set up section.
 
@@ -756,7 +765,7 @@ class PlotSettings:
 
 
 @dataclass
-class SetupData:
+class SetupData(SexprWritable):
     """The setup token is used to store the current settings such as default item sizes and
     other options used by the board
 
@@ -818,9 +827,9 @@ class SetupData:
         object = cls()
         for item in exp:
             if item[0] == "stackup":
-                object.stackup = Stackup().from_sexpr(item)
+                object.stackup = Stackup.from_sexpr(item)
             if item[0] == "pcbplotparams":
-                object.plotSettings = PlotSettings().from_sexpr(item)
+                object.plotSettings = PlotSettings.from_sexpr(item)
             if item[0] == "pad_to_mask_clearance":
                 object.packToMaskClearance = item[1]
             if item[0] == "solder_mask_min_width":
@@ -830,11 +839,9 @@ class SetupData:
             if item[0] == "pad_to_paste_clearance_ratio":
                 object.padToPasteClearanceRatio = item[1]
             if item[0] == "aux_axis_origin":
-                object.auxAxisOrigin = Position().from_sexpr(item)
+                object.auxAxisOrigin = Position.from_sexpr(item)
             if item[0] == "grid_origin":
-                object.gridOrigin = Position().from_sexpr(item)
-            if item[0] == "pcbplotparams":
-                object.plotSettings = PlotSettings().from_sexpr(item)
+                object.gridOrigin = Position.from_sexpr(item)
         return object
 
     def to_sexpr(self, indent=2, newline=True) -> str:
@@ -876,8 +883,9 @@ class SetupData:
         return expression
 
 
+@slotted
 @dataclass
-class Segment:
+class Segment(SexprWritable):
     """The ``segment`` token defines a track segment in a KiCad board
 
     Documentation:
@@ -926,16 +934,16 @@ class Segment:
         if exp[0] != "segment":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if not isinstance(item, list):
                 if item == "locked":
                     object.locked = True
                 continue
             if item[0] == "start":
-                object.start = Position().from_sexpr(item)
+                object.start = Position.from_sexpr(item)
             if item[0] == "end":
-                object.end = Position().from_sexpr(item)
+                object.end = Position.from_sexpr(item)
             if item[0] == "width":
                 object.width = item[1]
             if item[0] == "layer":
@@ -944,7 +952,7 @@ class Segment:
                 object.net = item[1]
             if item[0] == "tstamp":
                 object.tstamp = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -963,8 +971,9 @@ class Segment:
         return f'{indents}(segment{locked} (start {self.start.X} {self.start.Y}) (end {self.end.X} {self.end.Y}) (width {self.width}) (layer "{dequote(self.layer)}") (net {self.net}) (tstamp {self.tstamp})){endline}'
 
 
+@slotted
 @dataclass
-class Via:
+class Via(SexprWritable):
     """The ``via`` token defines a track via in a KiCad board
 
     Documentation:
@@ -1027,7 +1036,7 @@ class Via:
         if exp[0] != "via":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if not isinstance(item, list):
                 if item == "locked":
@@ -1036,7 +1045,7 @@ class Via:
                     object.type = item
                 continue
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "size":
                 object.size = item[1]
             if item[0] == "drill":
@@ -1054,7 +1063,7 @@ class Via:
                 object.net = item[1]
             if item[0] == "tstamp":
                 object.tstamp = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -1083,8 +1092,9 @@ class Via:
         return f"{indents}(via{type}{locked} (at {self.position.X} {self.position.Y}) (size {self.size}) (drill {self.drill}) (layers{layers}){rum}{kel}{free} (net {self.net}){tstamp}){endline}"
 
 
+@slotted
 @dataclass
-class Arc:
+class Arc(SexprWritable):
     """The ``arc`` token defines a track arc, which will be generated when using the length-matching
     feature on differential pairs.
 
@@ -1137,18 +1147,18 @@ class Arc:
         if exp[0] != "arc":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if not isinstance(item, list):
                 if item == "locked":
                     object.locked = True
                 continue
             if item[0] == "start":
-                object.start = Position().from_sexpr(item)
+                object.start = Position.from_sexpr(item)
             elif item[0] == "mid":
-                object.mid = Position().from_sexpr(item)
+                object.mid = Position.from_sexpr(item)
             elif item[0] == "end":
-                object.end = Position().from_sexpr(item)
+                object.end = Position.from_sexpr(item)
             elif item[0] == "width":
                 object.width = item[1]
             elif item[0] == "layer":
@@ -1157,7 +1167,7 @@ class Arc:
                 object.net = item[1]
             elif item[0] == "tstamp":
                 object.tstamp = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -1185,7 +1195,7 @@ class Arc:
 
 
 @dataclass
-class Target:
+class Target(SexprWritable):
     """The ``target`` token defines a target marker on the PCB
 
     Documentation:
@@ -1230,11 +1240,11 @@ class Target:
         if exp[0] != "target":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.type = exp[1]
         for item in exp[2:]:
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "size":
                 object.size = item[1]
             if item[0] == "width":
@@ -1243,7 +1253,7 @@ class Target:
                 object.layer = item[1]
             if item[0] == "tstamp":
                 object.tstamp = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -1259,3 +1269,818 @@ class Target:
         endline = "\n" if newline else ""
 
         return f'{indents}(target {self.type} (at {self.position.X} {self.position.Y}) (size {self.size}) (width {self.width}) (layer "{self.layer}") (tstamp {self.tstamp})){endline}'
+
+
+_POSITION_COLUMNS = {
+    "start": ("startX", "startY"),
+    "mid": ("midX", "midY"),
+    "end": ("endX", "endY"),
+    "position": ("startX", "startY"),
+}
+"""Columns of the X and Y coordinates of the position fields of segments, arcs and vias"""
+
+_KIND_CLASSES = (Segment, Arc, Via)
+"""Class of the items of every kind of the ``kinds`` column of ``TraceTable``"""
+
+
+def _load_item(view, name: str):
+    """Read a field of an item taken from a ``TraceTable`` from the table. Positions and the
+    layers of vias are returned as views, which are kept as long as they are referenced.
+    """
+    table = view.owner
+    index = view.index
+    if name == "net":
+        return table.nets[index]
+    if name == "layer":
+        return table.layers[table.layerIds[index]]
+    if name in _POSITION_COLUMNS or name == "layers":
+        value = table.views.get(index, name)
+        if value is None:
+            if name == "layers":
+                value = ViewList(
+                    table.layers[table.layerIds[index]],
+                    table,
+                    index,
+                    name,
+                    _store_layers,
+                )
+            else:
+                value = new_view(
+                    view_class(
+                        Position, _load_position, _store_position, _build_position
+                    ),
+                    table,
+                    index,
+                    name,
+                )
+            table.views.add(value)
+        return value
+    flags = table.flags[index]
+    if name in ("width", "size"):
+        return _number(table.widths[index])
+    if name == "drill":
+        return _number(table.drills[index])
+    if name == "tstamp":
+        return table.tstamps[index]
+    if name == "locked":
+        return bool(flags & table.LOCKED)
+    if name == "free":
+        return bool(flags & table.FREE)
+    if name == "removeUnusedLayers":
+        return bool(flags & table.REMOVE_UNUSED_LAYERS)
+    if name == "keepEndLayers":
+        return bool(flags & table.KEEP_END_LAYERS)
+    if name == "type":
+        if flags & table.MICRO:
+            return "micro"
+        return "blind" if flags & table.BLIND else None
+    raise AttributeError(name)
+
+
+def _store_item(view, name: str, value):
+    """Write a changed field of an item taken from a ``TraceTable`` to the table"""
+    table = view.owner
+    index = view.index
+    if (name in _POSITION_COLUMNS or name == "layers") and (
+        table.views.get(index, name) is not value
+    ):
+        # The position or list held before is not part of the item anymore
+        table.views.discard(index, name)
+    item = table._build(index)
+    setattr(item, name, value)
+    table._set_row(index, table._object_row(item))
+
+
+def _build_item(view) -> Union[Segment, Arc, Via]:
+    """Create the object of an item taken from a ``TraceTable``"""
+    return view.owner._build(view.index)
+
+
+def _load_position(view: Position, name: str):
+    """Read a field of a position of an item taken from a ``TraceTable`` from the table"""
+    if name in ("X", "Y"):
+        column = _POSITION_COLUMNS[view.field][name == "Y"]
+        return _number(getattr(view.owner, column)[view.index])
+    return None if name == "angle" else False
+
+
+def _store_position(view: Position, name: str, value):
+    """Write a changed coordinate of a position of an item taken from a ``TraceTable`` to the
+    table"""
+    if name not in ("X", "Y"):
+        raise Exception("Trace tables only store the X and Y coordinates of positions")
+    column = _POSITION_COLUMNS[view.field][name == "Y"]
+    getattr(view.owner, column)[view.index] = float(value)
+
+
+def _build_position(view: Position) -> Position:
+    """Create a position object of a position of an item taken from a ``TraceTable``"""
+    return Position(_load_position(view, "X"), _load_position(view, "Y"))
+
+
+def _store_layers(view: list, name: str):
+    """Write the changed layers of a via taken from a ``TraceTable`` to the table"""
+    table = view.owner
+    table.layerIds[view.index] = table._layer_id(tuple(view))
+
+
+_ITEM_VIEWS = tuple(
+    view_class(cls, _load_item, _store_item, _build_item) for cls in _KIND_CLASSES
+)
+"""View class of the items of every kind of the ``kinds`` column of ``TraceTable``"""
+
+
+def _find(column: array, values: Iterable[int]) -> Sequence[int]:
+    """Find the indices of the values of a column that are one of the given values, in
+    ascending order. Values are searched for in the bytes of the column, so that only the
+    matching items are visited by Python code, unless many items match.
+
+    Returns:
+        - Sequence[int]: ``range`` of all indices if all values match, list of indices otherwise
+    """
+    values = set(values)
+    data = column.tobytes()
+    size = column.itemsize
+    limit = len(column) // 8
+    found = []
+    for value in values:
+        try:
+            pattern = array(column.typecode, (value,)).tobytes()
+        except OverflowError:
+            continue
+        if data == pattern * len(column):
+            return range(len(column))
+        start = data.find(pattern)
+        while start >= 0:
+            if start % size:
+                # Part of two items
+                start = data.find(pattern, start + 1)
+                continue
+            found.append(start // size)
+            if len(found) > limit:
+                # Visiting every item is faster
+                return list(
+                    compress(range(len(column)), map(values.__contains__, column))
+                )
+            start = data.find(pattern, start + size)
+    if len(values) > 1:
+        found.sort()
+    return found
+
+
+def _runs(indices: Sequence[int]) -> Optional[List[Tuple[int, int]]]:
+    """Get the ranges of consecutive indices of an ascending list of indices as ``(start, stop)``
+    tuples, or None if there are more than a quarter as many ranges as indices"""
+    if isinstance(indices, range) and indices.step == 1:
+        return [(indices.start, indices.stop)] if indices else []
+    if not indices:
+        return []
+    if indices[-1] - indices[0] + 1 == len(indices):
+        return [(indices[0], indices[-1] + 1)]
+    limit = len(indices) // 4
+    runs = []
+    start = previous = indices[0]
+    for index in indices:
+        if index != previous + 1 and index != start:
+            runs.append((start, previous + 1))
+            if len(runs) > limit:
+                return None
+            start = index
+        previous = index
+    runs.append((start, previous + 1))
+    return runs
+
+
+class TraceTable(MutableSequence):
+    """Columnar list of the segments, arcs and vias of a board (see
+    ``Board.from_file(..., columnar=True)``). Every field is stored in an ``array.array`` column
+    instead of one object per item, which needs a fraction of the memory and allows bulk
+    operations on hundreds of thousands of items (``where()``, ``select()``,
+    ``filter_by_net()``, ``filter_by_layer()`` and ``column()``, which returns NumPy arrays if
+    NumPy is installed).
+
+    The table behaves like a list of ``Segment``, ``Arc`` and ``Via`` objects. Accessing an item
+    returns a view of it (see ``kiutils.utils.views``), which reads its fields from the columns
+    and writes changes of its fields, its positions and the layers of vias through to them.
+    Views are only kept as long as they are referenced, and items added to the table are copied
+    into the columns. Only ``X`` and ``Y`` of the positions are stored.
+
+    Numbers are stored as ``float`` and converted back to ``int`` if integral, as the parser does.
+    The table cannot hold exact numbers (``sexpr.Number``).
+    """
+
+    SEGMENT = 0
+    """Kind of segments in the ``kinds`` column"""
+
+    ARC = 1
+    """Kind of arcs in the ``kinds`` column"""
+
+    VIA = 2
+    """Kind of vias in the ``kinds`` column"""
+
+    LOCKED = 1
+    """Flag of locked items in the ``flags`` column"""
+
+    FREE = 2
+    """Flag of free vias in the ``flags`` column"""
+
+    REMOVE_UNUSED_LAYERS = 4
+    """Flag of vias with the ``remove_unused_layers`` token in the ``flags`` column"""
+
+    KEEP_END_LAYERS = 8
+    """Flag of vias with the ``keep_end_layers`` token in the ``flags`` column"""
+
+    MICRO = 16
+    """Flag of micro vias in the ``flags`` column"""
+
+    BLIND = 32
+    """Flag of blind vias in the ``flags`` column"""
+
+    COLUMNS = {
+        "kinds": "b",
+        "startX": "d",
+        "startY": "d",
+        "midX": "d",
+        "midY": "d",
+        "endX": "d",
+        "endY": "d",
+        "widths": "d",
+        "drills": "d",
+        "layerIds": "i",
+        "nets": "i",
+        "flags": "B",
+    }
+    """Type code of every column. The position of vias is stored in ``startX`` and ``startY`` and
+    their size in ``widths``. ``layerIds`` holds the index of the layer of segments and arcs or
+    the tuple of layers of vias in ``layers``."""
+
+    def __init__(self, items: Iterable = ()):
+        """Create the table
+
+        Args:
+            - items (Iterable): Segments, arcs and vias to add. Defaults to an empty tuple.
+        """
+        for name, typecode in self.COLUMNS.items():
+            setattr(self, name, array(typecode))
+        self.tstamps: List[Optional[str]] = []
+        """The ``tstamp`` of every item"""
+        self.layers: List[Union[str, Tuple[str, ...]]] = []
+        """Layer names and tuples of via layers, indexed by the ``layerIds`` column"""
+        self.layerIndex: Dict[Union[str, Tuple[str, ...]], int] = {}
+        """Index of every entry of ``layers``"""
+        self.views = ViewRegistry()
+        """Views of the items that are still referenced, by their index"""
+        self.extend(items)
+
+    def _layer_id(self, layer: Union[str, Tuple[str, ...]]) -> int:
+        """Get the index of a layer name or tuple of via layers in ``self.layers``"""
+        layerId = self.layerIndex.get(layer)
+        if layerId is None:
+            layerId = self.layerIndex[layer] = len(self.layers)
+            self.layers.append(layer)
+        return layerId
+
+    def _insert_row(self, index: int, row: tuple):
+        """Insert the values of all columns of an item, in the order of ``COLUMNS`` followed by
+        the ``tstamp``"""
+        if index >= len(self.tstamps):
+            for name, value in zip(self.COLUMNS, row):
+                getattr(self, name).append(value)
+            self.tstamps.append(row[-1])
+        else:
+            for name, value in zip(self.COLUMNS, row):
+                getattr(self, name).insert(index, value)
+            self.tstamps.insert(index, row[-1])
+
+    def _set_row(self, index: int, row: tuple):
+        """Replace the values of all columns of an item"""
+        for name, value in zip(self.COLUMNS, row):
+            getattr(self, name)[index] = value
+        self.tstamps[index] = row[-1]
+
+    def _object_row(self, item) -> tuple:
+        """Get the values of all columns of a segment, arc or via"""
+        flags = self.LOCKED if item.locked else 0
+        if isinstance(item, Via):
+            flags |= (
+                (self.FREE if item.free else 0)
+                | (self.REMOVE_UNUSED_LAYERS if item.removeUnusedLayers else 0)
+                | (self.KEEP_END_LAYERS if item.keepEndLayers else 0)
+                | (self.MICRO if item.type == "micro" else 0)
+                | (self.BLIND if item.type == "blind" else 0)
+            )
+            position = item.position
+            return (
+                self.VIA,
+                float(position.X),
+                float(position.Y),
+                0.0,
+                0.0,
+                0.0,
+                0.0,
+                float(item.size),
+                float(item.drill),
+                self._layer_id(tuple(item.layers)),
+                int(item.net),
+                flags,
+                item.tstamp,
+            )
+        if isinstance(item, Arc):
+            kind, mid = self.ARC, item.mid
+        elif isinstance(item, Segment):
+            kind, mid = self.SEGMENT, Position()
+        else:
+            raise Exception(
+                "Only segments, arcs and vias can be added to a trace table"
+            )
+        return (
+            kind,
+            float(item.start.X),
+            float(item.start.Y),
+            float(mid.X),
+            float(mid.Y),
+            float(item.end.X),
+            float(item.end.Y),
+            float(item.width),
+            0.0,
+            self._layer_id(item.layer),
+            int(item.net),
+            flags,
+            item.tstamp,
+        )
+
+    def append_sexpr(self, exp: list):
+        """Add the item of the given S-Expression without building an object for it
+
+        Args:
+            - exp (list): Part of parsed S-Expression ``(segment ...)``, ``(arc ...)`` or
+                          ``(via ...)``
+
+        Raises:
+            - Exception: When the given expression is no segment, arc or via
+        """
+        head = exp[0] if isinstance(exp, list) and exp else None
+        if head == "via":
+            kind, width, tstamp = self.VIA, 0.0, None
+            layer = []
+        elif head == "segment":
+            kind, width, tstamp, layer = self.SEGMENT, 0.1, "", "F.Cu"
+        elif head == "arc":
+            kind, width, tstamp, layer = self.ARC, 0.2, None, "F.Cu"
+        else:
+            raise Exception("Expression does not have the correct type")
+
+        startX = startY = midX = midY = endX = endY = drill = 0.0
+        net = flags = 0
+        for item in exp:
+            if not isinstance(item, list):
+                if item == "locked":
+                    flags |= self.LOCKED
+                elif kind == self.VIA and item == "micro":
+                    flags |= self.MICRO
+                elif kind == self.VIA and item == "blind":
+                    flags |= self.BLIND
+                continue
+            token = item[0]
+            if token == "start" or token == "at":
+                startX, startY = item[1], item[2]
+            elif token == "end":
+                endX, endY = item[1], item[2]
+            elif token == "mid":
+                midX, midY = item[1], item[2]
+            elif token == "width" or token == "size":
+                width = item[1]
+            elif token == "drill":
+                drill = item[1]
+            elif token == "layer":
+                layer = item[1]
+            elif token == "layers":
+                layer.extend(item[1:])
+            elif token == "net":
+                net = item[1]
+            elif token == "tstamp":
+                tstamp = item[1]
+            elif token == "remove_unused_layers":
+                flags |= self.REMOVE_UNUSED_LAYERS
+            elif token == "keep_end_layers":
+                flags |= self.KEEP_END_LAYERS
+            elif token == "free":
+                flags |= self.FREE
+        if kind != self.ARC:
+            midX = midY = 0.0
+        self._insert_row(
+            len(self.tstamps),
+            (
+                kind,
+                float(startX),
+                float(startY),
+                float(midX),
+                float(midY),
+                float(endX),
+                float(endY),
+                float(width),
+                float(drill),
+                self._layer_id(tuple(layer) if kind == self.VIA else layer),
+                net,
+                flags,
+                tstamp,
+            ),
+        )
+
+    def collect(self, forms: Iterable) -> Iterator:
+        """Add the segments, arcs and vias of the given top-level forms to the table and pass on
+        all other forms
+
+        Args:
+            - forms (Iterable): Items of the first expression of a board (see
+                                ``sexpr.iterforms()``)
+
+        Returns:
+            - Iterator: The items that are no segments, arcs or vias
+        """
+        for form in forms:
+            if isinstance(form, list) and form and form[0] in ("segment", "arc", "via"):
+                self.append_sexpr(form)
+            else:
+                yield form
+
+    def _build(self, index: int) -> Union[Segment, Arc, Via]:
+        """Build the object of the item at the given index from the columns"""
+        kind = self.kinds[index]
+        flags = self.flags[index]
+        layer = self.layers[self.layerIds[index]]
+        start = Position(_number(self.startX[index]), _number(self.startY[index]))
+        if kind == self.VIA:
+            type = None
+            if flags & self.MICRO:
+                type = "micro"
+            elif flags & self.BLIND:
+                type = "blind"
+            return Via(
+                type=type,
+                locked=bool(flags & self.LOCKED),
+                position=start,
+                size=_number(self.widths[index]),
+                drill=_number(self.drills[index]),
+                layers=list(layer),
+                removeUnusedLayers=bool(flags & self.REMOVE_UNUSED_LAYERS),
+                keepEndLayers=bool(flags & self.KEEP_END_LAYERS),
+                free=bool(flags & self.FREE),
+                net=self.nets[index],
+                tstamp=self.tstamps[index],
+            )
+        end = Position(_number(self.endX[index]), _number(self.endY[index]))
+        if kind == self.ARC:
+            return Arc(
+                start=start,
+                mid=Position(_number(self.midX[index]), _number(self.midY[index])),
+                end=end,
+                width=_number(self.widths[index]),
+                layer=layer,
+                locked=bool(flags & self.LOCKED),
+                net=self.nets[index],
+                tstamp=self.tstamps[index],
+            )
+        return Segment(
+            start=start,
+            end=end,
+            width=_number(self.widths[index]),
+            layer=layer,
+            locked=bool(flags & self.LOCKED),
+            net=self.nets[index],
+            tstamp=self.tstamps[index],
+        )
+
+    def __len__(self) -> int:
+        return len(self.tstamps)
+
+    def _view(self, index: int) -> Union[Segment, Arc, Via]:
+        """Get the view of the item at the given non-negative index"""
+        view = self.views.get(index)
+        if view is None:
+            view = new_view(_ITEM_VIEWS[self.kinds[index]], self, index)
+            self.views.add(view)
+        return view
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Trace table index out of range")
+        return self._view(index)
+
+    def __iter__(self) -> Iterator[Union[Segment, Arc, Via]]:
+        index = 0
+        while index < len(self.tstamps):
+            yield self._view(index)
+            index += 1
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            items = [self._build(position) for position in range(len(self))]
+            items[index] = value
+            self.clear()
+            self.extend(items)
+            return
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Trace table index out of range")
+        row = self._object_row(value)
+        self.views.remove(index)
+        self._set_row(index, row)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            for position in sorted(range(*index.indices(len(self))), reverse=True):
+                del self[position]
+            return
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Trace table index out of range")
+        self.views.remove(index)
+        for name in self.COLUMNS:
+            del getattr(self, name)[index]
+        del self.tstamps[index]
+        self.views.shift(index + 1, -1)
+
+    def insert(self, index: int, value):
+        """Insert a segment, arc or via before the given index
+
+        Args:
+            - index (int): The index
+            - value (Union[Segment, Arc, Via]): The item
+        """
+        length = len(self)
+        if index < 0:
+            index = max(0, index + length)
+        index = min(index, length)
+        self._insert_row(index, self._object_row(value))
+        if index < length and self.views:
+            self.views.shift(index, 1)
+
+    def clear(self):
+        """Remove all items"""
+        self.views.clear()
+        for name in self.COLUMNS:
+            del getattr(self, name)[:]
+        self.tstamps.clear()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (TraceTable, list)):
+            if len(self) != len(other):
+                return False
+            if isinstance(other, TraceTable):
+                other = map(other._build, range(len(other)))
+            return all(self._build(index) == item for index, item in enumerate(other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"TraceTable({len(self)} items)"
+
+    def column(self, name: str):
+        """Get a copy of a column
+
+        Args:
+            - name (str): Name of the column (see ``COLUMNS``), e.g. ``nets``
+
+        Returns:
+            - The column as ``numpy.ndarray`` if NumPy is installed, as ``array.array`` otherwise
+        """
+        values = getattr(self, name)
+        numpy = _numpy()
+        if numpy is None:
+            return array(values.typecode, values)
+        return numpy.frombuffer(values, dtype=values.typecode).copy()
+
+    def where(
+        self,
+        net: Optional[int] = None,
+        layer: Optional[str] = None,
+        kind: Optional[int] = None,
+    ) -> List[int]:
+        """Find the items matching all given conditions
+
+        Args:
+            - net (int, optional): Net ordinal number of the items. Defaults to None (any net).
+            - layer (str, optional): Layer of the segments and arcs or one of the layers of the
+                                     vias. Defaults to None (any layer).
+            - kind (int, optional): ``SEGMENT``, ``ARC`` or ``VIA``. Defaults to None (any kind).
+
+        Returns:
+            - List[int]: Indices of the matching items in ascending order
+        """
+        return list(self._where(net, layer, kind))
+
+    def _where(
+        self, net: Optional[int], layer: Optional[str], kind: Optional[int]
+    ) -> Sequence[int]:
+        """Find the items matching all given conditions (see ``where()``) as ``range`` if all
+        items match, so that ``select()`` can copy whole columns"""
+        layerIds = None
+        if layer is not None:
+            layerIds = [
+                layerId
+                for layerId, value in enumerate(self.layers)
+                if value == layer or (isinstance(value, tuple) and layer in value)
+            ]
+        numpy = _numpy()
+        if numpy is None:
+            conditions = []
+            if net is not None:
+                conditions.append((self.nets, (net,)))
+            if layerIds is not None:
+                conditions.append((self.layerIds, layerIds))
+            if kind is not None:
+                conditions.append((self.kinds, (kind,)))
+            if not conditions:
+                return range(len(self))
+            indices = _find(*conditions[0])
+            for column, values in conditions[1:]:
+                values = set(values)
+                indices = [index for index in indices if column[index] in values]
+            return indices
+
+        mask = numpy.ones(len(self), dtype=bool)
+        if net is not None:
+            mask &= numpy.frombuffer(self.nets, dtype=self.nets.typecode) == net
+        if kind is not None:
+            mask &= numpy.frombuffer(self.kinds, dtype=self.kinds.typecode) == kind
+        if layerIds is not None:
+            values = numpy.frombuffer(self.layerIds, dtype=self.layerIds.typecode)
+            if len(layerIds) == 1:
+                mask &= values == layerIds[0]
+            else:
+                mask &= numpy.isin(values, layerIds)
+        if mask.all():
+            return range(len(self))
+        return numpy.flatnonzero(mask).tolist()
+
+    def select(self, indices: Iterable[int]) -> TraceTable:
+        """Create a table of copies of the items at the given indices. Ranges of consecutive
+        indices are copied as slices of the columns.
+
+        Args:
+            - indices (Iterable[int]): Indices of the items in ascending order
+
+        Returns:
+            - TraceTable: The new table
+        """
+        if not isinstance(indices, range):
+            indices = list(indices)
+        runs = _runs(indices)
+        numpy = _numpy()
+        if runs is not None and len(runs) == 1:
+            start, stop = runs[0]
+
+            def getter(column):
+                return column[start:stop]
+
+        elif runs is not None:
+
+            def getter(column):
+                values = column[0:0]
+                for start, stop in runs:
+                    values += column[start:stop]
+                return values
+
+        elif numpy is not None:
+            taken = numpy.array(indices, dtype=numpy.intp)
+
+            def getter(column):
+                if isinstance(column, list):
+                    return [column[index] for index in indices]
+                values = array(column.typecode)
+                values.frombytes(
+                    numpy.frombuffer(column, dtype=column.typecode)
+                    .take(taken)
+                    .tobytes()
+                )
+                return values
+
+        elif len(indices) > 1:
+            item = itemgetter(*indices)
+
+            def getter(column):
+                if isinstance(column, list):
+                    return list(item(column))
+                return array(column.typecode, item(column))
+
+        else:
+
+            def getter(column):
+                values = column[0:0]
+                values.extend(column[index] for index in indices)
+                return values
+
+        table = TraceTable()
+        for name in self.COLUMNS:
+            setattr(table, name, getter(getattr(self, name)))
+        table.tstamps = getter(self.tstamps)
+        table.layers = list(self.layers)
+        table.layerIndex = dict(self.layerIndex)
+        return table
+
+    def filter_by_net(self, net: int) -> TraceTable:
+        """Create a table of the items of the given net
+
+        Args:
+            - net (int): Net ordinal number
+
+        Returns:
+            - TraceTable: The new table
+        """
+        return self.select(self._where(net, None, None))
+
+    def filter_by_layer(self, layer: str) -> TraceTable:
+        """Create a table of the items on the given layer. Vias are included if one of their
+        layers is the given layer.
+
+        Args:
+            - layer (str): Name of the layer, e.g. ``F.Cu``
+
+        Returns:
+            - TraceTable: The new table
+        """
+        return self.select(self._where(None, layer, None))
+
+    def write_sexpr(self, stream, indent: int = 2):
+        """Write the S-Expressions of all items to the given stream, one per line, directly from
+        the columns
+
+        Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
+            - indent (int): Number of whitespaces used to indent each item. Defaults to 2.
+        """
+        write = stream_writer(stream)
+        indents = " " * indent
+        layers = [
+            (
+                "".join(f' "{dequote(name)}"' for name in layer)
+                if isinstance(layer, tuple)
+                else dequote(layer)
+            )
+            for layer in self.layers
+        ]
+        for index in range(len(self)):
+            kind = self.kinds[index]
+            flags = self.flags[index]
+            locked = " locked" if flags & self.LOCKED else ""
+            tstamp = self.tstamps[index]
+            start = f"{_number(self.startX[index])} {_number(self.startY[index])}"
+            width = _number(self.widths[index])
+            net = self.nets[index]
+            if kind == self.VIA:
+                type = ""
+                if flags & self.MICRO:
+                    type = " micro"
+                elif flags & self.BLIND:
+                    type = " blind"
+                rum = (
+                    " (remove_unused_layers)"
+                    if flags & self.REMOVE_UNUSED_LAYERS
+                    else ""
+                )
+                kel = " (keep_end_layers)" if flags & self.KEEP_END_LAYERS else ""
+                free = " (free)" if flags & self.FREE else ""
+                tstamp = f" (tstamp {tstamp})" if tstamp is not None else ""
+                write(
+                    f"{indents}(via{type}{locked} (at {start}) (size {width}) "
+                    f"(drill {_number(self.drills[index])}) "
+                    f"(layers{layers[self.layerIds[index]]}){rum}{kel}{free} "
+                    f"(net {net}){tstamp})\n"
+                )
+                continue
+            end = f"{_number(self.endX[index])} {_number(self.endY[index])}"
+            layer = layers[self.layerIds[index]]
+            if kind == self.ARC:
+                tstamp = f" (tstamp {tstamp})" if tstamp is not None else ""
+                write(
+                    f"{indents}(arc{locked} (start {start}) "
+                    f"(mid {_number(self.midX[index])} {_number(self.midY[index])}) "
+                    f'(end {end}) (width {width}) (layer "{layer}") '
+                    f"(net {net}){tstamp})\n"
+                )
+            else:
+                write(
+                    f"{indents}(segment{locked} (start {start}) (end {end}) "
+                    f'(width {width}) (layer "{layer}") (net {net}) (tstamp {tstamp}))\n'
+                )
+
+    def to_sexpr(self, indent: int = 2) -> str:
+        """Generate the S-Expressions of all items, one per line
+
+        Args:
+            - indent (int): Number of whitespaces used to indent each item. Defaults to 2.
+
+        Returns:
+            - str: S-Expressions of the items
+        """
+        buffer = []
+        self.write_sexpr(buffer, indent)
+        return "".join(buffer)
@@ -17,14 +17,24 @@ Documentation taken from:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from array import array
+from collections.abc import MutableSequence
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional
 
+from kiutils.utils.construct import fill_defaults, new_object
+from kiutils.utils.flyweight import shareable
+from kiutils.utils.sexpr import Number
+from kiutils.utils.slots import slotted
 from kiutils.utils.strings import dequote
+from kiutils.utils.views import ViewRegistry, new_view, view_class
+from kiutils.utils.writer import SexprWritable, stream_writer
 
 
+@slotted
 @dataclass
-class Position:
+class Position(SexprWritable):
     """The ``position`` token defines the positional coordinates and rotation of an object.
 
     Documentation:
@@ -71,7 +81,7 @@ class Position:
             if exp[3] != "unlocked":
                 object.angle = exp[3]
 
-        for item in exp:
+        for item in exp[3:]:
             if item == "unlocked":
                 object.unlocked = True
 
@@ -84,8 +94,9 @@ class Position:
         )
 
 
+@slotted
 @dataclass
-class Coordinate:
+class Coordinate(SexprWritable):
     """The ``coordinate`` token defines a three-dimentional position"""
 
     X: float = 0.0
@@ -138,8 +149,304 @@ class Coordinate:
         return f"{indents}(xyz {self.X} {self.Y} {self.Z}){endline}"
 
 
+@lru_cache(maxsize=None)
+def _numpy():
+    """Get the optional ``numpy`` module or None, if it is not installed. The result is cached,
+    as failed imports are not."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _number(value: float):
+    """Convert a value of a float column back to ``int`` or ``float`` like the parser does"""
+    return int(value) if value.is_integer() else value
+
+
+def _lexeme(value):
+    """Get the number of a coordinate to keep in ``PositionArray.lexemes``, if it is an exact
+    number"""
+    return value if type(value) is Number else None
+
+
+def _load_point(view: Position, name: str):
+    """Read a field of a point taken from a ``PositionArray`` from the array"""
+    if name == "X":
+        return view.owner._coordinate(2 * view.index)
+    if name == "Y":
+        return view.owner._coordinate(2 * view.index + 1)
+    return None if name == "angle" else False
+
+
+def _store_point(view: Position, name: str, value):
+    """Write a changed coordinate of a point taken from a ``PositionArray`` to the array"""
+    if name not in ("X", "Y"):
+        raise Exception("Position arrays only store the X and Y coordinates of points")
+    points = view.owner
+    index = 2 * view.index + (name == "Y")
+    points.values[index] = float(value)
+    if points.lexemes is not None:
+        points.lexemes[index] = _lexeme(value)
+
+
+def _build_point(view: Position) -> Position:
+    """Create a position object of a point taken from a ``PositionArray``"""
+    return view.owner._item(view.index)
+
+
+_POINT_VIEW = view_class(Position, _load_point, _store_point, _build_point)
+"""View class of the points of ``PositionArray``"""
+
+
+class PositionArray(MutableSequence):
+    """List of X/Y positions whose coordinates are stored in one ``array.array`` of doubles
+    (``X0, Y0, X1, Y1, ...``) instead of one ``Position`` object per point, which needs a
+    fraction of the memory and is faster to load and write. Used for the points of zone fills
+    (``FilledPolygon.coordinates``), which often have millions of points.
+
+    The array behaves like a list of ``Position`` objects. Accessing a point returns a view of it
+    (see ``kiutils.utils.views``), which reads its ``X`` and ``Y`` from the array and writes
+    changes through to it. Views are only kept as long as they are referenced, and positions
+    added to the array are copied into it. Only ``X`` and ``Y`` of the positions are stored.
+
+    Arrays of files loaded with ``exact=True`` keep the exact numbers (``sexpr.Number``) of the
+    coordinates in ``lexemes`` as well, so that coordinates that were not changed are written
+    exactly as they were read.
+    """
+
+    def __init__(self, positions: Iterable[Position] = ()):
+        """Create the array
+
+        Args:
+            - positions (Iterable[Position]): Positions to add. Defaults to an empty tuple.
+        """
+        self.values = array("d")
+        """The X and Y coordinates of all points, one after the other"""
+        self.lexemes: Optional[List[Optional[Number]]] = None
+        """The exact numbers of the coordinates in the order of ``values`` (None for coordinates
+        that were changed or are no exact numbers) or None, if the array holds no exact
+        numbers"""
+        self.views = ViewRegistry()
+        """Views of the points that are still referenced, by their index"""
+        self.extend(positions)
+
+    @classmethod
+    def from_sexpr(cls, exp: list) -> PositionArray:
+        """Convert the given S-Expression into a PositionArray object. Exact numbers (parsed with
+        ``exact=True``) are kept in ``lexemes``.
+
+        Args:
+            - exp (list): Part of parsed S-Expression ``(pts (xy ...) ...)``
+
+        Raises:
+            - Exception: When given parameter's type is not a list
+            - Exception: When the first item of the list is not pts
+
+        Returns:
+            - PositionArray: Object of the class initialized with the given S-Expression
+        """
+        if not isinstance(exp, list) or not exp or exp[0] != "pts":
+            raise Exception("Expression does not have the correct type")
+
+        object = cls()
+        points = exp[1:]
+        if set(map(len, points)) <= {3}:
+            values = [value for point in points for value in (point[1], point[2])]
+            types = set(map(type, values))
+            if types <= {int, float}:
+                object.values = array("d", values)
+                return object
+            if types == {Number}:
+                # float() of the plain string is a lot faster than Number.__float__()
+                object.values = array("d", map(float, map(str.__str__, values)))
+                object.lexemes = values
+                return object
+        object.extend(map(Position.from_sexpr, points))
+        return object
+
+    def _coordinate(self, index: int):
+        """Get the coordinate at the given index of ``values`` as the parser returns it"""
+        if self.lexemes is not None:
+            lexeme = self.lexemes[index]
+            if lexeme is not None:
+                return lexeme
+        return _number(self.values[index])
+
+    def _item(self, index: int) -> Position:
+        """Build a new position object of the point at the given index"""
+        return Position(self._coordinate(2 * index), self._coordinate(2 * index + 1))
+
+    def _index(self, index: int) -> int:
+        """Get the non-negative form of the given index"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Position array index out of range")
+        return index
+
+    def _view(self, index: int) -> Position:
+        """Get the view of the point at the given non-negative index"""
+        view = self.views.get(index)
+        if view is None:
+            view = new_view(_POINT_VIEW, self, index)
+            self.views.add(view)
+        return view
+
+    def __len__(self) -> int:
+        return len(self.values) // 2
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        return self._view(self._index(index))
+
+    def __iter__(self) -> Iterator[Position]:
+        index = 0
+        while index < len(self.values) // 2:
+            yield self._view(index)
+            index += 1
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            items = [self._item(position) for position in range(len(self))]
+            items[index] = value
+            self.clear()
+            self.extend(items)
+            return
+        index = self._index(index)
+        self.views.remove(index)
+        self.values[2 * index : 2 * index + 2] = array(
+            "d", (float(value.X), float(value.Y))
+        )
+        if self.lexemes is not None:
+            self.lexemes[2 * index : 2 * index + 2] = map(_lexeme, (value.X, value.Y))
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            for position in sorted(range(*index.indices(len(self))), reverse=True):
+                del self[position]
+            return
+        index = self._index(index)
+        self.views.remove(index)
+        del self.values[2 * index : 2 * index + 2]
+        if self.lexemes is not None:
+            del self.lexemes[2 * index : 2 * index + 2]
+        self.views.shift(index + 1, -1)
+
+    def insert(self, index: int, value: Position):
+        """Insert a position before the given index
+
+        Args:
+            - index (int): The index
+            - value (Position): The position
+        """
+        length = len(self)
+        if index < 0:
+            index = max(0, index + length)
+        index = min(index, length)
+        self.values[2 * index : 2 * index] = array(
+            "d", (float(value.X), float(value.Y))
+        )
+        if self.lexemes is not None:
+            self.lexemes[2 * index : 2 * index] = map(_lexeme, (value.X, value.Y))
+        if index < length and self.views:
+            self.views.shift(index, 1)
+
+    def extend(self, values: Iterable[Position]):
+        """Add the given positions to the end of the array
+
+        Args:
+            - values (Iterable[Position]): The positions
+        """
+        coordinates = [coordinate for item in values for coordinate in (item.X, item.Y)]
+        if self.lexemes is None and Number in set(map(type, coordinates)):
+            self.lexemes = [None] * len(self.values)
+        if self.lexemes is not None:
+            self.lexemes.extend(map(_lexeme, coordinates))
+        self.values.extend(map(float, coordinates))
+
+    def clear(self):
+        """Remove all points"""
+        self.views.clear()
+        del self.values[:]
+        self.lexemes = None
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PositionArray):
+            return self.values == other.values
+        if isinstance(other, list):
+            if len(self) != len(other):
+                return False
+            return all(self._item(index) == item for index, item in enumerate(other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        # Same as the list of positions it replaces
+        return repr([self._item(index) for index in range(len(self))])
+
+    def xy(self):
+        """Get a copy of the coordinates of all points, one after the other
+        (``X0, Y0, X1, Y1, ...``)
+
+        Returns:
+            - The coordinates as one-dimensional ``numpy.ndarray`` if NumPy is installed, as
+              ``array.array`` otherwise
+        """
+        numpy = _numpy()
+        if numpy is None:
+            return array("d", self.values)
+        return numpy.frombuffer(self.values, dtype="d").copy()
+
+    def xy2d(self):
+        """Get a copy of the coordinates of all points as pairs of X and Y
+
+        Returns:
+            - The coordinates as ``numpy.ndarray`` of shape ``(n, 2)`` if NumPy is installed, as
+              list of ``(X, Y)`` tuples otherwise
+        """
+        values = self.xy()
+        if isinstance(values, array):
+            values = iter(values)
+            return list(zip(values, values))
+        return values.reshape(-1, 2)
+
+    def write_sexpr(self, stream, indent: int = 0):
+        """Write the ``(xy ...)`` S-Expressions of all points to the given stream, one per line.
+        The points are formatted in one batch directly from ``values``.
+
+        Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
+            - indent (int): Number of whitespaces used to indent each point. Defaults to 0.
+        """
+        line = " " * indent + "(xy %s %s)\n"
+        values = self.values
+        if self.lexemes is not None:
+            values = map(self._coordinate, range(len(values)))
+        elif any(map(float.is_integer, values)):
+            values = map(_number, values)
+        values = iter(values)
+        stream_writer(stream)("".join(map(line.__mod__, zip(values, values))))
+
+    def to_sexpr(self, indent: int = 0) -> str:
+        """Generate the ``(xy ...)`` S-Expressions of all points, one per line
+
+        Args:
+            - indent (int): Number of whitespaces used to indent each point. Defaults to 0.
+
+        Returns:
+            - str: S-Expressions of the points
+        """
+        buffer = []
+        self.write_sexpr(buffer, indent)
+        return "".join(buffer)
+
+
 @dataclass
-class ColorRGBA:
+class ColorRGBA(SexprWritable):
     """The ``color`` token defines a RGBA color"""
 
     R: int = 0
@@ -206,8 +513,9 @@ class ColorRGBA:
         return f"{indents}(color {self.R} {self.G} {self.B} {alpha}){endline}"
 
 
+@slotted
 @dataclass
-class Stroke:
+class Stroke(SexprWritable):
     """The ``stroke`` token defines how the outlines of graphical objects are drawn.
 
     Documentation:
@@ -228,6 +536,7 @@ class Stroke:
     Defaults to ``None`` and was made optional since KiCad 7."""
 
     @classmethod
+    @shareable
     def from_sexpr(cls, exp: list) -> Stroke:
         """Convert the given S-Expresstion into a Stroke object
 
@@ -277,7 +586,7 @@ class Stroke:
 
 
 @dataclass
-class Font:
+class Font(SexprWritable):
     """The ``font`` token attributes define how text is shown.
 
     Documentation:
@@ -385,7 +694,7 @@ class Font:
 
 
 @dataclass
-class Justify:
+class Justify(SexprWritable):
     """The ``justify`` token defines the justification of a text object
 
     Documentation:
@@ -464,7 +773,7 @@ class Justify:
 
 
 @dataclass
-class Effects:
+class Effects(SexprWritable):
     """All text objects can have an optional effects section that defines how the text is displayed.
 
     Documentation:
@@ -486,6 +795,7 @@ class Effects:
     Available since KiCad v7"""
 
     @classmethod
+    @shareable
     def from_sexpr(cls, exp: list) -> Effects:
         """Convert the given S-Expresstion into a Effects object
 
@@ -505,7 +815,7 @@ class Effects:
         if exp[0] != "effects":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if not isinstance(item, list):
                 if item == "hide":
@@ -513,15 +823,15 @@ class Effects:
                 else:
                     continue
             if item[0] == "font":
-                object.font = Font().from_sexpr(item)
+                object.font = Font.from_sexpr(item)
             if item[0] == "justify":
-                object.justify = Justify().from_sexpr(item)
+                object.justify = Justify.from_sexpr(item)
             if item[0] == "href":
                 object.href = item[1]
             if item[0] == "hide":
                 # v9 format: (hide yes) or (hide no)
                 object.hide = item[1] == "yes" if len(item) > 1 else True
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=0, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -546,8 +856,9 @@ class Effects:
         return expression
 
 
+@slotted
 @dataclass
-class Net:
+class Net(SexprWritable):
     """The ``net`` token defines the number and name of a net"""
 
     number: int = 0
@@ -598,7 +909,7 @@ class Net:
 
 
 @dataclass
-class Group:
+class Group(SexprWritable):
     """The ``group`` token defines a group of items.
 
     Documentation:
@@ -676,7 +987,7 @@ class Group:
 
 
 @dataclass
-class PageSettings:
+class PageSettings(SexprWritable):
     """The ``paper`` token defines the drawing page size and orientation.
 
     Documentation:
@@ -764,7 +1075,7 @@ class PageSettings:
 
 
 @dataclass
-class TitleBlock:
+class TitleBlock(SexprWritable):
     """The ``title_block`` token defines the contents of the title block.
 
     Documentation:
@@ -854,7 +1165,7 @@ class TitleBlock:
 
 
 @dataclass
-class Property:
+class Property(SexprWritable):
     """The ``property`` token defines a symbol property when used inside a ``symbol`` definition.
 
     Documentation:
@@ -905,19 +1216,19 @@ class Property:
         if exp[0] != "property":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.key = exp[1]
         object.value = exp[2]
         for item in exp[3:]:
             if item[0] == "id":
                 object.id = item[1]
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "effects":
-                object.effects = Effects().from_sexpr(item)
+                object.effects = Effects.from_sexpr(item)
             if item[0] == "show_name":
                 object.showName = True
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 4, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -946,7 +1257,7 @@ class Property:
 
 
 @dataclass
-class RenderCachePolygon:
+class RenderCachePolygon(SexprWritable):
     """A polygon used by the ``render_cache`` token
 
     Used since KiCad v7
@@ -1012,7 +1323,7 @@ class RenderCachePolygon:
 
 
 @dataclass
-class RenderCache:
+class RenderCache(SexprWritable):
     """The ``render_cache`` token defines a cache for none-standard fonts.
 
     Used since KiCad v7
@@ -1079,7 +1390,7 @@ class RenderCache:
 
 
 @dataclass
-class Fill:
+class Fill(SexprWritable):
     """The ``fill`` token defines how schematic and symbol graphical items are filled
 
     Documentation:
@@ -1123,7 +1434,7 @@ class Fill:
             if item[0] == "type":
                 object.type = item[1]
             if item[0] == "color":
-                object.color = ColorRGBA().from_sexpr(item)
+                object.color = ColorRGBA.from_sexpr(item)
         return object
 
     def to_sexpr(self, indent: int = 4, newline: bool = True) -> str:
@@ -1145,7 +1456,7 @@ class Fill:
 
 
 @dataclass
-class Image:
+class Image(SexprWritable):
     """The ``image`` token defines an image embedded into the file
 
     Documentation:
@@ -1189,10 +1500,10 @@ class Image:
         if exp[0] != "image":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "scale":
                 object.scale = item[1]
             if item[0] == "uuid":
@@ -1202,7 +1513,7 @@ class Image:
             if item[0] == "data":
                 for b64part in item[1:]:
                     object.data.append(b64part)
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -1234,7 +1545,7 @@ class Image:
 
 
 @dataclass
-class ProjectInstance(ABC):
+class ProjectInstance(SexprWritable, ABC):
     """The ``instances`` token defines a project instance and serves as an abstract base class for
     symbol and hierarchical sheet project instances.
 
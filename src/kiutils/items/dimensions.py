@@ -21,11 +21,13 @@ from typing import List, Optional
 
 from kiutils.items.common import Position
 from kiutils.items.gritems import GrText
+from kiutils.utils.construct import fill_defaults, new_object
 from kiutils.utils.strings import dequote
+from kiutils.utils.writer import SexprWritable
 
 
 @dataclass
-class DimensionFormat:
+class DimensionFormat(SexprWritable):
     """The ``format`` token defines the text formatting of a dimension
 
     Documentation:
@@ -135,7 +137,7 @@ class DimensionFormat:
 
 
 @dataclass
-class DimensionStyle:
+class DimensionStyle(SexprWritable):
     """The ``style`` token defines the style of a dimension
 
     Documentation:
@@ -249,7 +251,7 @@ class DimensionStyle:
 
 
 @dataclass
-class Dimension:
+class Dimension(SexprWritable):
     """The ``dimension`` token defines a dimension in the PCB
 
     Documentation:
@@ -314,7 +316,7 @@ class Dimension:
         if exp[0] != "dimension":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp[1:]:
             if not isinstance(item, list):
                 if item == "locked":
@@ -333,16 +335,16 @@ class Dimension:
             if item[0] == "leader_length":
                 object.leaderLength = item[1]
             if item[0] == "gr_text":
-                object.grText = GrText().from_sexpr(item)
+                object.grText = GrText.from_sexpr(item)
             if item[0] == "format":
-                object.format = DimensionFormat().from_sexpr(item)
+                object.format = DimensionFormat.from_sexpr(item)
             if item[0] == "style":
-                object.style = DimensionStyle().from_sexpr(item)
+                object.style = DimensionStyle.from_sexpr(item)
             if item[0] == "pts":
                 for point in item[1:]:
-                    object.pts.append(Position().from_sexpr(point))
+                    object.pts.append(Position.from_sexpr(point))
 
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
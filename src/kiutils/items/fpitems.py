@@ -21,14 +21,17 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 from kiutils.items.common import Effects, Position, RenderCache, Stroke
+from kiutils.utils.construct import fill_defaults, new_object
+from kiutils.utils.flyweight import shared
 from kiutils.utils.strings import dequote
+from kiutils.utils.writer import SexprWritable
 
 # FIXME: Several classes have a ``stroke`` member. This feature will be introduced in KiCad 7 and
 #        has yet to be tested here.
 
 
 @dataclass
-class FpText:
+class FpText(SexprWritable):
     """The ``fp_text`` token defines a graphic line in a footprint definition.
 
     Documentation:
@@ -88,7 +91,7 @@ class FpText:
         if exp[0] != "fp_text":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.type = exp[1]
         object.text = exp[2]
         for item in exp[3:]:
@@ -97,19 +100,19 @@ class FpText:
                     object.hide = True
                 continue
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = shared(Position, item)
             if item[0] == "layer":
                 object.layer = item[1]
                 if len(item) > 2:
                     if item[2] == "knockout":
                         object.knockout = True
             if item[0] == "effects":
-                object.effects = Effects().from_sexpr(item)
+                object.effects = Effects.from_sexpr(item)
             if item[0] == "tstamp":
                 object.tstamp = item[1]
             if item[0] == "render_cache":
                 object.renderCache = RenderCache.from_sexpr(item)
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -140,7 +143,7 @@ class FpText:
 
 
 @dataclass
-class FpLine:
+class FpLine(SexprWritable):
     """The ``fp_line`` token defines a graphic line in a footprint definition.
 
     Documentation:
@@ -190,7 +193,7 @@ class FpLine:
         if exp[0] != "fp_line":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if not isinstance(item, list):
                 if item == "locked":
@@ -199,9 +202,9 @@ class FpLine:
                     continue
 
             if item[0] == "start":
-                object.start = Position.from_sexpr(item)
+                object.start = shared(Position, item)
             if item[0] == "end":
-                object.end = Position.from_sexpr(item)
+                object.end = shared(Position, item)
             if item[0] == "layer":
                 object.layer = item[1]
             if item[0] == "tstamp":
@@ -213,7 +216,7 @@ class FpLine:
                 object.stroke = Stroke.from_sexpr(item)
                 object.width = None
 
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -239,7 +242,7 @@ class FpLine:
 
 
 @dataclass
-class FpRect:
+class FpRect(SexprWritable):
     """The ``fp_rect`` token defines a graphic rectangle in a footprint definition.
 
     Documentation:
@@ -291,7 +294,7 @@ class FpRect:
         if exp[0] != "fp_rect":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if not isinstance(item, list):
                 if item == "locked":
@@ -300,9 +303,9 @@ class FpRect:
                     continue
 
             if item[0] == "start":
-                object.start = Position.from_sexpr(item)
+                object.start = shared(Position, item)
             if item[0] == "end":
-                object.end = Position.from_sexpr(item)
+                object.end = shared(Position, item)
             if item[0] == "layer":
                 object.layer = item[1]
             if item[0] == "tstamp":
@@ -316,7 +319,7 @@ class FpRect:
                 object.stroke = Stroke.from_sexpr(item)
                 object.width = None
 
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -346,7 +349,7 @@ class FpRect:
 
 
 @dataclass
-class FpTextBox:
+class FpTextBox(SexprWritable):
     """The ``fp_text_box`` token defines a rectangle containing line-wrapped text.
 
     Available since KiCad v7
@@ -432,12 +435,12 @@ class FpTextBox:
 
         for item in exp[start_at:]:
             if item[0] == "start":
-                object.start = Position.from_sexpr(item)
+                object.start = shared(Position, item)
             if item[0] == "end":
-                object.end = Position.from_sexpr(item)
+                object.end = shared(Position, item)
             if item[0] == "pts":
                 for point in item[1:]:
-                    object.pts.append(Position().from_sexpr(point))
+                    object.pts.append(shared(Position, point))
             if item[0] == "angle":
                 object.angle = item[1]
             if item[0] == "layer":
@@ -510,7 +513,7 @@ class FpTextBox:
 
 
 @dataclass
-class FpCircle:
+class FpCircle(SexprWritable):
     """The ``fp_circle `` token defines a graphic circle in a footprint definition.
 
     Documentation:
@@ -562,7 +565,7 @@ class FpCircle:
         if exp[0] != "fp_circle":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if not isinstance(item, list):
                 if item == "locked":
@@ -571,9 +574,9 @@ class FpCircle:
                     continue
 
             if item[0] == "center":
-                object.center = Position.from_sexpr(item)
+                object.center = shared(Position, item)
             if item[0] == "end":
-                object.end = Position.from_sexpr(item)
+                object.end = shared(Position, item)
             if item[0] == "layer":
                 object.layer = item[1]
             if item[0] == "tstamp":
@@ -587,7 +590,7 @@ class FpCircle:
                 object.stroke = Stroke.from_sexpr(item)
                 object.width = None
 
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -617,7 +620,7 @@ class FpCircle:
 
 
 @dataclass
-class FpArc:
+class FpArc(SexprWritable):
     """The ``fp_arc`` token defines a graphic arc in a footprint definition.
 
     Documentation:
@@ -668,7 +671,7 @@ class FpArc:
         if exp[0] != "fp_arc":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if not isinstance(item, list):
                 if item == "locked":
@@ -677,11 +680,11 @@ class FpArc:
                     continue
 
             if item[0] == "start":
-                object.start = Position.from_sexpr(item)
+                object.start = shared(Position, item)
             if item[0] == "mid":
-                object.mid = Position.from_sexpr(item)
+                object.mid = shared(Position, item)
             if item[0] == "end":
-                object.end = Position.from_sexpr(item)
+                object.end = shared(Position, item)
             if item[0] == "layer":
                 object.layer = item[1]
             if item[0] == "tstamp":
@@ -693,7 +696,7 @@ class FpArc:
                 object.stroke = Stroke.from_sexpr(item)
                 object.width = None
 
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -722,7 +725,7 @@ class FpArc:
 
 
 @dataclass
-class FpPoly:
+class FpPoly(SexprWritable):
     """The ``fp_poly`` token defines a graphic polygon in a footprint definition.
 
     Documentation:
@@ -782,7 +785,7 @@ class FpPoly:
 
             if item[0] == "pts":
                 for point in item[1:]:
-                    object.coordinates.append(Position().from_sexpr(point))
+                    object.coordinates.append(shared(Position, point))
             if item[0] == "layer":
                 object.layer = item[1]
             if item[0] == "tstamp":
@@ -833,7 +836,7 @@ class FpPoly:
 
 
 @dataclass
-class FpCurve:
+class FpCurve(SexprWritable):
     """The ``fp_curve`` token defines a graphic Cubic Bezier curve in a footprint definition.
 
     Documentation:
@@ -888,7 +891,7 @@ class FpCurve:
 
             if item[0] == "pts":
                 for point in item[1:]:
-                    object.coordinates.append(Position().from_sexpr(point))
+                    object.coordinates.append(shared(Position, point))
             if item[0] == "layer":
                 object.layer = item[1]
             if item[0] == "tstamp":
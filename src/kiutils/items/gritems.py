@@ -21,11 +21,13 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 from kiutils.items.common import Effects, Position, RenderCache, Stroke
+from kiutils.utils.construct import fill_defaults, new_object
 from kiutils.utils.strings import dequote
+from kiutils.utils.writer import SexprWritable
 
 
 @dataclass
-class GrText:
+class GrText(SexprWritable):
     """The ``gr_text`` token defines a graphical text.
 
     Documentation:
@@ -81,7 +83,7 @@ class GrText:
         if exp[0] != "gr_text":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.text = exp[1]
         for item in exp[2:]:
             if not isinstance(item, list):
@@ -89,19 +91,19 @@ class GrText:
                     object.locked = True
                 continue
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "layer":
                 object.layer = item[1]
                 if len(item) > 2:
                     if item[2] == "knockout":
                         object.knockout = True
             if item[0] == "effects":
-                object.effects = Effects().from_sexpr(item)
+                object.effects = Effects.from_sexpr(item)
             if item[0] == "tstamp":
                 object.tstamp = item[1]
             if item[0] == "render_cache":
                 object.renderCache = RenderCache.from_sexpr(item)
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -133,7 +135,7 @@ class GrText:
 
 
 @dataclass
-class GrTextBox:
+class GrTextBox(SexprWritable):
     """The ``gr_text_box`` token defines a graphical rectangle containing line-wrapped text.
 
     Available since KiCad v7
@@ -226,7 +228,7 @@ class GrTextBox:
                 object.end = Position.from_sexpr(item)
             if item[0] == "pts":
                 for point in item[1:]:
-                    object.pts.append(Position().from_sexpr(point))
+                    object.pts.append(Position.from_sexpr(point))
             if item[0] == "angle":
                 object.angle = item[1]
             if item[0] == "layer":
@@ -299,7 +301,7 @@ class GrTextBox:
 
 
 @dataclass
-class GrLine:
+class GrLine(SexprWritable):
     """The ``gr_line`` token defines a graphical line.
 
     Documentation:
@@ -347,7 +349,7 @@ class GrLine:
         if exp[0] != "gr_line":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if not isinstance(item, list):
                 if item == "locked":
@@ -363,7 +365,7 @@ class GrLine:
                 object.tstamp = item[1]
             if item[0] == "width":
                 object.width = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -387,7 +389,7 @@ class GrLine:
 
 
 @dataclass
-class GrRect:
+class GrRect(SexprWritable):
     """The ``gr_rect`` token defines a graphical rectangle.
 
     Documentation:
@@ -435,7 +437,7 @@ class GrRect:
         if exp[0] != "gr_rect":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if not isinstance(item, list):
                 if item == "locked":
@@ -453,7 +455,7 @@ class GrRect:
                 object.fill = item[1]
             if item[0] == "width":
                 object.width = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -477,7 +479,7 @@ class GrRect:
 
 
 @dataclass
-class GrCircle:
+class GrCircle(SexprWritable):
     """The ``gr_circle `` token defines a graphical circle.
 
     Documentation:
@@ -525,7 +527,7 @@ class GrCircle:
         if exp[0] != "gr_circle":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if not isinstance(item, list):
                 if item == "locked":
@@ -544,7 +546,7 @@ class GrCircle:
             if item[0] == "width":
                 object.width = item[1]
 
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -568,7 +570,7 @@ class GrCircle:
 
 
 @dataclass
-class GrArc:
+class GrArc(SexprWritable):
     """The ``gr_arc`` token defines a graphic arc.
 
     Documentation:
@@ -616,7 +618,7 @@ class GrArc:
         if exp[0] != "gr_arc":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if not isinstance(item, list):
                 if item == "locked":
@@ -635,7 +637,7 @@ class GrArc:
             if item[0] == "width":
                 object.width = item[1]
 
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -658,7 +660,7 @@ class GrArc:
 
 
 @dataclass
-class GrPoly:
+class GrPoly(SexprWritable):
     """The ``gr_poly`` token defines a graphic polygon in a footprint definition.
 
     Documentation:
@@ -712,7 +714,7 @@ class GrPoly:
                 continue
             if item[0] == "pts":
                 for point in item[1:]:
-                    object.coordinates.append(Position().from_sexpr(point))
+                    object.coordinates.append(Position.from_sexpr(point))
             if item[0] == "layer":
                 object.layer = item[1]
             if item[0] == "tstamp":
@@ -765,7 +767,7 @@ class GrPoly:
 
 
 @dataclass
-class GrCurve:
+class GrCurve(SexprWritable):
     """The ``gr_curve`` token defines a graphic Cubic Bezier curve in a footprint definition.
 
     Documentation:
@@ -815,7 +817,7 @@ class GrCurve:
                 continue
             if item[0] == "pts":
                 for point in item[1:]:
-                    object.coordinates.append(Position().from_sexpr(point))
+                    object.coordinates.append(Position.from_sexpr(point))
             if item[0] == "layer":
                 object.layer = item[1]
             if item[0] == "tstamp":
@@ -28,11 +28,13 @@ from kiutils.items.common import (
     Property,
     Stroke,
 )
+from kiutils.utils.construct import fill_defaults, new_object
 from kiutils.utils.strings import dequote
+from kiutils.utils.writer import SexprWritable
 
 
 @dataclass
-class Junction:
+class Junction(SexprWritable):
     """The ``junction`` token defines a junction in the schematic
 
     Documentation:
@@ -73,17 +75,17 @@ class Junction:
         if exp[0] != "junction":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "color":
-                object.color = ColorRGBA().from_sexpr(item)
+                object.color = ColorRGBA.from_sexpr(item)
             if item[0] == "diameter":
                 object.color = item[1]
             if item[0] == "uuid":
                 object.uuid = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -103,7 +105,7 @@ class Junction:
 
 
 @dataclass
-class NoConnect:
+class NoConnect(SexprWritable):
     """The ``no_connect`` token defines a unused pin connection in the schematic
 
     Documentation:
@@ -136,13 +138,13 @@ class NoConnect:
         if exp[0] != "no_connect":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "uuid":
                 object.uuid = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -162,7 +164,7 @@ class NoConnect:
 
 
 @dataclass
-class BusEntry:
+class BusEntry(SexprWritable):
     """The ``bus_entry`` token defines a bus entry in the schematic
 
     Documentation:
@@ -204,17 +206,17 @@ class BusEntry:
         if exp[0] != "bus_entry":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "size":
-                object.size = Position().from_sexpr(item)
+                object.size = Position.from_sexpr(item)
             if item[0] == "uuid":
                 object.uuid = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -238,7 +240,7 @@ class BusEntry:
 
 
 @dataclass
-class BusAlias:
+class BusAlias(SexprWritable):
     """The ``bus_alias`` token defines a bus entry in the schematic
 
     Documentation:
@@ -306,7 +308,7 @@ class BusAlias:
 
 
 @dataclass
-class Connection:
+class Connection(SexprWritable):
     """The ``wire`` and ``bus`` tokens define wires and buses in the schematic
 
     Documentation:
@@ -346,17 +348,17 @@ class Connection:
         if not (exp[0] == "wire" or exp[0] == "bus"):
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.type = exp[0]
         for item in exp:
             if item[0] == "pts":
                 for point in item[1:]:
-                    object.points.append(Position().from_sexpr(point))
+                    object.points.append(Position.from_sexpr(point))
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "uuid":
                 object.uuid = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -384,7 +386,7 @@ class Connection:
 
 
 @dataclass
-class PolyLine:
+class PolyLine(SexprWritable):
     """The ``polyline`` token defines one or more lines that may or may not represent a polygon
 
     Documentation:
@@ -421,16 +423,16 @@ class PolyLine:
         if exp[0] != "polyline":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if item[0] == "pts":
                 for point in item[1:]:
-                    object.points.append(Position().from_sexpr(point))
+                    object.points.append(Position.from_sexpr(point))
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "uuid":
                 object.uuid = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -458,7 +460,7 @@ class PolyLine:
 
 
 @dataclass
-class Text:
+class Text(SexprWritable):
     """The ``text`` token defines graphical text in a schematic
 
     Documentation:
@@ -497,16 +499,16 @@ class Text:
         if exp[0] != "text":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.text = exp[1]
         for item in exp[2:]:
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "effects":
-                object.effects = Effects().from_sexpr(item)
+                object.effects = Effects.from_sexpr(item)
             if item[0] == "uuid":
                 object.uuid = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -539,7 +541,7 @@ class Text:
 
 
 @dataclass
-class TextBox:
+class TextBox(SexprWritable):
     """The ``text_box`` token defines a text box inside a schematic
 
     Available since KiCad v7
@@ -589,22 +591,22 @@ class TextBox:
         if exp[0] != "text_box":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.text = exp[1]
         for item in exp[2:]:
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "size":
-                object.size = Position().from_sexpr(item)
+                object.size = Position.from_sexpr(item)
             if item[0] == "effects":
-                object.effects = Effects().from_sexpr(item)
+                object.effects = Effects.from_sexpr(item)
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "fill":
-                object.fill = Fill().from_sexpr(item)
+                object.fill = Fill.from_sexpr(item)
             if item[0] == "uuid":
                 object.uuid = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -633,7 +635,7 @@ class TextBox:
 
 
 @dataclass
-class LocalLabel:
+class LocalLabel(SexprWritable):
     """The ``label`` token defines an wire or bus label name in a schematic
 
     Documentation:
@@ -676,18 +678,18 @@ class LocalLabel:
         if exp[0] != "label":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.text = exp[1]
         for item in exp[2:]:
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "effects":
-                object.effects = Effects().from_sexpr(item)
+                object.effects = Effects.from_sexpr(item)
             if item[0] == "uuid":
                 object.uuid = item[1]
             if item[0] == "fields_autoplaced":
                 object.fieldsAutoplaced = True
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -714,7 +716,7 @@ class LocalLabel:
 
 
 @dataclass
-class GlobalLabel:
+class GlobalLabel(SexprWritable):
     """The ``global_label`` token defines a label name that is visible across all schematics in a design
 
     Documentation:
@@ -765,22 +767,22 @@ class GlobalLabel:
         if exp[0] != "global_label":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.text = exp[1]
         for item in exp[2:]:
             if item[0] == "fields_autoplaced":
                 object.fieldsAutoplaced = True
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "effects":
-                object.effects = Effects().from_sexpr(item)
+                object.effects = Effects.from_sexpr(item)
             if item[0] == "property":
-                object.properties.append(Property().from_sexpr(item))
+                object.properties.append(Property.from_sexpr(item))
             if item[0] == "shape":
                 object.shape = item[1]
             if item[0] == "uuid":
                 object.uuid = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -809,7 +811,7 @@ class GlobalLabel:
 
 
 @dataclass
-class HierarchicalLabel:
+class HierarchicalLabel(SexprWritable):
     """The ``hierarchical_label`` token defines a label that are used by hierarchical sheets to
     define connections between sheet in hierarchical designs
 
@@ -857,20 +859,20 @@ class HierarchicalLabel:
         if exp[0] != "hierarchical_label":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.text = exp[1]
         for item in exp[2:]:
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "effects":
-                object.effects = Effects().from_sexpr(item)
+                object.effects = Effects.from_sexpr(item)
             if item[0] == "shape":
                 object.shape = item[1]
             if item[0] == "uuid":
                 object.uuid = item[1]
             if item[0] == "fields_autoplaced":
                 object.fieldsAutoplaced = True
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -897,7 +899,7 @@ class HierarchicalLabel:
 
 
 @dataclass
-class SymbolProjectPath:
+class SymbolProjectPath(SexprWritable):
     """The symbol project path defines the ``path`` token to the sheet instance of the instance data
     of a symbol.
 
@@ -1030,7 +1032,7 @@ class SymbolProjectInstance(ProjectInstance):
 
 
 @dataclass
-class SchematicSymbol:
+class SchematicSymbol(SexprWritable):
     """The ``symbol`` token in the symbol section of the schematic defines an instance of a symbol
     from the library symbol section of the schematic
 
@@ -1149,7 +1151,7 @@ class SchematicSymbol:
         if exp[0] != "symbol":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp[1:]:
             if item[0] == "fields_autoplaced":
                 object.fieldsAutoplaced = True
@@ -1168,9 +1170,9 @@ class SchematicSymbol:
             if item[0] == "dnp":
                 object.dnp = True if item[1] == "yes" else False
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "property":
-                object.properties.append(Property().from_sexpr(item))
+                object.properties.append(Property.from_sexpr(item))
             if item[0] == "pin":
                 object.pins.update({item[1]: item[2][1]})
             if item[0] == "mirror":
@@ -1179,7 +1181,7 @@ class SchematicSymbol:
                 for instance in item[1:]:
                     object.instances.append(SymbolProjectInstance.from_sexpr(instance))
 
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -1226,7 +1228,7 @@ class SchematicSymbol:
 
 
 @dataclass
-class HierarchicalPin:
+class HierarchicalPin(SexprWritable):
     """The ``pin`` token in a sheet object defines an electrical connection between the sheet in a
        schematic with the hierarchical label defined in the associated schematic file
 
@@ -1271,17 +1273,17 @@ class HierarchicalPin:
         if exp[0] != "pin":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.name = exp[1]
         object.connectionType = exp[2]
         for item in exp[3:]:
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "effects":
-                object.effects = Effects().from_sexpr(item)
+                object.effects = Effects.from_sexpr(item)
             if item[0] == "uuid":
                 object.uuid = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=4, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -1307,7 +1309,7 @@ class HierarchicalPin:
 
 
 @dataclass
-class HierarchicalSheetProjectPath:
+class HierarchicalSheetProjectPath(SexprWritable):
     """The symbol project path defines the ``path`` token to the sheet instance of the instance data
     of a symbol.
 
@@ -1428,7 +1430,7 @@ class HierarchicalSheetProjectInstance(ProjectInstance):
 
 
 @dataclass
-class HierarchicalSheet:
+class HierarchicalSheet(SexprWritable):
     """The ``sheet`` token defines a hierarchical sheet of the schematic
 
     Documentation:
@@ -1499,24 +1501,24 @@ class HierarchicalSheet:
         if exp[0] != "sheet":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp[1:]:
             if item[0] == "fields_autoplaced":
                 object.fieldsAutoplaced = True
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "size":
                 object.width = item[1]
                 object.height = item[2]
             if item[0] == "fill":
-                object.fill = ColorRGBA().from_sexpr(item[1])
+                object.fill = ColorRGBA.from_sexpr(item[1])
                 object.fill.precision = 4
             if item[0] == "uuid":
                 object.uuid = item[1]
             if item[0] == "property":
-                p = Property().from_sexpr(item)
+                p = Property.from_sexpr(item)
                 if item[1] == "Sheet name" or item[1] == "Sheetname":
                     object.sheetName = p
                 elif item[1] == "Sheet file" or item[1] == "Sheetfile":
@@ -1524,13 +1526,13 @@ class HierarchicalSheet:
                 else:
                     object.properties.append(p)
             if item[0] == "pin":
-                object.pins.append(HierarchicalPin().from_sexpr(item))
+                object.pins.append(HierarchicalPin.from_sexpr(item))
             if item[0] == "instances":
                 for instance in item[1:]:
                     object.instances.append(
                         HierarchicalSheetProjectInstance.from_sexpr(instance)
                     )
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -1568,7 +1570,7 @@ class HierarchicalSheet:
 
 
 @dataclass
-class HierarchicalSheetInstance:
+class HierarchicalSheetInstance(SexprWritable):
     """The sheet_instance token defines the per sheet information for the entire schematic. This
        section will only exist in schematic files that are the root sheet of a project
 
@@ -1627,7 +1629,7 @@ class HierarchicalSheetInstance:
 
 
 @dataclass
-class SymbolInstance:
+class SymbolInstance(SexprWritable):
     """The ``symbol_instance`` token defines the per symbol information for the entire schematic
 
     Documentation:
@@ -1704,7 +1706,7 @@ class SymbolInstance:
 
 
 @dataclass
-class Rectangle:
+class Rectangle(SexprWritable):
     """The ``rectangle`` token defines a graphical rectangle in a schematic.
 
     Available since KiCad v7
@@ -1748,20 +1750,20 @@ class Rectangle:
         if exp[0] != "rectangle":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
 
         for item in exp:
             if item[0] == "start":
-                object.start = Position().from_sexpr(item)
+                object.start = Position.from_sexpr(item)
             if item[0] == "end":
-                object.end = Position().from_sexpr(item)
+                object.end = Position.from_sexpr(item)
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "fill":
-                object.fill = Fill().from_sexpr(item)
+                object.fill = Fill.from_sexpr(item)
             if item[0] == "uuid":
                 object.uuid = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -1786,7 +1788,7 @@ class Rectangle:
 
 
 @dataclass
-class Arc:
+class Arc(SexprWritable):
     """The ``Arc`` token defines a graphical arc in a schematic.
 
     Available since KiCad v7
@@ -1833,22 +1835,22 @@ class Arc:
         if exp[0] != "arc":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
 
         for item in exp:
             if item[0] == "start":
-                object.start = Position().from_sexpr(item)
+                object.start = Position.from_sexpr(item)
             if item[0] == "mid":
-                object.mid = Position().from_sexpr(item)
+                object.mid = Position.from_sexpr(item)
             if item[0] == "end":
-                object.end = Position().from_sexpr(item)
+                object.end = Position.from_sexpr(item)
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "fill":
-                object.fill = Fill().from_sexpr(item)
+                object.fill = Fill.from_sexpr(item)
             if item[0] == "uuid":
                 object.uuid = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -1873,7 +1875,7 @@ class Arc:
 
 
 @dataclass
-class Circle:
+class Circle(SexprWritable):
     """The ``Circle`` token defines a graphical circle in a schematic.
 
     Available since KiCad v7
@@ -1917,20 +1919,20 @@ class Circle:
         if exp[0] != "circle":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
 
         for item in exp:
             if item[0] == "center":
-                object.center = Position().from_sexpr(item)
+                object.center = Position.from_sexpr(item)
             if item[0] == "radius":
                 object.radius = item[1]
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "fill":
-                object.fill = Fill().from_sexpr(item)
+                object.fill = Fill.from_sexpr(item)
             if item[0] == "uuid":
                 object.uuid = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -1955,7 +1957,7 @@ class Circle:
 
 
 @dataclass
-class NetclassFlag:
+class NetclassFlag(SexprWritable):
     """The ``netclass_flag`` token defines a netclass flag in a schematic.
 
     Available since KiCad v7
@@ -2010,7 +2012,7 @@ class NetclassFlag:
         if exp[0] != "netclass_flag":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.text = exp[1]
         for item in exp[2:]:
             if item[0] == "length":
@@ -2027,7 +2029,7 @@ class NetclassFlag:
                 object.uuid = item[1]
             if item[0] == "property":
                 object.properties.append(Property.from_sexpr(item))
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
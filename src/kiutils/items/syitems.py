@@ -21,11 +21,13 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 from kiutils.items.common import Effects, Fill, Position, Stroke
+from kiutils.utils.construct import fill_defaults, new_object
 from kiutils.utils.strings import dequote
+from kiutils.utils.writer import SexprWritable
 
 
 @dataclass
-class SyArc:
+class SyArc(SexprWritable):
     """The ``arc`` token defines a graphical arc in a symbol definition.
 
     Documentation:
@@ -73,7 +75,7 @@ class SyArc:
         if exp[0] != "arc":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
 
         for item in exp:
             if isinstance(item, str):
@@ -81,16 +83,16 @@ class SyArc:
                     object.private = True
                 continue
             if item[0] == "start":
-                object.start = Position().from_sexpr(item)
+                object.start = Position.from_sexpr(item)
             if item[0] == "mid":
-                object.mid = Position().from_sexpr(item)
+                object.mid = Position.from_sexpr(item)
             if item[0] == "end":
-                object.end = Position().from_sexpr(item)
+                object.end = Position.from_sexpr(item)
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "fill":
-                object.fill = Fill().from_sexpr(item)
-        return object
+                object.fill = Fill.from_sexpr(item)
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 6, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -118,7 +120,7 @@ class SyArc:
 
 
 @dataclass
-class SyCircle:
+class SyCircle(SexprWritable):
     """The ``circle`` token defines a graphical circle in a symbol definition.
 
     Documentation:
@@ -163,7 +165,7 @@ class SyCircle:
         if exp[0] != "circle":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
 
         for item in exp:
             if isinstance(item, str):
@@ -171,14 +173,14 @@ class SyCircle:
                     object.private = True
                 continue
             if item[0] == "center":
-                object.center = Position().from_sexpr(item)
+                object.center = Position.from_sexpr(item)
             if item[0] == "radius":
                 object.radius = item[1]
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "fill":
-                object.fill = Fill().from_sexpr(item)
-        return object
+                object.fill = Fill.from_sexpr(item)
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 6, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -202,7 +204,7 @@ class SyCircle:
 
 
 @dataclass
-class SyCurve:
+class SyCurve(SexprWritable):
     """The ``curve`` token defines a graphical Qubic Bezier curve.
 
     Documentation:
@@ -238,16 +240,16 @@ class SyCurve:
         if exp[0] != "curve":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "fill":
-                object.fill = Fill().from_sexpr(item)
+                object.fill = Fill.from_sexpr(item)
             if item[0] == "pts":
                 for point in item[1:]:
-                    object.points.append(Position().from_sexpr(point))
-        return object
+                    object.points.append(Position.from_sexpr(point))
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 6, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -274,7 +276,7 @@ class SyCurve:
 
 
 @dataclass
-class SyPolyLine:
+class SyPolyLine(SexprWritable):
     """The ``polyline`` token defines one or more graphical lines that may or may not define a polygon.
 
     Documentation:
@@ -310,16 +312,16 @@ class SyPolyLine:
         if exp[0] != "polyline":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "fill":
-                object.fill = Fill().from_sexpr(item)
+                object.fill = Fill.from_sexpr(item)
             if item[0] == "pts":
                 for point in item[1:]:
-                    object.points.append(Position().from_sexpr(point))
-        return object
+                    object.points.append(Position.from_sexpr(point))
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 6, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -346,7 +348,7 @@ class SyPolyLine:
 
 
 @dataclass
-class SyRect:
+class SyRect(SexprWritable):
     """The ``rectangle`` token defines a graphical rectangle in a symbol definition.
 
     Documentation:
@@ -391,7 +393,7 @@ class SyRect:
         if exp[0] != "rectangle":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
 
         for item in exp:
             if isinstance(item, str):
@@ -399,14 +401,14 @@ class SyRect:
                     object.private = True
                 continue
             if item[0] == "start":
-                object.start = Position().from_sexpr(item)
+                object.start = Position.from_sexpr(item)
             if item[0] == "end":
-                object.end = Position().from_sexpr(item)
+                object.end = Position.from_sexpr(item)
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "fill":
-                object.fill = Fill().from_sexpr(item)
-        return object
+                object.fill = Fill.from_sexpr(item)
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 6, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -430,7 +432,7 @@ class SyRect:
 
 
 @dataclass
-class SyText:
+class SyText(SexprWritable):
     """The ``text`` token defines a graphical text in a symbol definition.
 
     Documentation:
@@ -466,14 +468,14 @@ class SyText:
         if exp[0] != "text":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.text = exp[1]
         for item in exp[2:]:
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "effects":
-                object.effects = Effects().from_sexpr(item)
-        return object
+                object.effects = Effects.from_sexpr(item)
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 6, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -497,7 +499,7 @@ class SyText:
 
 
 @dataclass
-class SyTextBox:
+class SyTextBox(SexprWritable):
     """The ``text_box`` token defines a text box inside a symbol
 
     Available since KiCad v7
@@ -554,7 +556,7 @@ class SyTextBox:
         if exp[0] != "text_box":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
 
         # Extract "private" token, if any is present
         if exp[1] == "private" and not isinstance(exp[2], list):
@@ -567,18 +569,18 @@ class SyTextBox:
 
         for item in exp[start_at:]:
             if item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             if item[0] == "size":
-                object.size = Position().from_sexpr(item)
+                object.size = Position.from_sexpr(item)
             if item[0] == "effects":
-                object.effects = Effects().from_sexpr(item)
+                object.effects = Effects.from_sexpr(item)
             if item[0] == "stroke":
-                object.stroke = Stroke().from_sexpr(item)
+                object.stroke = Stroke.from_sexpr(item)
             if item[0] == "fill":
-                object.fill = Fill().from_sexpr(item)
+                object.fill = Fill.from_sexpr(item)
             if item[0] == "uuid":
                 object.uuid = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -17,14 +17,16 @@ Documentation taken from:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Union
 
-from kiutils.items.common import Position
+from kiutils.items.common import Position, PositionArray
+from kiutils.utils.construct import fill_defaults, new_object
 from kiutils.utils.strings import dequote
+from kiutils.utils.writer import SexprWritable, stream_writer
 
 
 @dataclass
-class KeepoutSettings:
+class KeepoutSettings(SexprWritable):
     """The ``keepout `` token attributes define which objects should be kept out of the
     zone. This section only applies to keep out zones.
 
@@ -109,7 +111,7 @@ class KeepoutSettings:
 
 
 @dataclass
-class FillSettings:
+class FillSettings(SexprWritable):
     """The ``fill`` token attributes define how the zone is to be filled.
 
     Documentation:
@@ -316,7 +318,7 @@ class FillSettings:
 
 
 @dataclass
-class ZonePolygon:
+class ZonePolygon(SexprWritable):
     """The ``polygon`` token defines a list of coordinates that define part of a zone"""
 
     coordinates: List[Position] = field(default_factory=list)
@@ -348,10 +350,33 @@ class ZonePolygon:
                 continue
             if item[0] == "pts":
                 for position in item[1:]:
-                    object.coordinates.append(Position().from_sexpr(position))
+                    object.coordinates.append(Position.from_sexpr(position))
 
         return object
 
+    def write_sexpr(self, stream, indent: int = 4, newline: bool = True):
+        """Write the S-Expression representing this object to the given stream. When no coordinates
+        are set in the polygon, the resulting S-Expression will be left empty.
+
+        Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 4.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+        """
+        write = stream_writer(stream)
+        indents = " " * indent
+        endline = "\n" if newline else ""
+        if len(self.coordinates) == 0:
+            write(f"{indents}{endline}")
+            return
+
+        write(f"{indents}(polygon\n")
+        write(f"{indents}  (pts\n")
+        for point in self.coordinates:
+            write(f"{indents}    (xy {point.X} {point.Y})\n")
+        write(f"{indents}  )\n")
+        write(f"{indents})\n")
+
     def to_sexpr(self, indent: int = 4, newline: bool = True) -> str:
         """Generate the S-Expression representing this object. When no coordinates are set
         in the polygon, the resulting S-Expression will be left empty.
@@ -364,22 +389,13 @@ class ZonePolygon:
             - str: S-Expression of this object. If the polygon has no coordinates, an empty
                    expression is returned.
         """
-        indents = " " * indent
-        endline = "\n" if newline else ""
-        if len(self.coordinates) == 0:
-            return f"{indents}{endline}"
-
-        expression = f"{indents}(polygon\n"
-        expression += f"{indents}  (pts\n"
-        for point in self.coordinates:
-            expression += f"{indents}    (xy {point.X} {point.Y})\n"
-        expression += f"{indents}  )\n"
-        expression += f"{indents})\n"
-        return expression
+        buffer = []
+        self.write_sexpr(buffer, indent=indent, newline=newline)
+        return "".join(buffer)
 
 
 @dataclass
-class FilledPolygon:
+class FilledPolygon(SexprWritable):
     """The ``filled_polygon`` token defines the polygons used to fill a zone
 
     Documentation:
@@ -393,8 +409,10 @@ class FilledPolygon:
     island: bool = False
     """The ``island`` token's definition has to be defined .."""
 
-    coordinates: List[Position] = field(default_factory=list)
-    """The ``coordinates`` defines the list of polygon X/Y coordinates used to fill the zone"""
+    coordinates: Union[List[Position], PositionArray] = field(default_factory=list)
+    """The ``coordinates`` defines the list of polygon X/Y coordinates used to fill the zone. Parsed
+    fills hold a ``PositionArray``, which stores the coordinates in an array instead of one
+    ``Position`` object per point."""
 
     @classmethod
     def from_sexpr(cls, exp: list) -> FilledPolygon:
@@ -426,11 +444,39 @@ class FilledPolygon:
             if item[0] == "island":
                 object.island = True
             if item[0] == "pts":
-                for position in item[1:]:
-                    object.coordinates.append(Position().from_sexpr(position))
+                object.coordinates = PositionArray.from_sexpr(item)
 
         return object
 
+    def write_sexpr(self, stream, indent: int = 4, newline: bool = True):
+        """Write the S-Expression representing this object to the given stream. When no coordinates
+        are set in the filled polygon, the resulting S-Expression will be left empty.
+
+        Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 4.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+        """
+        write = stream_writer(stream)
+        indents = " " * indent
+        endline = "\n" if newline else ""
+        if len(self.coordinates) == 0:
+            write(f"{indents}{endline}")
+            return
+
+        write(f"{indents}(filled_polygon\n")
+        write(f'{indents}  (layer "{dequote(self.layer)}")\n')
+        if self.island:
+            write(f"{indents}  (island)\n")
+        write(f"{indents}  (pts\n")
+        if isinstance(self.coordinates, PositionArray):
+            self.coordinates.write_sexpr(stream, indent + 4)
+        else:
+            for point in self.coordinates:
+                write(f"{indents}    (xy {point.X} {point.Y})\n")
+        write(f"{indents}  )\n")
+        write(f"{indents})\n")
+
     def to_sexpr(self, indent: int = 4, newline: bool = True) -> str:
         """Generate the S-Expression representing this object. When no coordinates are set
         in the filled polygon, the resulting S-Expression will be left empty.
@@ -443,26 +489,14 @@ class FilledPolygon:
             - str: S-Expression of this object. If the filled polygon has no coordinates, an empty
                    expression is returned.
         """
-        indents = " " * indent
-        endline = "\n" if newline else ""
-        if len(self.coordinates) == 0:
-            return f"{indents}{endline}"
-
-        expression = f"{indents}(filled_polygon\n"
-        expression += f'{indents}  (layer "{dequote(self.layer)}")\n'
-        if self.island:
-            expression += f"{indents}  (island)\n"
-        expression += f"{indents}  (pts\n"
-        for point in self.coordinates:
-            expression += f"{indents}    (xy {point.X} {point.Y})\n"
-        expression += f"{indents}  )\n"
-        expression += f"{indents})\n"
-        return expression
+        buffer = []
+        self.write_sexpr(buffer, indent=indent, newline=newline)
+        return "".join(buffer)
 
 
 # TODO: This is KiCad 4 stuff, has to be tested yet ..
 @dataclass
-class FillSegments:
+class FillSegments(SexprWritable):
     """The ``fill_polygon`` token defines the segments used to fill the zone. This is only
        used when loading boards prior to version 4 which filled zones with segments.
 
@@ -505,10 +539,34 @@ class FillSegments:
                 object.layer = item[1]
             if item[0] == "pts":
                 for position in item[1:]:
-                    object.coordinates.append(Position().from_sexpr(position))
+                    object.coordinates.append(Position.from_sexpr(position))
 
         return object
 
+    def write_sexpr(self, stream, indent: int = 4, newline: bool = True):
+        """Write the S-Expression representing this object to the given stream. When no coordinates
+        are set in the curve, the resulting S-Expression will be left empty.
+
+        Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 4.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+        """
+        write = stream_writer(stream)
+        indents = " " * indent
+        endline = "\n" if newline else ""
+        if len(self.coordinates) == 0:
+            write(f"{indents}{endline}")
+            return
+
+        write(f"{indents}(fill_segments\n")
+        write(f'{indents}  (layer "{dequote(self.layer)}")\n')
+        write(f"{indents}  (pts\n")
+        for point in self.coordinates:
+            write(f"{indents}    (xy {point.X} {point.Y})\n")
+        write(f"{indents}  )\n")
+        write(f"{indents})\n")
+
     def to_sexpr(self, indent: int = 4, newline: bool = True) -> str:
         """Generate the S-Expression representing this object. When no coordinates are set
         in the curve, the resulting S-Expression will be left empty.
@@ -521,19 +579,9 @@ class FillSegments:
             - str: S-Expression of this object. If the fill segments has no coordinates, an empty
               expression is returned.
         """
-        indents = " " * indent
-        endline = "\n" if newline else ""
-        if len(self.coordinates) == 0:
-            return f"{indents}{endline}"
-
-        expression = f"{indents}(fill_segments\n"
-        expression += f'{indents}  (layer "{dequote(self.layer)}")\n'
-        expression += f"{indents}  (pts\n"
-        for point in self.coordinates:
-            expression += f"{indents}    (xy {point.X} {point.Y})\n"
-        expression += f"{indents}  )\n"
-        expression += f"{indents})\n"
-        return expression
+        buffer = []
+        self.write_sexpr(buffer, indent=indent, newline=newline)
+        return "".join(buffer)
 
 
 @dataclass
@@ -549,7 +597,7 @@ class Hatch:
 
 
 @dataclass
-class Zone:
+class Zone(SexprWritable):
     """The ``zone`` token defines a zone on the board or footprint. Zones serve two purposes
        in KiCad: filled copper zones and keep out areas.
 
@@ -642,7 +690,7 @@ class Zone:
         if exp[0] != "zone":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp:
             if not isinstance(item, list):
                 if item == "locked":
@@ -676,31 +724,30 @@ class Zone:
             if item[0] == "filled_areas_thickness":
                 object.filledAreasThickness = item[1]
             if item[0] == "keepout":
-                object.keepoutSettings = KeepoutSettings().from_sexpr(item)
+                object.keepoutSettings = KeepoutSettings.from_sexpr(item)
             if item[0] == "fill":
-                object.fillSettings = FillSettings().from_sexpr(item)
+                object.fillSettings = FillSettings.from_sexpr(item)
             if item[0] == "polygon":
-                object.polygons.append(ZonePolygon().from_sexpr(item))
+                object.polygons.append(ZonePolygon.from_sexpr(item))
             if item[0] == "filled_polygon":
-                object.filledPolygons.append(FilledPolygon().from_sexpr(item))
+                object.filledPolygons.append(FilledPolygon.from_sexpr(item))
             if item[0] == "fill_segments":
-                object.fillSegments = FillSegments().from_sexpr(item)
+                object.fillSegments = FillSegments.from_sexpr(item)
 
-        return object
+        return fill_defaults(object)
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object.
+    def write_sexpr(self, stream, indent: int = 2, newline: bool = True):
+        """Write the S-Expression representing this object to the given stream.
 
         Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
 
         Raises:
             - Exception: When the zone has no elements in its layer list
-
-        Returns:
-            - str: S-Expression of this object.
         """
+        write = stream_writer(stream)
         indents = " " * indent
         endline = "\n" if newline else ""
 
@@ -728,26 +775,42 @@ class Zone:
         else:
             layer_token = f" (layers{layers})"
 
-        expression = f'{indents}(zone{locked} (net {self.net}) (net_name "{dequote(self.netName)}"){layer_token}{tstamp}{name} (hatch {self.hatch.style} {self.hatch.pitch})\n'
-        if self.priority is not None:
-            expression += f"{indents}  (priority {self.priority})\n"
-        expression += (
-            f"{indents}  (connect_pads{contype} (clearance {self.clearance}))\n"
+        write(
+            f'{indents}(zone{locked} (net {self.net}) (net_name "{dequote(self.netName)}"){layer_token}{tstamp}{name} (hatch {self.hatch.style} {self.hatch.pitch})\n'
         )
-        expression += f"{indents}  (min_thickness {self.minThickness}){fat}\n"
+        if self.priority is not None:
+            write(f"{indents}  (priority {self.priority})\n")
+        write(f"{indents}  (connect_pads{contype} (clearance {self.clearance}))\n")
+        write(f"{indents}  (min_thickness {self.minThickness}){fat}\n")
         if self.keepoutSettings is not None:
-            expression += f"{indents}  {self.keepoutSettings.to_sexpr()}\n"
+            write(f"{indents}  {self.keepoutSettings.to_sexpr()}\n")
         if self.fillSettings is not None:
-            expression += self.fillSettings.to_sexpr(indent + 2, True)
+            self.fillSettings.write_sexpr(stream, indent + 2, True)
 
         for polygon in self.polygons:
-            expression += polygon.to_sexpr(indent + 2)
+            polygon.write_sexpr(stream, indent + 2)
 
         for polygon in self.filledPolygons:
-            expression += polygon.to_sexpr(indent + 2)
+            polygon.write_sexpr(stream, indent + 2)
 
         # TODO: This is KiKad 4 stuff...
         if self.fillSegments is not None:
-            expression += self.fillSegments.to_sexpr()
-        expression += f"{indents}){endline}"
-        return expression
+            self.fillSegments.write_sexpr(stream)
+        write(f"{indents}){endline}")
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object.
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Raises:
+            - Exception: When the zone has no elements in its layer list
+
+        Returns:
+            - str: S-Expression of this object.
+        """
+        buffer = []
+        self.write_sexpr(buffer, indent=indent, newline=newline)
+        return "".join(buffer)
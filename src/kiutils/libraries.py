@@ -12,16 +12,25 @@ Major changes:
 
 from __future__ import annotations
 
+import os
+import threading
 from dataclasses import dataclass, field
 from os import path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+from kiutils.footprint import Footprint
+from kiutils.symbol import Symbol, SymbolLib
 from kiutils.utils import sexpr
-from kiutils.utils.strings import dequote
+from kiutils.utils.aio import AsyncFile
+from kiutils.utils.strings import dequote, expand_variables
+from kiutils.utils.writer import SexprWritable, stream_writer
+
+if TYPE_CHECKING:
+    from kiutils.utils.cache import ParseCache
 
 
 @dataclass
-class Library:
+class Library(SexprWritable):
     """The ``library`` token defines either a symbol library or a footprint library in
     a library table file (``fp_lib_table`` or ``sym_lib_table``)"""
 
@@ -79,6 +88,20 @@ class Library:
                 object.active = False
         return object
 
+    def resolved_uri(self, variables: Optional[Dict[str, str]] = None) -> str:
+        """Get the ``uri`` of the library with expanded path variables (see
+        ``kiutils.utils.strings.expand_variables()``)
+
+        Args:
+            - variables (dict, optional): Values of variables that take precedence over the
+                                          environment, e.g. ``{"KIPRJMOD": "/path/to/project"}``.
+                                          Defaults to None.
+
+        Returns:
+            - str: The expanded URI
+        """
+        return expand_variables(self.uri, variables)
+
     def to_sexpr(self, indent=2, newline=True) -> str:
         """Generate the S-Expression representing this object
 
@@ -108,7 +131,7 @@ class Library:
 
 
 @dataclass
-class LibTable:
+class LibTable(SexprWritable, AsyncFile):
     """The ``libtable`` token defines the ``fp_lib_table`` or ``sym_lib_table`` file of KiCad"""
 
     type: str = "sym_lib_table"
@@ -146,11 +169,16 @@ class LibTable:
         object.type = exp[0]
         for item in exp:
             if item[0] == "lib":
-                object.libs.append(Library().from_sexpr(item))
+                object.libs.append(Library.from_sexpr(item))
         return object
 
     @classmethod
-    def from_file(cls, filepath: str, encoding: Optional[str] = None) -> LibTable:
+    def from_file(
+        cls,
+        filepath: str,
+        encoding: Optional[str] = None,
+        cache: Union[bool, ParseCache] = False,
+    ) -> LibTable:
         """Load a library table directly from a KiCad library table file and sets the
         ``self.filePath`` attribute to the given file path.
 
@@ -158,6 +186,10 @@ class LibTable:
             - filepath (str): Path or path-like object that points to the file
             - encoding (str, optional): Encoding of the input file. Defaults to None (platform
                                         dependent encoding).
+            - cache (Union[bool, ParseCache]): Reuse the object stored for the file in the given
+                                               cache (``kiutils.utils.cache.default_cache`` if
+                                               True) as long as the file is unchanged, or store
+                                               the loaded object there. Defaults to False.
 
         Raises:
             - Exception: If the given path is not a file
@@ -168,11 +200,65 @@ class LibTable:
         if not path.isfile(filepath):
             raise Exception("Given path is not a file!")
 
+        if cache:
+            from kiutils.utils.cache import load_cached
+
+            return load_cached(
+                cache,
+                cls,
+                filepath,
+                lambda: cls.from_file(filepath, encoding),
+                encoding=encoding,
+            )
+
         with open(filepath, "r", encoding=encoding) as infile:
-            item = cls.from_sexpr(sexpr.parse_sexp(infile.read()))
+            item = cls.from_sexpr(sexpr.parse_sexp(infile))
             item.filePath = filepath
             return item
 
+    def merge(self, other: LibTable) -> LibTable:
+        """Merge another library table into a new one, like KiCad merges the project and the
+        global library table. Libraries of this table take precedence over libraries of the other
+        table with the same name.
+
+        Args:
+            - other (LibTable): The other table, usually the global library table
+
+        Returns:
+            - LibTable: New table with the libraries of this table followed by the libraries of the
+                        other table whose names are not used by this table
+        """
+        names = {lib.name for lib in self.libs}
+        return LibTable(
+            type=self.type,
+            libs=self.libs + [lib for lib in other.libs if lib.name not in names],
+            filePath=self.filePath,
+        )
+
+    def resolver(
+        self,
+        globalTable: Optional[LibTable] = None,
+        variables: Optional[Dict[str, str]] = None,
+    ) -> LibraryResolver:
+        """Create a resolver of library IDs for the libraries of this table (see
+        ``LibraryResolver``)
+
+        Args:
+            - globalTable (LibTable, optional): Global library table merged into this table (see
+                                                ``self.merge()``). Defaults to None.
+            - variables (dict, optional): Values of path variables that take precedence over the
+                                          environment. If this table was loaded from a file,
+                                          ``KIPRJMOD`` defaults to its directory. Defaults to None.
+
+        Returns:
+            - LibraryResolver: The resolver
+        """
+        table = self.merge(globalTable) if globalTable is not None else self
+        variables = dict(variables or {})
+        if self.filePath is not None:
+            variables.setdefault("KIPRJMOD", path.dirname(path.abspath(self.filePath)))
+        return LibraryResolver(table=table, variables=variables)
+
     @classmethod
     def create_new(cls, type: str = "sym_lib_table") -> LibTable:
         """Creates a new empty library table with its attributes set as KiCad would create it
@@ -203,7 +289,24 @@ class LibTable:
             filepath = self.filePath
 
         with open(filepath, "w", encoding=encoding) as outfile:
-            outfile.write(self.to_sexpr())
+            self.write_sexpr(outfile)
+
+    def write_sexpr(self, stream, indent=0, newline=True):
+        """Write the S-Expression representing this object to the given stream
+
+        Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+        """
+        write = stream_writer(stream)
+        indents = " " * indent
+        endline = "\n" if newline else ""
+
+        write(f"{indents}({self.type}\n")
+        for lib in self.libs:
+            lib.write_sexpr(stream)
+        write(f"{indents}){endline}")
 
     def to_sexpr(self, indent=0, newline=True) -> str:
         """Generate the S-Expression representing this object
@@ -215,11 +318,389 @@ class LibTable:
         Returns:
             - str: S-Expression of this object
         """
-        indents = " " * indent
-        endline = "\n" if newline else ""
+        buffer = []
+        self.write_sexpr(buffer, indent=indent, newline=newline)
+        return "".join(buffer)
 
-        expression = f"{indents}({self.type}\n"
-        for lib in self.libs:
-            expression += lib.to_sexpr()
-        expression += f"{indents}){endline}"
-        return expression
+
+@dataclass
+class LibraryResolver:
+    """The ``LibraryResolver`` token defines a resolver of library IDs like ``Device:R`` or
+    ``Resistor_SMD:R_0805_2012Metric`` to the symbols or footprints they point to, using the
+    libraries of a library table (see ``LibTable.resolver()``).
+
+    Loaded files are memoized by their path and reused as long as their modification time and size
+    do not change, so resolving the same or other entries of a library again only costs a
+    ``stat()`` of the library file. Symbol libraries are loaded lazily (see
+    ``SymbolLib.from_file()``), so only the resolved symbols are built.
+    """
+
+    table: LibTable = field(default_factory=LibTable)
+    """The ``table`` token defines the library table whose libraries are used"""
+
+    variables: Dict[str, str] = field(default_factory=dict)
+    """The ``variables`` token defines values of path variables that take precedence over the
+    environment"""
+
+    hits: int = 0
+    """The ``hits`` token defines how many resolutions reused a memoized file"""
+
+    misses: int = 0
+    """The ``misses`` token defines how many resolutions had to load a file"""
+
+    loaded: Dict[str, Tuple[int, int, object]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    """The ``loaded`` token defines the modification time, size and loaded object of every
+    memoized file, by its path"""
+
+    libraryPaths: Dict[str, str] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    """The ``libraryPaths`` token defines the expanded URI of every resolved library, by its name"""
+
+    def library_path(self, nickname: str) -> str:
+        """Get the expanded URI of a library of the table
+
+        Args:
+            - nickname (str): Name of the library in the table
+
+        Raises:
+            - Exception: If the table has no active library with the given name
+            - Exception: If the library is not of type ``KiCad``
+
+        Returns:
+            - str: Path of the library, a ``.pretty`` directory or a ``.kicad_sym`` file
+        """
+        libraryPath = self.libraryPaths.get(nickname)
+        if libraryPath is None:
+            library = next(
+                (lib for lib in self.table.libs if lib.name == nickname and lib.active),
+                None,
+            )
+            if library is None:
+                raise Exception(f"Library {nickname} not found in library table")
+            if library.type != "KiCad":
+                raise Exception(f"Library type {library.type} is not supported")
+            libraryPath = self.libraryPaths[nickname] = library.resolved_uri(
+                self.variables
+            )
+        return libraryPath
+
+    def resolve(self, libId: str) -> Union[Footprint, Symbol]:
+        """Resolve a library ID like ``Device:R`` to the symbol or footprint it points to. The
+        type of the table defines which of both is returned.
+
+        Args:
+            - libId (str): The library ID, e.g. ``Footprint.libId`` or ``SchematicSymbol.libId``
+
+        Raises:
+            - Exception: If the library ID has no library nickname
+            - Exception: If the library or the entry could not be found
+
+        Returns:
+            - Union[Footprint, Symbol]: The footprint for ``fp_lib_table`` tables, the symbol for
+                                        ``sym_lib_table`` tables. Loaded objects are shared by all
+                                        resolutions and must not be changed.
+        """
+        nickname, separator, entry = libId.partition(":")
+        if not separator:
+            raise Exception(f"Library ID {libId} has no library nickname")
+
+        libraryPath = self.library_path(nickname)
+        if self.table.type == "fp_lib_table":
+            filepath = path.join(libraryPath, f"{entry}.kicad_mod")
+            if not path.isfile(filepath):
+                raise Exception(f"Footprint {entry} not found in library {nickname}")
+            return self._load(filepath, Footprint.from_file)
+
+        symbolLib = self._load(
+            libraryPath, lambda filepath: SymbolLib.from_file(filepath, lazy=True)
+        )
+        return symbolLib.get(entry)
+
+    def clear(self):
+        """Forget all memoized files and library paths, e.g. after the libraries of the table or
+        the path variables were changed"""
+        self.loaded.clear()
+        self.libraryPaths.clear()
+
+    def _load(self, filepath: str, loader: Callable[[str], object]):
+        """Get the memoized object of the given file or load it, if the file changed"""
+        stat = os.stat(filepath)
+        memoized = self.loaded.get(filepath)
+        if (
+            memoized is not None
+            and memoized[0] == stat.st_mtime_ns
+            and memoized[1] == stat.st_size
+        ):
+            self.hits += 1
+            return memoized[2]
+
+        self.misses += 1
+        item = loader(filepath)
+        self.loaded[filepath] = (stat.st_mtime_ns, stat.st_size, item)
+        return item
+
+
+LIBRARY_FILE_TYPES = {".kicad_mod": Footprint, ".kicad_sym": SymbolLib}
+"""The class used to load the files of a ``LibraryCache``, by their extension"""
+
+
+@dataclass
+class LibraryChange:
+    """The ``LibraryChange`` token defines a change of a file of a ``LibraryCache``"""
+
+    kind: str = "added"
+    """The ``kind`` token defines if the file was ``added``, ``modified`` or ``removed``"""
+
+    filePath: str = ""
+    """The ``filePath`` token defines the path of the file"""
+
+    item: Optional[Union[Footprint, SymbolLib]] = None
+    """The ``item`` token defines the object loaded from the file. None if it was removed."""
+
+    previous: Optional[Union[Footprint, SymbolLib]] = None
+    """The ``previous`` token defines the object that was loaded from the file before. None if the
+    file was added."""
+
+
+@dataclass
+class LibraryCache:
+    """The ``LibraryCache`` token defines footprints and symbol libraries that are kept in memory
+    and reloaded when their files change.
+
+    Every ``self.scan()`` compares the modification time, size and inode of all ``.kicad_mod`` and
+    ``.kicad_sym`` files below ``self.paths`` with the last scan and only loads the files that were
+    added or modified. Every change is passed to the listeners (see ``self.add_listener()``), so
+    indexes built from the loaded objects can be updated incrementally. ``self.watch()`` scans
+    repeatedly, either in a fixed interval or, with the ``inotify_simple`` package on Linux, as
+    soon as a directory reports a change.
+    """
+
+    paths: List[str] = field(default_factory=list)
+    """The ``paths`` token defines the watched footprint libraries (``.pretty`` directories), symbol
+    libraries (``.kicad_sym`` files) or directories containing them"""
+
+    encoding: Optional[str] = None
+    """The ``encoding`` token defines the encoding of the files. If None, the platform dependent
+    encoding is used."""
+
+    lazy: bool = False
+    """The ``lazy`` token defines if symbol libraries are loaded lazily (see
+    ``SymbolLib.from_file()``)"""
+
+    items: Dict[str, Union[Footprint, SymbolLib]] = field(default_factory=dict)
+    """The ``items`` token defines the loaded footprints and symbol libraries by their file path"""
+
+    signatures: Dict[str, Tuple[int, int, int]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    """The ``signatures`` token defines the modification time, size and inode of every loaded file
+    at the time it was loaded, by its path"""
+
+    errors: Dict[str, str] = field(default_factory=dict)
+    """The ``errors`` token defines the error of every file that could not be loaded, by its path.
+    These files are loaded again on the next scan, e.g. after they were written completely."""
+
+    listeners: List[Callable[[LibraryChange], None]] = field(
+        default_factory=list, repr=False, compare=False
+    )
+    """The ``listeners`` token defines the functions that are called with every change"""
+
+    def add_listener(self, listener: Callable[[LibraryChange], None]):
+        """Call the given function with every change found by ``self.scan()``. The function is
+        called in the thread that runs the scan.
+
+        Args:
+            - listener (Callable): Function that takes a ``LibraryChange``
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[LibraryChange], None]):
+        """Stop calling the given function with changes
+
+        Args:
+            - listener (Callable): A function given to ``self.add_listener()``
+        """
+        self.listeners.remove(listener)
+
+    def files(self) -> Iterator[str]:
+        """Find the footprint and symbol library files below ``self.paths``
+
+        Returns:
+            - Iterator[str]: Paths of the files
+        """
+        for libraryPath in self.paths:
+            if path.isdir(libraryPath):
+                for root, _, names in os.walk(libraryPath):
+                    for name in names:
+                        if path.splitext(name)[1] in LIBRARY_FILE_TYPES:
+                            yield path.join(root, name)
+            elif path.splitext(libraryPath)[1] in LIBRARY_FILE_TYPES and path.isfile(
+                libraryPath
+            ):
+                yield libraryPath
+
+    def scan(self) -> List[LibraryChange]:
+        """Load the files that were added or modified since the last scan, forget the files that
+        were removed and pass every change to the listeners
+
+        Returns:
+            - List[LibraryChange]: The changes, removed files last
+        """
+        changes = []
+        found = set()
+        for filepath in self.files():
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                continue
+            found.add(filepath)
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            if self.signatures.get(filepath) == signature:
+                continue
+
+            try:
+                item = self._load(filepath)
+            except Exception as exception:
+                self.errors[filepath] = f"{type(exception).__name__}: {exception}"
+                continue
+            self.errors.pop(filepath, None)
+            item.filePath = filepath
+            previous = self.items.get(filepath)
+            self.items[filepath] = item
+            self.signatures[filepath] = signature
+            changes.append(
+                LibraryChange(
+                    kind="added" if previous is None else "modified",
+                    filePath=filepath,
+                    item=item,
+                    previous=previous,
+                )
+            )
+
+        for filepath in [filepath for filepath in self.items if filepath not in found]:
+            changes.append(
+                LibraryChange(
+                    kind="removed", filePath=filepath, previous=self.items.pop(filepath)
+                )
+            )
+            del self.signatures[filepath]
+        for filepath in [filepath for filepath in self.errors if filepath not in found]:
+            del self.errors[filepath]
+
+        for change in changes:
+            for listener in list(self.listeners):
+                listener(change)
+        return changes
+
+    def watch(
+        self,
+        interval: float = 1.0,
+        stop: Optional[threading.Event] = None,
+        backend: str = "auto",
+    ):
+        """Scan the files repeatedly until the given event is set. Usually run in its own thread.
+
+        Backends:
+            - ``poll``: Scan every ``interval`` seconds
+            - ``inotify``: Scan as soon as a watched directory reports a change, but at least every
+              ``interval`` seconds. Needs the ``inotify_simple`` package (Linux only).
+            - ``auto``: ``inotify`` if available, ``poll`` otherwise
+
+        Args:
+            - interval (float): Seconds between two scans. Defaults to 1.0.
+            - stop (threading.Event, optional): Event that stops watching. Defaults to None
+                                                (watch forever).
+            - backend (str): ``auto``, ``poll`` or ``inotify``. Defaults to ``auto``.
+
+        Raises:
+            - Exception: If the backend is unknown or ``inotify`` is not available
+        """
+        if backend not in ("auto", "poll", "inotify"):
+            raise Exception(f"Unknown backend {backend}")
+        stop = stop or threading.Event()
+        notifier = _InotifyNotifier.create() if backend != "poll" else None
+        if backend == "inotify" and notifier is None:
+            raise Exception("The inotify backend needs the inotify_simple package")
+
+        try:
+            while not stop.is_set():
+                self.scan()
+                if notifier is not None:
+                    notifier.watch(self._directories())
+                    notifier.wait(interval)
+                else:
+                    stop.wait(interval)
+        finally:
+            if notifier is not None:
+                notifier.close()
+
+    def _load(self, filepath: str) -> Union[Footprint, SymbolLib]:
+        """Load a footprint or symbol library file"""
+        if filepath.endswith(".kicad_sym"):
+            return SymbolLib.from_file(filepath, self.encoding, lazy=self.lazy)
+        return Footprint.from_file(filepath, self.encoding)
+
+    def _directories(self) -> List[str]:
+        """Get the directories whose changes are reported by the inotify backend"""
+        directories = []
+        for libraryPath in self.paths:
+            if path.isdir(libraryPath):
+                directories.extend(root for root, _, _ in os.walk(libraryPath))
+            else:
+                directories.append(path.dirname(path.abspath(libraryPath)))
+        return directories
+
+
+class _InotifyNotifier:
+    """Wrapper of the optional ``inotify_simple`` package used by ``LibraryCache.watch()``"""
+
+    def __init__(self, inotify, flags):
+        self.inotify = inotify
+        self.flags = flags
+        self.mask = (
+            flags.CREATE
+            | flags.DELETE
+            | flags.CLOSE_WRITE
+            | flags.MOVED_FROM
+            | flags.MOVED_TO
+            | flags.ATTRIB
+        )
+        self.watched = {}
+
+    @classmethod
+    def create(cls) -> Optional[_InotifyNotifier]:
+        """Create the notifier or return None, if ``inotify_simple`` is not available"""
+        try:
+            from inotify_simple import INotify, flags
+        except ImportError:
+            return None
+        try:
+            return cls(INotify(), flags)
+        except OSError:
+            return None
+
+    def watch(self, directories: List[str]):
+        """Watch the given directories, in addition to the ones already watched"""
+        watched = set(self.watched.values())
+        for directory in directories:
+            if directory not in watched:
+                try:
+                    self.watched[self.inotify.add_watch(directory, self.mask)] = (
+                        directory
+                    )
+                except OSError:
+                    continue
+
+    def wait(self, timeout: float):
+        """Wait until a watched directory reports a change or the timeout in seconds elapsed"""
+        for event in self.inotify.read(timeout=int(timeout * 1000)):
+            # The watch of a removed directory is removed by the kernel
+            if event.mask & self.flags.IGNORED:
+                self.watched.pop(event.wd, None)
+
+    def close(self):
+        """Remove all watches"""
+        self.inotify.close()
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from os import path
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, ClassVar, Dict, Iterable, List, Optional, Union
 
 from kiutils.items.common import Image, PageSettings, TitleBlock
 from kiutils.items.schitems import (
@@ -47,10 +47,17 @@ from kiutils.misc.config import (
 )
 from kiutils.symbol import Symbol
 from kiutils.utils import sexpr
+from kiutils.utils.aio import AsyncFile
+from kiutils.utils.construct import fill_defaults, new_object
+from kiutils.utils.dispatch import TokenDispatch, TokenHandler
+from kiutils.utils.writer import SexprWritable, stream_writer
+
+if TYPE_CHECKING:
+    from kiutils.utils.cache import ParseCache
 
 
 @dataclass
-class Schematic:
+class Schematic(SexprWritable, AsyncFile, TokenDispatch):
     """The ``schematic`` token represents a KiCad schematic as defined by the schematic file format
 
     Documenatation:
@@ -138,6 +145,76 @@ class Schematic:
     """The ``filePath`` token defines the path-like string to the schematic file. Automatically set when
     ``self.from_file()`` is used. Allows the use of ``self.to_file()`` without parameters."""
 
+    tokenHandlers: ClassVar[Dict[str, TokenHandler]] = {
+        "version": lambda object, item: setattr(object, "version", item[1]),
+        "generator": lambda object, item: setattr(object, "generator", item[1]),
+        "uuid": lambda object, item: setattr(object, "uuid", item[1]),
+        "paper": lambda object, item: setattr(
+            object, "paper", PageSettings.from_sexpr(item)
+        ),
+        "title_block": lambda object, item: setattr(
+            object, "titleBlock", TitleBlock.from_sexpr(item)
+        ),
+        "lib_symbols": lambda object, item: object.libSymbols.extend(
+            Symbol.from_sexpr(symbol) for symbol in item[1:]
+        ),
+        "junction": lambda object, item: object.junctions.append(
+            Junction.from_sexpr(item)
+        ),
+        "no_connect": lambda object, item: object.noConnects.append(
+            NoConnect.from_sexpr(item)
+        ),
+        "bus_entry": lambda object, item: object.busEntries.append(
+            BusEntry.from_sexpr(item)
+        ),
+        "bus_alias": lambda object, item: object.busAliases.append(
+            BusAlias.from_sexpr(item)
+        ),
+        "wire": lambda object, item: object.graphicalItems.append(
+            Connection.from_sexpr(item)
+        ),
+        "bus": lambda object, item: object.graphicalItems.append(
+            Connection.from_sexpr(item)
+        ),
+        "polyline": lambda object, item: object.graphicalItems.append(
+            PolyLine.from_sexpr(item)
+        ),
+        "arc": lambda object, item: object.shapes.append(Arc.from_sexpr(item)),
+        "circle": lambda object, item: object.shapes.append(Circle.from_sexpr(item)),
+        "rectangle": lambda object, item: object.shapes.append(
+            Rectangle.from_sexpr(item)
+        ),
+        "image": lambda object, item: object.images.append(Image.from_sexpr(item)),
+        "text": lambda object, item: object.texts.append(Text.from_sexpr(item)),
+        "text_box": lambda object, item: object.textBoxes.append(
+            TextBox.from_sexpr(item)
+        ),
+        "label": lambda object, item: object.labels.append(LocalLabel.from_sexpr(item)),
+        "global_label": lambda object, item: object.globalLabels.append(
+            GlobalLabel.from_sexpr(item)
+        ),
+        "hierarchical_label": lambda object, item: object.hierarchicalLabels.append(
+            HierarchicalLabel.from_sexpr(item)
+        ),
+        "netclass_flag": lambda object, item: object.netclassFlags.append(
+            NetclassFlag.from_sexpr(item)
+        ),
+        "symbol": lambda object, item: object.schematicSymbols.append(
+            SchematicSymbol.from_sexpr(item)
+        ),
+        "sheet": lambda object, item: object.sheets.append(
+            HierarchicalSheet.from_sexpr(item)
+        ),
+        "sheet_instances": lambda object, item: object.sheetInstances.extend(
+            HierarchicalSheetInstance.from_sexpr(instance) for instance in item[1:]
+        ),
+        "symbol_instances": lambda object, item: object.symbolInstances.extend(
+            SymbolInstance.from_sexpr(instance) for instance in item[1:]
+        ),
+    }
+    """The ``tokenHandlers`` token defines the handler of every known token of the items
+    of ``(kicad_sch ...)`` (see ``kiutils.utils.dispatch.TokenDispatch``)"""
+
     @classmethod
     def from_sexpr(cls, exp: list) -> Schematic:
         """Convert the given S-Expresstion into a Schematic object
@@ -155,74 +232,45 @@ class Schematic:
         if not isinstance(exp, list):
             raise Exception("Expression does not have the correct type")
 
-        if exp[0] != "kicad_sch":
+        return cls.from_forms(exp)
+
+    @classmethod
+    def from_forms(cls, forms: Iterable) -> Schematic:
+        """Convert the items of a ``(kicad_sch ...)`` expression into a Schematic object. The items are
+        consumed one by one, so they may be supplied by a generator like ``sexpr.iterforms()``
+        without ever building the whole parsed S-Expression.
+
+        Args:
+            - forms (Iterable): Items of the parsed S-Expression ``(kicad_sch ...)``, starting with
+                                the ``kicad_sch`` token itself
+
+        Raises:
+            - Exception: When the first item is not kicad_sch
+
+        Returns:
+            - Schematic: Object of the class initialized with the given items
+        """
+        forms = iter(forms)
+        if next(forms, None) != "kicad_sch":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
-        for item in exp:
-            if item[0] == "version":
-                object.version = item[1]
-            if item[0] == "generator":
-                object.generator = item[1]
-            if item[0] == "uuid":
-                object.uuid = item[1]
-            if item[0] == "paper":
-                object.paper = PageSettings().from_sexpr(item)
-            if item[0] == "title_block":
-                object.titleBlock = TitleBlock().from_sexpr(item)
-            if item[0] == "lib_symbols":
-                for symbol in item[1:]:
-                    object.libSymbols.append(Symbol().from_sexpr(symbol))
-            if item[0] == "junction":
-                object.junctions.append(Junction().from_sexpr(item))
-            if item[0] == "no_connect":
-                object.noConnects.append(NoConnect().from_sexpr(item))
-            if item[0] == "bus_entry":
-                object.busEntries.append(BusEntry().from_sexpr(item))
-            if item[0] == "bus_alias":
-                object.busAliases.append(BusAlias().from_sexpr(item))
-            if item[0] == "wire":
-                object.graphicalItems.append(Connection().from_sexpr(item))
-            if item[0] == "bus":
-                object.graphicalItems.append(Connection().from_sexpr(item))
-            if item[0] == "polyline":
-                object.graphicalItems.append(PolyLine().from_sexpr(item))
-            if item[0] == "arc":
-                object.shapes.append(Arc.from_sexpr(item))
-            if item[0] == "circle":
-                object.shapes.append(Circle.from_sexpr(item))
-            if item[0] == "rectangle":
-                object.shapes.append(Rectangle.from_sexpr(item))
-            if item[0] == "image":
-                object.images.append(Image().from_sexpr(item))
-            if item[0] == "text":
-                object.texts.append(Text().from_sexpr(item))
-            if item[0] == "text_box":
-                object.textBoxes.append(TextBox().from_sexpr(item))
-            if item[0] == "label":
-                object.labels.append(LocalLabel().from_sexpr(item))
-            if item[0] == "global_label":
-                object.globalLabels.append(GlobalLabel().from_sexpr(item))
-            if item[0] == "hierarchical_label":
-                object.hierarchicalLabels.append(HierarchicalLabel().from_sexpr(item))
-            if item[0] == "netclass_flag":
-                object.netclassFlags.append(NetclassFlag.from_sexpr(item))
-            if item[0] == "symbol":
-                object.schematicSymbols.append(SchematicSymbol().from_sexpr(item))
-            if item[0] == "sheet":
-                object.sheets.append(HierarchicalSheet().from_sexpr(item))
-            if item[0] == "sheet_instances":
-                for instance in item[1:]:
-                    object.sheetInstances.append(
-                        HierarchicalSheetInstance().from_sexpr(instance)
-                    )
-            if item[0] == "symbol_instances":
-                for instance in item[1:]:
-                    object.symbolInstances.append(SymbolInstance().from_sexpr(instance))
-        return object
+        object = new_object(cls)
+        handlers = cls.tokenHandlers
+        for item in forms:
+            handler = handlers.get(item[0])
+            if handler is not None:
+                handler(object, item)
+        return fill_defaults(object)
 
     @classmethod
-    def from_file(cls, filepath: str, encoding: Optional[str] = None) -> Schematic:
+    def from_file(
+        cls,
+        filepath: str,
+        encoding: Optional[str] = None,
+        mmap: bool = False,
+        exact: bool = False,
+        cache: Union[bool, ParseCache] = False,
+    ) -> Schematic:
         """Load a schematic directly from a KiCad schematic file (`.kicad_sch`) and sets the
         ``self.filePath`` attribute to the given file path.
 
@@ -230,6 +278,16 @@ class Schematic:
             - filepath (str): Path or path-like object that points to the file
             - encoding (str, optional): Encoding of the input file. Defaults to None (platform
                                         dependent encoding).
+            - mmap (bool): Memory-map the file and parse its bytes in place instead of reading it
+                           as text. The file is decoded using ``encoding`` or UTF-8 if not
+                           given. Defaults to False.
+            - exact (bool): Keep numbers as ``sexpr.Number`` objects holding their original
+                            text, so that values that are not changed are written back exactly
+                            as they were read. Defaults to False.
+            - cache (Union[bool, ParseCache]): Reuse the object stored for the file in the given
+                                               cache (``kiutils.utils.cache.default_cache`` if
+                                               True) as long as the file is unchanged, or store
+                                               the loaded object there. Defaults to False.
 
         Raises:
             - Exception: If the given path is not a file
@@ -240,10 +298,26 @@ class Schematic:
         if not path.isfile(filepath):
             raise Exception("Given path is not a file!")
 
-        with open(filepath, "r", encoding=encoding) as infile:
-            item = cls.from_sexpr(sexpr.parse_sexp(infile.read()))
-            item.filePath = filepath
-            return item
+        if cache:
+            from kiutils.utils.cache import load_cached
+
+            return load_cached(
+                cache,
+                cls,
+                filepath,
+                lambda: cls.from_file(filepath, encoding, mmap, exact),
+                encoding=encoding,
+                exact=exact,
+            )
+
+        if mmap:
+            with sexpr.mapped_file(filepath) as data:
+                item = cls.from_forms(sexpr.iterforms(data, encoding or "utf-8", exact))
+        else:
+            with open(filepath, "r", encoding=encoding) as infile:
+                item = cls.from_forms(sexpr.iterforms(infile, exact=exact))
+        item.filePath = filepath
+        return item
 
     @classmethod
     def create_new(cls) -> Schematic:
@@ -279,125 +353,140 @@ class Schematic:
             filepath = self.filePath
 
         with open(filepath, "w", encoding=encoding) as outfile:
-            outfile.write(self.to_sexpr())
+            self.write_sexpr(outfile)
 
-    def to_sexpr(self, indent=0, newline=True) -> str:
-        """Generate the S-Expression representing this object
+    def write_sexpr(self, stream, indent=0, newline=True):
+        """Write the S-Expression representing this object to the given stream
 
         Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
             - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
+        write = stream_writer(stream)
         indents = " " * indent
         endline = "\n" if newline else ""
 
-        expression = f"{indents}(kicad_sch (version {self.version}) (generator {self.generator})\n"
+        write(
+            f"{indents}(kicad_sch (version {self.version}) (generator {self.generator})\n"
+        )
         if self.uuid is not None:
-            expression += f"\n{indents}  (uuid {self.uuid})\n\n"
-        expression += f"{self.paper.to_sexpr(indent + 2)}"
+            write(f"\n{indents}  (uuid {self.uuid})\n\n")
+        self.paper.write_sexpr(stream, indent + 2)
         if self.titleBlock is not None:
-            expression += f"\n{self.titleBlock.to_sexpr(indent + 2)}"
+            write("\n")
+            self.titleBlock.write_sexpr(stream, indent + 2)
 
         if self.libSymbols:
-            expression += f"\n{indents}  (lib_symbols"
+            write(f"\n{indents}  (lib_symbols")
             for item in self.libSymbols:
-                expression += "\n"
-                expression += item.to_sexpr(indent + 4)
-            expression += f"{indents}  )\n"
+                write("\n")
+                item.write_sexpr(stream, indent + 4)
+            write(f"{indents}  )\n")
         else:
-            expression += f"{indents}  (lib_symbols)\n"
+            write(f"{indents}  (lib_symbols)\n")
 
         if self.junctions:
-            expression += "\n"
+            write("\n")
             for item in self.junctions:
-                expression += item.to_sexpr(indent + 2)
+                item.write_sexpr(stream, indent + 2)
 
         if self.noConnects:
-            expression += "\n"
+            write("\n")
             for item in self.noConnects:
-                expression += item.to_sexpr(indent + 2)
+                item.write_sexpr(stream, indent + 2)
 
         if self.busEntries:
-            expression += "\n"
+            write("\n")
             for item in self.busEntries:
-                expression += item.to_sexpr(indent + 2)
+                item.write_sexpr(stream, indent + 2)
 
         if self.busAliases:
-            expression += "\n"
+            write("\n")
             for item in self.busAliases:
-                expression += item.to_sexpr(indent + 2)
+                item.write_sexpr(stream, indent + 2)
 
         if self.graphicalItems:
-            expression += "\n"
+            write("\n")
             for item in self.graphicalItems:
-                expression += item.to_sexpr(indent + 2)
+                item.write_sexpr(stream, indent + 2)
 
         if self.shapes:
-            expression += "\n"
+            write("\n")
             for item in self.shapes:
-                expression += item.to_sexpr(indent + 2)
+                item.write_sexpr(stream, indent + 2)
 
         if self.images:
-            expression += "\n"
+            write("\n")
             for item in self.images:
-                expression += item.to_sexpr(indent + 2)
+                item.write_sexpr(stream, indent + 2)
 
         if self.textBoxes:
-            expression += "\n"
+            write("\n")
             for item in self.textBoxes:
-                expression += item.to_sexpr(indent + 2)
+                item.write_sexpr(stream, indent + 2)
 
         if self.texts:
-            expression += "\n"
+            write("\n")
             for item in self.texts:
-                expression += item.to_sexpr(indent + 2)
+                item.write_sexpr(stream, indent + 2)
 
         if self.labels:
-            expression += "\n"
+            write("\n")
             for item in self.labels:
-                expression += item.to_sexpr(indent + 2)
+                item.write_sexpr(stream, indent + 2)
 
         if self.globalLabels:
-            expression += "\n"
+            write("\n")
             for item in self.globalLabels:
-                expression += item.to_sexpr(indent + 2)
+                item.write_sexpr(stream, indent + 2)
 
         if self.hierarchicalLabels:
-            expression += "\n"
+            write("\n")
             for item in self.hierarchicalLabels:
-                expression += item.to_sexpr(indent + 2)
+                item.write_sexpr(stream, indent + 2)
 
         if self.netclassFlags:
-            expression += "\n"
+            write("\n")
             for item in self.netclassFlags:
-                expression += item.to_sexpr(indent + 2)
+                item.write_sexpr(stream, indent + 2)
 
         if self.schematicSymbols:
             for item in self.schematicSymbols:
-                expression += "\n"
-                expression += item.to_sexpr(indent + 2)
+                write("\n")
+                item.write_sexpr(stream, indent + 2)
 
         if self.sheets:
             for item in self.sheets:
-                expression += "\n"
-                expression += item.to_sexpr(indent + 2)
+                write("\n")
+                item.write_sexpr(stream, indent + 2)
 
         if self.sheetInstances:
-            expression += "\n"
-            expression += "  (sheet_instances\n"
+            write("\n")
+            write("  (sheet_instances\n")
             for item in self.sheetInstances:
-                expression += item.to_sexpr(indent + 4)
-            expression += "  )\n"
+                item.write_sexpr(stream, indent + 4)
+            write("  )\n")
 
         if self.symbolInstances:
-            expression += "\n"
-            expression += "  (symbol_instances\n"
+            write("\n")
+            write("  (symbol_instances\n")
             for item in self.symbolInstances:
-                expression += item.to_sexpr(indent + 4)
-            expression += "  )\n"
+                item.write_sexpr(stream, indent + 4)
+            write("  )\n")
+
+        write(f"{indents}){endline}")
+
+    def to_sexpr(self, indent=0, newline=True) -> str:
+        """Generate the S-Expression representing this object
 
-        expression += f"{indents}){endline}"
-        return expression
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buffer = []
+        self.write_sexpr(buffer, indent=indent, newline=newline)
+        return "".join(buffer)
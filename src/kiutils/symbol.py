@@ -14,10 +14,21 @@ Documentation taken from:
 
 from __future__ import annotations
 
+import copy
 import re
 from dataclasses import dataclass, field
 from os import path
-from typing import List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from kiutils.items.common import Effects, Font, Position, Property
 from kiutils.items.syitems import (
@@ -31,11 +42,28 @@ from kiutils.items.syitems import (
 )
 from kiutils.misc.config import KIUTILS_CREATE_NEW_VERSION_STR
 from kiutils.utils import sexpr
+from kiutils.utils.aio import AsyncFile
+from kiutils.utils.construct import fill_defaults, new_object
+from kiutils.utils.dispatch import TokenDispatch, TokenHandler
+from kiutils.utils.lazy import (
+    LazyList,
+    SourceForms,
+    is_watched,
+    pending,
+    reading,
+    source_text,
+    split_forms,
+    watch,
+)
 from kiutils.utils.strings import dequote
+from kiutils.utils.writer import SexprWritable, stream_writer
+
+if TYPE_CHECKING:
+    from kiutils.utils.cache import ParseCache
 
 
 @dataclass
-class SymbolAlternativePin:
+class SymbolAlternativePin(SexprWritable):
     pinName: str = ""
     """The ``pinName`` token defines the name of the alternative pin function"""
 
@@ -90,7 +118,7 @@ class SymbolAlternativePin:
 
 
 @dataclass
-class SymbolPin:
+class SymbolPin(SexprWritable):
     """The ``pin`` token defines a pin in a symbol definition.
 
     Documentation:
@@ -152,7 +180,7 @@ class SymbolPin:
         if exp[0] != "pin":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.electricalType = exp[1]
         object.graphicalStyle = exp[2]
         for item in exp[3:]:
@@ -164,20 +192,20 @@ class SymbolPin:
                 # v9 format: (hide yes) or (hide no)
                 object.hide = len(item) < 2 or item[1] == "yes"
             elif item[0] == "at":
-                object.position = Position().from_sexpr(item)
+                object.position = Position.from_sexpr(item)
             elif item[0] == "length":
                 object.length = item[1]
             elif item[0] == "name":
                 object.name = item[1]
                 if len(item) > 2:
-                    object.nameEffects = Effects().from_sexpr(item[2])
+                    object.nameEffects = Effects.from_sexpr(item[2])
             elif item[0] == "number":
                 object.number = item[1]
                 if len(item) > 2:
-                    object.numberEffects = Effects().from_sexpr(item[2])
+                    object.numberEffects = Effects.from_sexpr(item[2])
             elif item[0] == "alternate":
-                object.alternatePins.append(SymbolAlternativePin().from_sexpr(item))
-        return object
+                object.alternatePins.append(SymbolAlternativePin.from_sexpr(item))
+        return fill_defaults(object)
 
     def to_sexpr(self, indent: int = 4, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -237,8 +265,18 @@ class SymbolPin:
         return expression
 
 
+def _parse_pin_names(symbol: Symbol, item: list):
+    """Token handler of the ``pin_names`` item of symbols"""
+    symbol.pinNames = True
+    symbol.pinNamesHide = Symbol._parse_hide_property(item[1:])
+    # Handle other pin_names properties
+    for property in item[1:]:
+        if isinstance(property, list) and property[0] == "offset":
+            symbol.pinNamesOffset = property[1]
+
+
 @dataclass
-class Symbol:
+class Symbol(SexprWritable, TokenDispatch):
     """The ``symbol`` token defines a symbol or sub-unit of a parent symbol. There can be zero or more
     ``symbol`` tokens in a symbol library file.
 
@@ -248,6 +286,53 @@ class Symbol:
 
     """Each symbol must have """
 
+    tokenHandlers: ClassVar[Dict[str, TokenHandler]] = {
+        "extends": lambda object, item: setattr(object, "extends", item[1]),
+        "pin_numbers": lambda object, item: setattr(
+            object, "hidePinNumbers", Symbol._parse_hide_property(item[1:])
+        ),
+        "pin_names": lambda object, item: _parse_pin_names(object, item),
+        "in_bom": lambda object, item: setattr(
+            object, "inBom", True if item[1] == "yes" else False
+        ),
+        "on_board": lambda object, item: setattr(
+            object, "onBoard", True if item[1] == "yes" else False
+        ),
+        "power": lambda object, item: setattr(object, "isPower", True),
+        "exclude_from_sim": lambda object, item: setattr(
+            object, "excludeFromSim", item[1] == "yes"
+        ),
+        "embedded_fonts": lambda object, item: setattr(
+            object, "embeddedFonts", item[1] == "yes"
+        ),
+        "symbol": lambda object, item: object.units.append(Symbol.from_sexpr(item)),
+        "property": lambda object, item: object.properties.append(
+            Property.from_sexpr(item)
+        ),
+        "pin": lambda object, item: object.pins.append(SymbolPin.from_sexpr(item)),
+        "arc": lambda object, item: object.graphicItems.append(SyArc.from_sexpr(item)),
+        "circle": lambda object, item: object.graphicItems.append(
+            SyCircle.from_sexpr(item)
+        ),
+        "curve": lambda object, item: object.graphicItems.append(
+            SyCurve.from_sexpr(item)
+        ),
+        "polyline": lambda object, item: object.graphicItems.append(
+            SyPolyLine.from_sexpr(item)
+        ),
+        "rectangle": lambda object, item: object.graphicItems.append(
+            SyRect.from_sexpr(item)
+        ),
+        "text": lambda object, item: object.graphicItems.append(
+            SyText.from_sexpr(item)
+        ),
+        "text_box": lambda object, item: object.graphicItems.append(
+            SyTextBox.from_sexpr(item)
+        ),
+    }
+    """The ``tokenHandlers`` token defines the handler of every known token of the items
+    of ``(symbol ...)`` (see ``kiutils.utils.dispatch.TokenDispatch``)"""
+
     @property
     def libId(self) -> str:
         """The ``lib_id`` token defines a unique "LIBRARY_ID" for each top level symbol in the
@@ -437,52 +522,11 @@ class Symbol:
 
         object = cls()
         object.libId = exp[1]
+        handlers = cls.tokenHandlers
         for item in exp[2:]:
-            if item[0] == "extends":
-                object.extends = item[1]
-            if item[0] == "pin_numbers":
-                object.hidePinNumbers = cls._parse_hide_property(item[1:])
-            if item[0] == "pin_names":
-                object.pinNames = True
-                object.pinNamesHide = cls._parse_hide_property(item[1:])
-                # Handle other pin_names properties
-                for property in item[1:]:
-                    if isinstance(property, list) and property[0] == "offset":
-                        object.pinNamesOffset = property[1]
-            if item[0] == "in_bom":
-                object.inBom = True if item[1] == "yes" else False
-            if item[0] == "on_board":
-                object.onBoard = True if item[1] == "yes" else False
-            if item[0] == "power":
-                object.isPower = True
-            if item[0] == "exclude_from_sim":
-                object.excludeFromSim = (
-                    item[1] == "yes"
-                )  # Note: "no" means False, "yes" means True
-            if item[0] == "embedded_fonts":
-                object.embeddedFonts = item[1] == "yes"
-
-            if item[0] == "symbol":
-                object.units.append(Symbol().from_sexpr(item))
-            if item[0] == "property":
-                object.properties.append(Property().from_sexpr(item))
-
-            if item[0] == "pin":
-                object.pins.append(SymbolPin().from_sexpr(item))
-            if item[0] == "arc":
-                object.graphicItems.append(SyArc().from_sexpr(item))
-            if item[0] == "circle":
-                object.graphicItems.append(SyCircle().from_sexpr(item))
-            if item[0] == "curve":
-                object.graphicItems.append(SyCurve().from_sexpr(item))
-            if item[0] == "polyline":
-                object.graphicItems.append(SyPolyLine().from_sexpr(item))
-            if item[0] == "rectangle":
-                object.graphicItems.append(SyRect().from_sexpr(item))
-            if item[0] == "text":
-                object.graphicItems.append(SyText().from_sexpr(item))
-            if item[0] == "text_box":
-                object.graphicItems.append(SyTextBox().from_sexpr(item))
+            handler = handlers.get(item[0])
+            if handler is not None:
+                handler(object, item)
 
         return object
 
@@ -541,16 +585,48 @@ class Symbol:
         )
         return symbol
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object
+    def inherit(self, parent: Symbol) -> Symbol:
+        """Create the flattened form of this derived symbol (see ``self.extends``), like KiCad
+        shows it: the parent with the name of this symbol, the properties of this symbol overlaid
+        on the parent's properties and the ``inBom``, ``onBoard`` and ``excludeFromSim`` settings
+        of this symbol, if set.
+
+        The flattened symbol is a view: its units, pins and graphical items are shared with the
+        parent and its properties with both symbols. Use ``copy.deepcopy()`` on it to get a symbol
+        that may be changed.
 
         Args:
-            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
-            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+            - parent (Symbol): The (flattened) symbol this symbol extends
 
         Returns:
-            - str: S-Expression of this object
+            - Symbol: New symbol without ``extends``
         """
+        flat = copy.copy(parent)
+        flat.extends = None
+        flat.units = [copy.copy(unit) for unit in parent.units]
+        flat.libId = self.libId
+        flat.properties = list(parent.properties)
+        keys = {item.key: index for index, item in enumerate(flat.properties)}
+        for item in self.properties:
+            if item.key in keys:
+                flat.properties[keys[item.key]] = item
+            else:
+                keys[item.key] = len(flat.properties)
+                flat.properties.append(item)
+        for name in ("inBom", "onBoard", "excludeFromSim"):
+            if getattr(self, name) is not None:
+                setattr(flat, name, getattr(self, name))
+        return flat
+
+    def write_sexpr(self, stream, indent: int = 2, newline: bool = True):
+        """Write the S-Expression representing this object to the given stream
+
+        Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+        """
+        write = stream_writer(stream)
         indents = " " * indent
         endline = "\n" if newline else ""
         obtext, ibtext = "", ""
@@ -584,21 +660,36 @@ class Symbol:
             f' (extends "{dequote(self.extends)}")' if self.extends is not None else ""
         )
 
-        expression = f'{indents}(symbol "{dequote(self.libId)}"{extends}{power}{exclude_sim}{pinnumbers}{pinnames}{inbom}{onboard}{embeddedFonts}\n'
+        write(
+            f'{indents}(symbol "{dequote(self.libId)}"{extends}{power}{exclude_sim}{pinnumbers}{pinnames}{inbom}{onboard}{embeddedFonts}\n'
+        )
         for item in self.properties:
-            expression += item.to_sexpr(indent + 2)
+            item.write_sexpr(stream, indent + 2)
         for item in self.graphicItems:
-            expression += item.to_sexpr(indent + 2)
+            item.write_sexpr(stream, indent + 2)
         for item in self.pins:
-            expression += item.to_sexpr(indent + 2)
+            item.write_sexpr(stream, indent + 2)
         for item in self.units:
-            expression += item.to_sexpr(indent + 2)
-        expression += f"{indents}){endline}"
-        return expression
+            item.write_sexpr(stream, indent + 2)
+        write(f"{indents}){endline}")
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buffer = []
+        self.write_sexpr(buffer, indent=indent, newline=newline)
+        return "".join(buffer)
 
 
 @dataclass
-class SymbolLib:
+class SymbolLib(SexprWritable, AsyncFile):
     """A symbol library defines the common format of ``.kicad_sym`` files. A symbol library may contain
     zero or more symbols.
 
@@ -619,8 +710,27 @@ class SymbolLib:
     """The ``filePath`` token defines the path-like string to the library file. Automatically set when
     ``self.from_file()`` is used. Allows the use of ``self.to_file()`` without parameters."""
 
+    _flattened: Dict[str, Tuple[Symbol, Optional[tuple], Symbol]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """Memoized results of ``self.flatten()`` by the symbol's name: the symbol, the entry of its
+    parent and the flattened symbol, both watched for changes. Not pickled."""
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_flattened"] = {}
+        return state
+
     @classmethod
-    def from_file(cls, filepath: str, encoding: Optional[str] = None) -> SymbolLib:
+    def from_file(
+        cls,
+        filepath: str,
+        encoding: Optional[str] = None,
+        mmap: bool = False,
+        exact: bool = False,
+        cache: Union[bool, ParseCache] = False,
+        lazy: bool = False,
+    ) -> SymbolLib:
         """Load a symbol library directly from a KiCad footprint file (`.kicad_sym`) and sets the
         ``self.filePath`` attribute to the given file path.
 
@@ -628,6 +738,20 @@ class SymbolLib:
             - filepath (str): Path or path-like object that points to the file
             - encoding (str, optional): Encoding of the input file. Defaults to None (platform
                                         dependent encoding).
+            - mmap (bool): Memory-map the file and parse its bytes in place instead of reading it
+                           as text. The file is decoded using ``encoding`` or UTF-8 if not
+                           given. Defaults to False.
+            - exact (bool): Keep numbers as ``sexpr.Number`` objects holding their original
+                            text, so that values that are not changed are written back exactly
+                            as they were read. Defaults to False.
+            - cache (Union[bool, ParseCache]): Reuse the object stored for the file in the given
+                                               cache (``kiutils.utils.cache.default_cache`` if
+                                               True) as long as the file is unchanged, or store
+                                               the loaded object there. Defaults to False.
+            - lazy (bool): Only index the symbols by their name instead of parsing them. Single
+                           symbols are built by ``self.get()``, all of them as soon as
+                           ``self.symbols`` is accessed. Symbols that were not changed are
+                           written back by copying their source text. Defaults to False.
 
         Raises:
             - Exception: If the given path is not a file
@@ -638,10 +762,36 @@ class SymbolLib:
         if not path.isfile(filepath):
             raise Exception("Given path is not a file!")
 
-        with open(filepath, "r", encoding=encoding) as infile:
-            item = cls.from_sexpr(sexpr.parse_sexp(infile.read()))
-            item.filePath = filepath
-            return item
+        if cache:
+            from kiutils.utils.cache import load_cached
+
+            return load_cached(
+                cache,
+                cls,
+                filepath,
+                lambda: cls.from_file(filepath, encoding, mmap, exact, lazy=lazy),
+                encoding=encoding,
+                exact=exact,
+                lazy=lazy,
+            )
+
+        if lazy:
+            with open(filepath, "rb") as infile:
+                data = infile.read()
+            encoding = encoding or "utf-8"
+            symbols = SourceForms(data, encoding, {"symbol": Symbol}, exact=exact)
+            item = cls.from_forms(
+                split_forms(data, encoding, {"symbols": symbols}, exact)
+            )
+            item.symbols = symbols
+        elif mmap:
+            with sexpr.mapped_file(filepath) as data:
+                item = cls.from_forms(sexpr.iterforms(data, encoding or "utf-8", exact))
+        else:
+            with open(filepath, "r", encoding=encoding) as infile:
+                item = cls.from_forms(sexpr.iterforms(infile, exact=exact))
+        item.filePath = filepath
+        return item
 
     @classmethod
     def from_sexpr(cls, exp: list) -> SymbolLib:
@@ -660,20 +810,164 @@ class SymbolLib:
         if not isinstance(exp, list):
             raise Exception("Expression does not have the correct type")
 
-        if exp[0] != "kicad_symbol_lib":
+        return cls.from_forms(exp)
+
+    @classmethod
+    def from_forms(cls, forms: Iterable) -> SymbolLib:
+        """Convert the items of a ``(kicad_symbol_lib ...)`` expression into a SymbolLib object.
+        The items are consumed one by one, so they may be supplied by a generator like
+        ``sexpr.iterforms()`` without ever building the whole parsed S-Expression.
+
+        Args:
+            - forms (Iterable): Items of the parsed S-Expression ``(kicad_symbol_lib ...)``,
+                                starting with the ``kicad_symbol_lib`` token itself
+
+        Raises:
+            - Exception: When the first item is not kicad_symbol_lib
+
+        Returns:
+            - SymbolLib: Object of the class initialized with the given items
+        """
+        forms = iter(forms)
+        if next(forms, None) != "kicad_symbol_lib":
             raise Exception("Expression does not have the correct type")
 
         object = cls()
 
-        for item in exp[1:]:
+        for item in forms:
             if item[0] == "version":
                 object.version = str(item[1])
             if item[0] == "generator":
                 object.generator = item[1]
             if item[0] == "symbol":
-                object.symbols.append(Symbol().from_sexpr(item))
+                object.symbols.append(Symbol.from_sexpr(item))
         return object
 
+    def get(self, name: str) -> Symbol:
+        """Get a symbol of the library by its name. If the library was loaded lazily (see
+        ``self.from_file()``), only the requested symbol is built.
+
+        Args:
+            - name (str): Name of the symbol, e.g. ``R``
+
+        Raises:
+            - Exception: If the library has no symbol with the given name
+
+        Returns:
+            - Symbol: The first symbol with the given name
+        """
+        symbols = pending(self, "symbols")
+        if symbols is not None:
+            symbol = symbols.get(name)
+        else:
+            symbol = next((item for item in self.symbols if item.libId == name), None)
+        if symbol is None:
+            raise Exception(f"Symbol {name} not found in library")
+        return symbol
+
+    def flatten(self, name: str) -> Symbol:
+        """Get the flattened form of a symbol of the library, with its ``extends`` chain resolved
+        (see ``Symbol.inherit()``).
+
+        The result is a deep copy that shares no objects with the symbols of the library. Results
+        are memoized, and the symbol, the symbols it extends and the result are watched for
+        changes (see ``kiutils.utils.lazy.watch()``). A memoized result is reused as long as
+        these are the same objects and none of them was changed in place, so editing a parent
+        symbol is detected without further calls. Changes through references to nested objects
+        that were taken before the symbol was flattened are not detected; call
+        ``self.invalidate(name)`` after those.
+
+        Args:
+            - name (str): Name of the symbol
+
+        Raises:
+            - Exception: If the library has no symbol with the given name or with the name of a
+                         symbol it extends
+            - Exception: If the symbol extends itself, directly or indirectly
+
+        Returns:
+            - Symbol: The flattened symbol, a copy of the symbol itself if it extends no other
+                      symbol. Unchanged results are shared by all calls.
+        """
+        return self._flatten(name, self.get, ())[2]
+
+    def invalidate(self, name: Optional[str] = None):
+        """Discard the memoized result of ``self.flatten()`` for a symbol that was changed in a way
+        that is not detected (see ``self.flatten()``). The results of the symbols derived from it
+        are created again as well.
+
+        Args:
+            - name (str, optional): Name of the changed symbol. Defaults to None, which discards
+                                    the results of all symbols.
+        """
+        if name is None:
+            self._flattened.clear()
+        else:
+            self._flattened.pop(name, None)
+
+    def flatten_all(self) -> List[Symbol]:
+        """Get the flattened form of all symbols of the library (see ``self.flatten()``)
+
+        Returns:
+            - List[Symbol]: The flattened symbols, in the order of the library
+        """
+        symbols = {}
+        for item in self.symbols:
+            symbols.setdefault(item.libId, item)
+
+        def lookup(name: str) -> Symbol:
+            symbol = symbols.get(name)
+            if symbol is None:
+                raise Exception(f"Symbol {name} not found in library")
+            return symbol
+
+        return [self._flatten(item.libId, lookup, ())[2] for item in self.symbols]
+
+    def _flatten(
+        self, name: str, lookup: Callable[[str], Symbol], chain: Tuple[str, ...]
+    ) -> tuple:
+        """Get the memoized entry of the flattened symbol with the given name or create it"""
+        if name in chain:
+            raise Exception(f"Symbol {name} extends itself")
+        symbol = lookup(name)
+        parent = (
+            self._flatten(symbol.extends, lookup, chain + (name,))
+            if symbol.extends is not None
+            else None
+        )
+
+        entry = self._flattened.get(name)
+        if (
+            entry is not None
+            and entry[0] is symbol
+            and entry[1] is parent
+            and is_watched(symbol)
+            and is_watched(entry[2])
+        ):
+            return entry
+
+        if parent is None:
+            with reading(symbol):
+                flat = copy.deepcopy(symbol)
+        else:
+            with reading(symbol, parent[2]):
+                flat = copy.deepcopy(symbol.inherit(parent[2]))
+        watch(symbol)
+        entry = self._flattened[name] = (symbol, parent, watch(flat))
+        return entry
+
+    def names(self) -> List[str]:
+        """List the names of the symbols of the library. Symbols of a lazily loaded library are
+        not built.
+
+        Returns:
+            - List[str]: Names of the symbols, in the order of the library
+        """
+        symbols = pending(self, "symbols")
+        if symbols is not None:
+            return list(symbols.names)
+        return [item.libId for item in self.symbols]
+
     def to_file(self, filepath=None, encoding: Optional[str] = None):
         """Save the object to a file in S-Expression format
 
@@ -692,7 +986,36 @@ class SymbolLib:
             filepath = self.filePath
 
         with open(filepath, "w", encoding=encoding) as outfile:
-            outfile.write(self.to_sexpr())
+            self.write_sexpr(outfile)
+
+    def write_sexpr(self, stream, indent: int = 0, newline: bool = True):
+        """Write the S-Expression representing this object to the given stream
+
+        Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+        """
+        write = stream_writer(stream)
+        indents = " " * indent
+        endline = "\n" if newline else ""
+
+        write(
+            f"{indents}(kicad_symbol_lib (version {self.version}) (generator {self.generator})\n"
+        )
+        symbols = pending(self, "symbols")
+        if symbols is not None:
+            # Same indentation as the first line of the serialized symbols below
+            symbols.write_sexpr(stream, 2 * indent + 2)
+        else:
+            for item in self.symbols:
+                write(indents)
+                text = source_text(self.symbols, item, indent + 2)
+                if text is None:
+                    item.write_sexpr(stream, indent + 2)
+                else:
+                    write(text)
+        write(f"{indents}){endline}")
 
     def to_sexpr(self, indent: int = 0, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
@@ -704,11 +1027,11 @@ class SymbolLib:
         Returns:
             - str: S-Expression of this object
         """
-        indents = " " * indent
-        endline = "\n" if newline else ""
+        buffer = []
+        self.write_sexpr(buffer, indent=indent, newline=newline)
+        return "".join(buffer)
 
-        expression = f"{indents}(kicad_symbol_lib (version {self.version}) (generator {self.generator})\n"
-        for item in self.symbols:
-            expression += f"{indents}{item.to_sexpr(indent + 2)}"
-        expression += f"{indents}){endline}"
-        return expression
+
+# Symbols of libraries loaded with ``SymbolLib.from_file(lazy=True)`` are built when they are
+# accessed for the first time
+SymbolLib.symbols = LazyList("symbols")
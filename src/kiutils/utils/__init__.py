@@ -5,11 +5,35 @@ that are used throughout the kiutils library.
 
 Modules:
 - sexpr: S-Expression parsing utilities for KiCad file formats
+- aio: Loading and saving KiCad files from asyncio code without blocking the event loop
+- cache: Persistent on-disk cache of objects loaded from KiCad files
+- construct: Construction of objects without throwaway default values
+- dispatch: Token-to-handler tables for converting S-Expressions into objects
+- flyweight: Sharing of identical immutable sub-objects between the items of KiCad files
+- formindex: Index of the top-level forms of KiCad files for random access
+- lazy: Deferred construction of list items from the source text of KiCad files
+- parallel: Conversion of the top-level forms of a file in multiple processes
+- slots: Compact dataclasses whose objects store their fields in __slots__
+- stats: Throughput statistics of loading KiCad files
 - strings: String manipulation utilities including dequote and prefix removal
+- views: Objects that write changes through to the array or table they were taken from
+- writer: Protocol for writing S-Expressions to streams piece by piece
 """
 
-# Import the sexpr module (contains multiple functions)
-from . import sexpr
+import importlib
+
+# Import the utility modules (contain multiple functions and classes)
+from . import construct, dispatch, flyweight, lazy, sexpr, slots, stats, views, writer
+
+# Modules that are only needed by some functions, imported on first access
+_LAZY_MODULES = ("aio", "cache", "formindex", "parallel")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Import specific string utilities
 from .strings import dequote, remove_prefix
@@ -17,6 +41,18 @@ from .strings import dequote, remove_prefix
 # Export list for controlled imports
 __all__ = [
     "sexpr",  # S-Expression parsing module
+    "aio",  # Asyncio loading module
+    "cache",  # Parse cache module
+    "construct",  # Object construction module
+    "dispatch",  # Token handler dispatch module
+    "flyweight",  # Shared object module
+    "formindex",  # Top-level form index module
+    "lazy",  # Lazy loading module
+    "parallel",  # Parallel loading module
+    "slots",  # Slotted dataclass module
+    "stats",  # Load statistics module
+    "views",  # Write-through view module
+    "writer",  # Stream writing module
     "dequote",  # Remove quotes from strings
     "remove_prefix",  # Remove prefix from strings
 ]
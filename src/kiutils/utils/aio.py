@@ -0,0 +1,129 @@
+"""Loading and saving KiCad files from asyncio code without blocking the event loop
+
+Author:
+    (C) kiutils contributors - 2026
+
+License identifier:
+    GPL-3.0
+
+Major changes:
+    17.10.2026 - created
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from typing import TYPE_CHECKING, Callable, Optional
+
+from kiutils.utils import sexpr
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+DEFAULT_MAX_WORKERS = 4
+"""Number of threads of the default executor"""
+
+_default_executor: Optional[Executor] = None
+_default_executor_lock = threading.Lock()
+
+
+def default_executor() -> Executor:
+    """Get the executor used when no other executor is given. It is created on first use and has
+    ``DEFAULT_MAX_WORKERS`` threads, so at most as many files are loaded or saved at once.
+
+    Returns:
+        - Executor: The default executor
+    """
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            _default_executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="kiutils"
+            )
+        return _default_executor
+
+
+async def run_cancellable(
+    function: Callable, *args, executor: Optional[Executor] = None, **kwargs
+):
+    """Run a function in an executor and wait for its result. If the waiting task is cancelled,
+    the function is stopped before the next top-level form it parses (see
+    ``sexpr.cancellable()``).
+
+    Args:
+        - function (Callable): The function, e.g. ``Board.from_file``
+        - *args, **kwargs: Arguments of the function
+        - executor (Executor, optional): Thread pool to run the function in. Defaults to None
+                                         (``default_executor()``).
+
+    Returns:
+        - The result of the function
+    """
+    import asyncio
+
+    cancelled = threading.Event()
+
+    def run():
+        with sexpr.cancellable(cancelled):
+            sexpr.check_cancelled()
+            return function(*args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor or default_executor(), run)
+    except asyncio.CancelledError:
+        cancelled.set()
+        raise
+
+
+class AsyncFile:
+    """Base class of all classes of KiCad files, i.e. classes with ``from_file()`` and
+    ``to_file()`` functions. It adds coroutines that run these functions in an executor, so that
+    they do not block the event loop.
+
+    Loading boards, schematics and symbol libraries stops before the next top-level form when the
+    awaiting task is cancelled. Other files are small and are only cancelled if they were not
+    started yet, as is saving.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    async def afrom_file(
+        cls, filepath: str, *args, executor: Optional[Executor] = None, **kwargs
+    ):
+        """Load an object from a file without blocking the event loop
+
+        Args:
+            - filepath (str): Path or path-like object that points to the file
+            - *args, **kwargs: Further arguments of ``from_file()``, e.g. the ``encoding``
+            - executor (Executor, optional): Thread pool to load the file in. Defaults to None
+                                             (``default_executor()``).
+
+        Returns:
+            - The loaded object
+        """
+        return await run_cancellable(
+            functools.partial(cls.from_file, filepath, *args, **kwargs),
+            executor=executor,
+        )
+
+    async def ato_file(
+        self, filepath=None, *args, executor: Optional[Executor] = None, **kwargs
+    ):
+        """Save the object to a file without blocking the event loop
+
+        Args:
+            - filepath (str, optional): Path-like string to the file. Defaults to None. If not
+                                        set, the attribute ``self.filePath`` will be used instead.
+            - *args, **kwargs: Further arguments of ``to_file()``, e.g. the ``encoding``
+            - executor (Executor, optional): Thread pool to save the file in. Defaults to None
+                                             (``default_executor()``).
+        """
+        await run_cancellable(
+            functools.partial(self.to_file, filepath, *args, **kwargs),
+            executor=executor,
+        )
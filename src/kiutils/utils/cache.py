@@ -0,0 +1,372 @@
+"""Persistent on-disk cache of objects loaded from KiCad files
+
+Author:
+    (C) kiutils contributors - 2026
+
+License identifier:
+    GPL-3.0
+
+Major changes:
+    17.10.2026 - created
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any, Callable, Optional, Tuple, Union
+
+from kiutils import __version__
+
+CACHE_FORMAT_VERSION = 2
+"""Version of the format of the cache entries. Entries of other versions, written by other
+versions of kiutils or for other layouts of its classes (see ``layout_fingerprint()``) are
+ignored."""
+
+CACHE_FILE_SUFFIX = ".kiutils-cache"
+"""Suffix of the files of the cache entries"""
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+"""Default maximum size of a cache directory in bytes"""
+
+LAYOUT_MODULES = (
+    "kiutils.board",
+    "kiutils.dru",
+    "kiutils.footprint",
+    "kiutils.libraries",
+    "kiutils.schematic",
+    "kiutils.symbol",
+    "kiutils.wks",
+    "kiutils.items.brditems",
+    "kiutils.items.common",
+    "kiutils.items.dimensions",
+    "kiutils.items.fpitems",
+    "kiutils.items.gritems",
+    "kiutils.items.schitems",
+    "kiutils.items.syitems",
+    "kiutils.items.zones",
+)
+"""Modules whose dataclasses make up the layout of the cached objects"""
+
+_layout: Optional[str] = None
+"""The fingerprint returned by ``layout_fingerprint()``, once computed"""
+
+
+def default_directory() -> str:
+    """Get the directory of the default cache. It is taken from the ``KIUTILS_CACHE_DIR``
+    environment variable, if set, or is the ``kiutils`` directory in the user's cache directory.
+
+    Returns:
+        - str: Path of the directory
+    """
+    directory = os.environ.get("KIUTILS_CACHE_DIR")
+    if directory:
+        return directory
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "kiutils")
+
+
+def content_hash(filepath: str) -> str:
+    """Hash the content of the given file
+
+    Args:
+        - filepath (str): Path or path-like object that points to the file
+
+    Returns:
+        - str: The BLAKE2b hash of the file as hex string
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(filepath, "rb") as infile:
+        for chunk in iter(lambda: infile.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def layout_fingerprint() -> str:
+    """Get a fingerprint of the layout of all classes of the cached objects. It changes whenever
+    a field or the ``__slots__`` of a dataclass in ``LAYOUT_MODULES`` is added, removed or
+    renamed, so that pickled objects of another layout are never loaded, even if the version of
+    kiutils is the same.
+
+    Returns:
+        - str: The BLAKE2b hash of the names of the classes and their fields as hex string
+    """
+    global _layout
+    if _layout is None:
+        classes = []
+        for name in LAYOUT_MODULES:
+            module = importlib.import_module(name)
+            for value in vars(module).values():
+                if (
+                    isinstance(value, type)
+                    and is_dataclass(value)
+                    and value.__module__ == name
+                ):
+                    classes.append(
+                        (
+                            name,
+                            value.__qualname__,
+                            tuple(f.name for f in fields(value)),
+                            "__slots__" in value.__dict__,
+                        )
+                    )
+        key = repr(sorted(classes)).encode("utf-8")
+        _layout = hashlib.blake2b(key, digest_size=20).hexdigest()
+    return _layout
+
+
+def _stat_and_hash(filepath: str) -> Tuple[os.stat_result, str]:
+    """Get the status and the content hash of a file, both taken from the same opened file"""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(filepath, "rb") as infile:
+        stat = os.fstat(infile.fileno())
+        for chunk in iter(lambda: infile.read(1 << 20), b""):
+            digest.update(chunk)
+    return stat, digest.hexdigest()
+
+
+@dataclass
+class ParseCache:
+    """The ``ParseCache`` token defines a directory in which objects loaded from KiCad files are
+    stored in a fast-loading serialized form (``pickle``). An entry is reused as long as the
+    loaded file has the same size and modification time, or the same content if only its
+    modification time changed (e.g. after a fresh checkout). The least recently used entries are
+    removed when the directory grows larger than ``maxSize``.
+
+    The entries are loaded with ``pickle``, so the directory must not be writable by untrusted
+    users.
+    """
+
+    directory: Optional[str] = None
+    """The ``directory`` token defines the directory of the cache entries. If None, the directory
+    returned by ``default_directory()`` is used."""
+
+    maxSize: int = DEFAULT_MAX_SIZE
+    """The ``maxSize`` token defines the maximum size of all cache entries in bytes"""
+
+    hits: int = 0
+    """The ``hits`` token defines how many objects were loaded from the cache"""
+
+    misses: int = 0
+    """The ``misses`` token defines how many objects had to be loaded from their file"""
+
+    evictions: int = 0
+    """The ``evictions`` token defines how many entries were removed to keep the size limit"""
+
+    _size: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    """Running total of the size of all entries, counted once by ``evict()`` and then updated
+    with every written entry, so that the directory is only scanned when it grows too large"""
+
+    def path(self) -> str:
+        """Get the directory of the cache entries
+
+        Returns:
+            - str: Path of the directory
+        """
+        return self.directory if self.directory is not None else default_directory()
+
+    def hit_rate(self) -> float:
+        """Get the share of objects that were loaded from the cache
+
+        Returns:
+            - float: Hits divided by all lookups, or 0.0 if there were none yet
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def entry_path(self, cls: type, filepath: str, **options) -> str:
+        """Get the path of the cache entry of the given file
+
+        Args:
+            - cls (type): Class of the loaded object
+            - filepath (str): Path or path-like object that points to the loaded file
+            - **options: Arguments of ``from_file()`` that change the loaded object
+
+        Returns:
+            - str: Path of the entry
+        """
+        key = repr(
+            (
+                cls.__module__,
+                cls.__qualname__,
+                os.path.abspath(filepath),
+                sorted(options.items()),
+            )
+        )
+        name = hashlib.blake2b(key.encode("utf-8"), digest_size=20).hexdigest()
+        return os.path.join(self.path(), f"{name}{CACHE_FILE_SUFFIX}")
+
+    def load(self, cls: type, filepath: str, loader: Callable[[], Any], **options):
+        """Get the object of the given file from the cache or load it and store it in the cache
+
+        Args:
+            - cls (type): Class of the loaded object
+            - filepath (str): Path or path-like object that points to the file
+            - loader (Callable): Function that loads the object from the file
+            - **options: Arguments of ``from_file()`` that change the loaded object, e.g.
+                         ``encoding``
+
+        Returns:
+            - The loaded object
+        """
+        entryPath = self.entry_path(cls, filepath, **options)
+        stat = os.stat(filepath)
+        header, payload = self._read(entryPath)
+        if header is not None and header["size"] == stat.st_size:
+            valid = header["mtime"] == stat.st_mtime_ns
+            if not valid and header["hash"] == content_hash(filepath):
+                valid = True
+                header["mtime"] = stat.st_mtime_ns
+                self._write(entryPath, header, payload)
+            if valid:
+                try:
+                    item = pickle.loads(payload)
+                except Exception:
+                    item = None
+                if item is not None:
+                    self.hits += 1
+                    try:
+                        # Mark the entry as recently used for the eviction
+                        os.utime(entryPath)
+                    except OSError:
+                        pass
+                    if getattr(item, "filePath", None) is not None:
+                        item.filePath = filepath
+                    return item
+
+        self.misses += 1
+        # The hash must be taken from the same content as the status. If the file is changed
+        # while it is loaded, the loaded object may differ from both, so it is not stored.
+        stat, digest = _stat_and_hash(filepath)
+        item = loader()
+        after = os.stat(filepath)
+        if (after.st_size, after.st_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            return item
+        header = {
+            "version": CACHE_FORMAT_VERSION,
+            "kiutils": __version__,
+            "layout": layout_fingerprint(),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "hash": digest,
+        }
+        self._write(
+            entryPath, header, pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        return item
+
+    def evict(self):
+        """Remove the least recently used entries until the cache is not larger than
+        ``self.maxSize``. Scans the cache directory and updates the running total of its size.
+        """
+        entries = []
+        try:
+            with os.scandir(self.path()) as scanned:
+                for entry in scanned:
+                    if entry.name.endswith(CACHE_FILE_SUFFIX):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except OSError:
+            self._size = 0
+            return
+
+        size = sum(entry[1] for entry in entries)
+        for _, entrySize, entryPath in sorted(entries):
+            if size <= self.maxSize:
+                break
+            try:
+                os.remove(entryPath)
+            except OSError:
+                continue
+            size -= entrySize
+            self.evictions += 1
+        self._size = size
+
+    def clear(self):
+        """Remove all entries of the cache and reset its counters"""
+        maxSize = self.maxSize
+        self.maxSize = -1
+        self.evict()
+        self.maxSize = maxSize
+        self.hits = self.misses = self.evictions = 0
+        self._size = None
+
+    def _read(self, entryPath: str):
+        """Read the header and the serialized object of a cache entry"""
+        try:
+            with open(entryPath, "rb") as infile:
+                header = pickle.load(infile)
+                if (
+                    not isinstance(header, dict)
+                    or header.get("version") != CACHE_FORMAT_VERSION
+                    or header.get("kiutils") != __version__
+                    or header.get("layout") != layout_fingerprint()
+                ):
+                    return None, None
+                return header, infile.read()
+        except Exception:
+            return None, None
+
+    def _write(self, entryPath: str, header: dict, payload: bytes):
+        """Write a cache entry atomically and evict old entries if the cache grew too large"""
+        if self._size is None:
+            self.evict()
+        directory = os.path.dirname(entryPath)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            previousSize = os.stat(entryPath).st_size
+        except OSError:
+            previousSize = 0
+        try:
+            with os.fdopen(handle, "wb") as outfile:
+                pickle.dump(header, outfile, protocol=pickle.HIGHEST_PROTOCOL)
+                outfile.write(payload)
+                size = outfile.tell()
+            os.replace(temporary, entryPath)
+        except OSError:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            return
+        self._size += size - previousSize
+        if self._size > self.maxSize:
+            self.evict()
+
+
+default_cache = ParseCache()
+"""The cache used by ``from_file(..., cache=True)``"""
+
+
+def load_cached(
+    cache: Union[bool, ParseCache],
+    cls: type,
+    filepath: str,
+    loader: Callable[[], Any],
+    **options,
+):
+    """Load an object through the given cache (see ``ParseCache.load()``)
+
+    Args:
+        - cache (Union[bool, ParseCache]): The cache, or True to use ``default_cache``
+        - cls (type): Class of the loaded object
+        - filepath (str): Path or path-like object that points to the file
+        - loader (Callable): Function that loads the object from the file
+        - **options: Arguments of ``from_file()`` that change the loaded object
+
+    Returns:
+        - The loaded object
+    """
+    if cache is True:
+        cache = default_cache
+    return cache.load(cls, filepath, loader, **options)
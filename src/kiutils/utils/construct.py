@@ -0,0 +1,97 @@
+"""Construction of objects from S-Expressions without allocating throwaway default values
+
+Author:
+    (C) kiutils contributors - 2026
+
+License identifier:
+    GPL-3.0
+
+Major changes:
+    17.10.2026 - created
+"""
+
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Dict, List, Tuple
+
+_CONTAINER_FACTORIES = (list, dict)
+"""Default factories whose values are set right away, as the parsers append to them"""
+
+_plans: Dict[
+    type, Tuple[Dict[str, Any], Tuple[str, ...], List[Tuple[str, Callable]]]
+] = {}
+"""Plain default values, fields with container default factories and default factories of
+nested objects, by dataclass"""
+
+
+def _plan(
+    cls: type,
+) -> Tuple[
+    Dict[str, Any], Tuple[Tuple[str, Callable], ...], List[Tuple[str, Callable]]
+]:
+    """Get the default values, container default factories and deferred default factories of the
+    given dataclass"""
+    plan = _plans.get(cls)
+    if plan is None:
+        defaults = {}
+        containers = []
+        deferred = []
+        for f in fields(cls):
+            if f.default is not MISSING:
+                defaults[f.name] = f.default
+            elif f.default_factory in _CONTAINER_FACTORIES:
+                containers.append((f.name, f.default_factory))
+            elif f.default_factory is not MISSING:
+                deferred.append((f.name, f.default_factory))
+        plan = _plans[cls] = (defaults, tuple(containers), deferred)
+    return plan
+
+
+def new_object(cls: type) -> Any:
+    """Create an object of the given dataclass to be filled by its ``from_sexpr()`` function.
+
+    Unlike ``cls()``, fields whose default factory builds a nested object (e.g. the ``position``
+    of most items) are left unset, as the parser usually replaces them with the object built from
+    the S-Expression. ``fill_defaults()`` sets the fields that were not found in the S-Expression.
+
+    Args:
+        - cls (type): The dataclass
+
+    Returns:
+        - Any: Object of the given class. Its fields with default factories of nested objects
+               are not set yet.
+    """
+    defaults, containers, _ = _plan(cls)
+    object = cls.__new__(cls)
+    if hasattr(object, "__dict__"):
+        object.__dict__.update(defaults)
+    else:
+        for name, default in defaults.items():
+            setattr(object, name, default)
+    for name, factory in containers:
+        setattr(object, name, factory())
+    return object
+
+
+def fill_defaults(object: Any) -> Any:
+    """Set the fields of an object created by ``new_object()`` that were not set by the parser to
+    their default values
+
+    Args:
+        - object (Any): Object created by ``new_object()``
+
+    Returns:
+        - Any: The given object
+    """
+    deferred = _plan(type(object))[2]
+    if hasattr(object, "__dict__"):
+        values = object.__dict__
+        for name, factory in deferred:
+            if name not in values:
+                values[name] = factory()
+    else:
+        for name, factory in deferred:
+            try:
+                getattr(object, name)
+            except AttributeError:
+                setattr(object, name, factory())
+    return object
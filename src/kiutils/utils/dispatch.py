@@ -0,0 +1,66 @@
+"""Token-to-handler tables for converting the items of S-Expressions into objects
+
+Author:
+    (C) kiutils contributors - 2026
+
+License identifier:
+    GPL-3.0
+
+Major changes:
+    17.10.2026 - created
+"""
+
+from typing import Any, Callable, ClassVar, Dict, Optional
+
+TokenHandler = Callable[[Any, list], None]
+"""A token handler is called with the object being built and the item of the S-Expression that
+starts with the handler's token, e.g. ``handler(board, ["net", 1, "GND"])``"""
+
+
+class TokenDispatch:
+    """Base class of classes that convert the items of their S-Expression using a table of token
+    handlers. Every item is handled by a single dictionary lookup of its first token. Items with
+    unknown tokens are ignored.
+
+    Handlers for new tokens may be registered without changing kiutils, e.g.:
+
+    .. code-block:: python
+
+        def parse_my_token(board, item):
+            board.myToken = item[1]
+
+        Board.register_token_handler("my_token", parse_my_token)
+    """
+
+    __slots__ = ()
+
+    tokenHandlers: ClassVar[Dict[str, TokenHandler]] = {}
+    """The ``tokenHandlers`` token defines the handler of every known token of the class"""
+
+    @classmethod
+    def register_token_handler(cls, token: str, handler: TokenHandler):
+        """Register a handler for the given token. A handler that is already registered for the
+        token is replaced. Registering a handler on a subclass does not change its base classes.
+
+        Args:
+            - token (str): First token of the items to handle, e.g. ``net``
+            - handler (TokenHandler): Function that is called with the object being built and the
+                                      item
+        """
+        if "tokenHandlers" not in cls.__dict__:
+            cls.tokenHandlers = dict(cls.tokenHandlers)
+        cls.tokenHandlers[token] = handler
+
+    @classmethod
+    def unregister_token_handler(cls, token: str) -> Optional[TokenHandler]:
+        """Remove the handler of the given token, so that its items are ignored
+
+        Args:
+            - token (str): First token of the items
+
+        Returns:
+            - TokenHandler: The removed handler or None, if no handler was registered
+        """
+        if "tokenHandlers" not in cls.__dict__:
+            cls.tokenHandlers = dict(cls.tokenHandlers)
+        return cls.tokenHandlers.pop(token, None)
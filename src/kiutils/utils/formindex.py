@@ -0,0 +1,248 @@
+"""Index of the top-level forms of KiCad files for random access
+
+Author:
+    (C) kiutils contributors - 2026
+
+License identifier:
+    GPL-3.0
+
+Major changes:
+    17.10.2026 - created
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from kiutils.utils import sexpr
+
+INDEX_FILE_SUFFIX = ".kiutils-index"
+"""Suffix appended to the path of a KiCad file to get the path of its persisted index"""
+
+INDEX_FORMAT_VERSION = 1
+"""Version of the persisted index format. Persisted indexes of other versions are ignored."""
+
+
+@dataclass
+class FormEntry:
+    """The ``FormEntry`` token describes one top-level form of a KiCad file, e.g. one
+    ``(footprint ...)`` of a board or one ``(symbol ...)`` of a symbol library"""
+
+    head: Optional[str] = None
+    """The ``head`` token defines the first token of the form, e.g. ``footprint``, ``segment``
+    or ``symbol``"""
+
+    name: Optional[str] = None
+    """The ``name`` token defines the second item of the form, if it is not a list. For footprints
+    this is the library ID, for symbols of a symbol library the symbol's name."""
+
+    reference: Optional[str] = None
+    """The ``reference`` token defines the reference designator of the form, if it has one"""
+
+    start: int = 0
+    """The ``start`` token defines the byte offset of the opening bracket of the form"""
+
+    end: int = 0
+    """The ``end`` token defines the byte offset after the closing bracket of the form"""
+
+
+@dataclass
+class FormIndex:
+    """The ``FormIndex`` token defines the byte offsets and heads of all top-level forms of a
+    ``.kicad_pcb``, ``.kicad_sch`` or ``.kicad_sym`` file. It is created in a single pass over the
+    file without building any objects and allows to parse single forms of the file later on.
+    """
+
+    filePath: Optional[str] = None
+    """The ``filePath`` token defines the path of the indexed file"""
+
+    size: int = 0
+    """The ``size`` token defines the size of the indexed file in bytes at the time of indexing"""
+
+    mtime: int = 0
+    """The ``mtime`` token defines the modification time of the indexed file in nanoseconds at the
+    time of indexing"""
+
+    encoding: str = "utf-8"
+    """The ``encoding`` token defines the encoding of the indexed file"""
+
+    forms: List[FormEntry] = field(default_factory=list)
+    """The ``forms`` token defines the list of top-level forms in the order of the file"""
+
+    @classmethod
+    def from_file(
+        cls, filepath: str, encoding: str = "utf-8", persist: bool = False
+    ) -> FormIndex:
+        """Create the index of the given KiCad file
+
+        Args:
+            - filepath (str): Path or path-like object that points to the file
+            - encoding (str): Encoding of the file. Defaults to ``utf-8``.
+            - persist (bool): Reuse the index persisted next to the file (see ``index_path()``)
+                              if it is still valid, or save the newly created index there.
+                              Defaults to False.
+
+        Raises:
+            - Exception: If the given path is not a file
+
+        Returns:
+            - FormIndex: Index of the given file
+        """
+        if not os.path.isfile(filepath):
+            raise Exception("Given path is not a file!")
+
+        if persist:
+            index = cls.load(cls.index_path(filepath))
+            if (
+                index is not None
+                and index.filePath == str(filepath)
+                and index.is_valid()
+            ):
+                return index
+
+        stat = os.stat(filepath)
+        index = cls(
+            filePath=str(filepath),
+            size=stat.st_size,
+            mtime=stat.st_mtime_ns,
+            encoding=encoding,
+        )
+        with sexpr.mapped_file(filepath) as data:
+            for head, name, reference, start, end in sexpr.scan_forms(data, encoding):
+                index.forms.append(FormEntry(head, name, reference, start, end))
+
+        if persist:
+            index.save()
+        return index
+
+    @staticmethod
+    def index_path(filepath: str) -> str:
+        """Get the path of the persisted index of the given file
+
+        Args:
+            - filepath (str): Path or path-like object that points to the indexed file
+
+        Returns:
+            - str: Path of the index file
+        """
+        return f"{filepath}{INDEX_FILE_SUFFIX}"
+
+    @classmethod
+    def load(cls, indexpath: str) -> Optional[FormIndex]:
+        """Load a persisted index
+
+        Args:
+            - indexpath (str): Path of the index file
+
+        Returns:
+            - FormIndex: The loaded index or None, if the file does not exist, cannot be read or
+                         was written with another index format version
+        """
+        try:
+            with open(indexpath, "r", encoding="utf-8") as infile:
+                data = json.load(infile)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_FORMAT_VERSION:
+            return None
+
+        return cls(
+            filePath=data["filePath"],
+            size=data["size"],
+            mtime=data["mtime"],
+            encoding=data["encoding"],
+            forms=[FormEntry(*form) for form in data["forms"]],
+        )
+
+    def save(self, indexpath: Optional[str] = None):
+        """Persist the index as JSON file
+
+        Args:
+            - indexpath (str, optional): Path of the index file. Defaults to None. If not set, the
+                                         index is saved next to the indexed file.
+
+        Raises:
+            - Exception: If no index path is given and ``self.filePath`` is not set
+        """
+        if indexpath is None:
+            if self.filePath is None:
+                raise Exception("File path not set")
+            indexpath = self.index_path(self.filePath)
+
+        data = {
+            "version": INDEX_FORMAT_VERSION,
+            "filePath": self.filePath,
+            "size": self.size,
+            "mtime": self.mtime,
+            "encoding": self.encoding,
+            "forms": [
+                [form.head, form.name, form.reference, form.start, form.end]
+                for form in self.forms
+            ],
+        }
+        with open(indexpath, "w", encoding="utf-8") as outfile:
+            json.dump(data, outfile, separators=(",", ":"))
+
+    def is_valid(self) -> bool:
+        """Check that the indexed file still has the size and modification time it had when it
+        was indexed
+
+        Returns:
+            - bool: True, if the index may still be used for the file
+        """
+        if self.filePath is None:
+            return False
+        try:
+            stat = os.stat(self.filePath)
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime
+
+    def find(
+        self,
+        head: Optional[str] = None,
+        name: Optional[str] = None,
+        reference: Optional[str] = None,
+    ) -> List[FormEntry]:
+        """Find forms by their head, name and/or reference. Arguments that are None are ignored.
+
+        Args:
+            - head (str, optional): Head token of the form, e.g. ``footprint``
+            - name (str, optional): Name of the form, e.g. the name of a symbol
+            - reference (str, optional): Reference designator of the form, e.g. ``R1``
+
+        Returns:
+            - List[FormEntry]: All matching forms in the order of the file
+        """
+        return [
+            form
+            for form in self.forms
+            if (head is None or form.head == head)
+            and (name is None or form.name == name)
+            and (reference is None or form.reference == reference)
+        ]
+
+    def read(self, form: FormEntry) -> list:
+        """Parse a single form of the indexed file by seeking to its offset
+
+        Args:
+            - form (FormEntry): Entry of this index
+
+        Raises:
+            - Exception: If the file was changed since it was indexed
+
+        Returns:
+            - list: The parsed S-Expression of the form, to be converted using the ``from_sexpr()``
+                    function of the respective class (e.g. ``Footprint.from_sexpr()``)
+        """
+        if not self.is_valid():
+            raise Exception("Indexed file was changed or removed")
+
+        with open(self.filePath, "rb") as infile:
+            infile.seek(form.start)
+            data = infile.read(form.end - form.start)
+        return sexpr.parse_sexp(data, self.encoding)
@@ -0,0 +1,450 @@
+"""Deferred construction of list items from the source text of a KiCad file
+
+Author:
+    (C) kiutils contributors - 2026
+
+License identifier:
+    GPL-3.0
+
+Major changes:
+    17.10.2026 - created
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from kiutils.utils import sexpr
+from kiutils.utils.flyweight import is_shared
+from kiutils.utils.writer import stream_writer
+
+# Types of field values that cannot be changed in place, reading them does not mark an object as
+# changed
+_IMMUTABLE = frozenset((str, int, float, bool, bytes, type(None), sexpr.Number))
+
+# Watched subclasses of every class, by the class: for objects watched by ``watch()`` and for
+# objects watched since they were built from their source text
+_watched_classes: Dict[type, Tuple[type, type]] = {}
+
+# Class of every watched subclass, by the subclass
+_watched_bases: Dict[type, type] = {}
+
+# Watched subclasses of objects built from their source text
+_built_classes = set()
+
+# Methods that only read an object, they are called without marking the object as changed
+_READ_ONLY_METHODS = ("__repr__", "to_sexpr", "write_sexpr")
+
+
+def _watched_class(cls: type, built: bool) -> type:
+    """Get the subclass of the given dataclass that watched objects are converted to. Objects of
+    the subclass convert themselves back to the dataclass when they may be changed: when a field
+    is assigned or deleted, or when a field that holds a list or another object (e.g. the
+    ``position`` of a footprint) is read, as it may be changed through the returned reference.
+    Objects of the subclass are equal to objects of the dataclass with the same values.
+    """
+    classes = _watched_classes.get(cls)
+    if classes is not None:
+        return classes[built]
+
+    names = frozenset(f.name for f in fields(cls))
+    compared = [f.name for f in fields(cls) if f.compare]
+    get = object.__getattribute__
+
+    def __getattribute__(self, name):
+        value = get(self, name)
+        if name in names and type(value) not in _IMMUTABLE and not is_shared(value):
+            object.__setattr__(self, "__class__", cls)
+        return value
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, "__class__", cls)
+        setattr(self, name, value)
+
+    def __delattr__(self, name):
+        object.__setattr__(self, "__class__", cls)
+        delattr(self, name)
+
+    def __eq__(self, other):
+        if isinstance(other, cls):
+            return all(get(self, name) == get(other, name) for name in compared)
+        return NotImplemented
+
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles are plain objects. Shallow copies share the nested objects, so the
+        # object may be changed through its copy.
+        object.__setattr__(self, "__class__", cls)
+        return self.__reduce_ex__(protocol)
+
+    def __new__(subclass, *args, **kwargs):
+        # dataclasses.replace() creates objects of the class of the given object. Return an
+        # object of the original class instead.
+        return cls(*args, **kwargs)
+
+    namespace = {
+        "__slots__": (),
+        "__module__": __name__,
+        "__getattribute__": __getattribute__,
+        "__setattr__": __setattr__,
+        "__delattr__": __delattr__,
+        "__eq__": __eq__,
+        "__hash__": None,
+        "__reduce_ex__": __reduce_ex__,
+        "__new__": __new__,
+    }
+    for name in _READ_ONLY_METHODS:
+        if hasattr(cls, name):
+            namespace[name] = _read_only(getattr(cls, name))
+
+    classes = _watched_classes[cls] = tuple(
+        type(f"{prefix}{cls.__name__}", (cls,), dict(namespace))
+        for prefix in ("Watched", "Built")
+    )
+    for watched in classes:
+        _watched_bases[watched] = cls
+    _built_classes.add(classes[1])
+    return classes[built]
+
+
+def _read_only(method):
+    """Wrap a method that does not change the object, so that it can be called on a watched object
+    without marking it as changed"""
+
+    def wrapper(self, *args, **kwargs):
+        with reading(self):
+            return method(self, *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+def watch(item, built: bool = False):
+    """Watch an object for changes, so that ``is_watched()`` tells in constant time if it may
+    have been changed since. The object is converted to a subclass of its class in place, which
+    converts it back as soon as one of its fields is assigned or a field that holds a list or
+    another object is read. Reading other fields, comparing, copying and serializing the object
+    does not count as change.
+
+    Changes of nested objects that were taken from the object before it was watched are not
+    detected. Objects that are already watched and shared objects (see ``flyweight``) are left
+    as they are.
+
+    Args:
+        - item: Object of a dataclass
+        - built (bool): The object was just built from its source text. Defaults to False.
+
+    Returns:
+        - The given object
+    """
+    cls = type(item)
+    if cls not in _watched_bases and not is_shared(item):
+        object.__setattr__(item, "__class__", _watched_class(cls, built))
+    return item
+
+
+def is_watched(item, built: bool = False) -> bool:
+    """Check if the given object was not changed since it was watched (see ``watch()``)
+
+    Args:
+        - item: Any object
+        - built (bool): Only return True if the object was not changed since it was built from its
+                        source text. Defaults to False.
+
+    Returns:
+        - bool: True, if the object is watched and was not changed
+    """
+    if built:
+        return type(item) in _built_classes
+    return type(item) in _watched_bases
+
+
+def touch(item):
+    """Mark a watched object as changed, e.g. after changing it through a reference that was
+    taken before it was watched
+
+    Args:
+        - item: Any object
+    """
+    cls = _watched_bases.get(type(item))
+    if cls is not None:
+        object.__setattr__(item, "__class__", cls)
+
+
+@contextmanager
+def reading(*items):
+    """Context manager to read watched objects without marking them as changed, e.g. to copy
+    them. The objects must not be changed in the ``with`` block.
+
+    Args:
+        - *items: Watched or any other objects
+    """
+    classes = [type(item) for item in items]
+    for item, cls in zip(items, classes):
+        base = _watched_bases.get(cls)
+        if base is not None:
+            object.__setattr__(item, "__class__", base)
+    try:
+        yield
+    finally:
+        for item, cls in zip(items, classes):
+            if cls in _watched_bases:
+                object.__setattr__(item, "__class__", cls)
+
+
+@dataclass
+class SourceForms:
+    """The ``SourceForms`` token defines a list of top-level forms of a file that are kept as source
+    text instead of being converted into objects. The objects are built from the source text when
+    the list is accessed for the first time (see ``LazyList``). Until then, the source text is
+    written back verbatim, afterwards the source text of every object that was not changed (see
+    ``SourceList``).
+    """
+
+    source: bytes = b""
+    """The ``source`` token defines the content of the whole file the forms were taken from"""
+
+    encoding: str = "utf-8"
+    """The ``encoding`` token defines the encoding of the source"""
+
+    types: Dict[str, type] = field(default_factory=dict)
+    """The ``types`` token defines the class that is used to build the objects of forms with the
+    given head token, e.g. ``{"footprint": Footprint}``"""
+
+    forms: List[Tuple[str, int, int]] = field(default_factory=list)
+    """The ``forms`` token defines the head token, start and end offset of every form in the order
+    of the source"""
+
+    exact: bool = False
+    """The ``exact`` token defines if numbers are kept as ``sexpr.Number`` objects when the objects
+    are built (see ``sexpr.parse_sexp()``)"""
+
+    names: Dict[str, int] = field(default_factory=dict)
+    """The ``names`` token defines the position in ``forms`` of the first form with the given name
+    (the second item of the form, e.g. the name of a symbol in a symbol library)"""
+
+    built: Dict[int, object] = field(default_factory=dict, repr=False, compare=False)
+    """The ``built`` token defines the objects built by ``self.get()``, by the position of their
+    form in ``forms``"""
+
+    def __len__(self) -> int:
+        return len(self.forms)
+
+    def _build(self, position: int):
+        """Build the object of the form at the given position and watch it for changes"""
+        head, start, end = self.forms[position]
+        exp = sexpr.parse_sexp(
+            self.source[start:end].decode(self.encoding), exact=self.exact
+        )
+        return watch(self.types[head].from_sexpr(exp), built=True)
+
+    def get(self, name: str):
+        """Build the object of the first form with the given name without building any other
+        object. Objects are built only once, later calls and ``self.materialize()`` return the
+        same object.
+
+        Args:
+            - name (str): Name of the form, e.g. the name of a symbol
+
+        Returns:
+            - The object or None, if there is no form with the given name
+        """
+        position = self.names.get(name)
+        if position is None:
+            return None
+        item = self.built.get(position)
+        if item is None:
+            item = self.built[position] = self._build(position)
+        return item
+
+    def materialize(self) -> SourceList:
+        """Build the objects of all forms
+
+        Returns:
+            - SourceList: One object per form, in the order of the source
+        """
+        items = SourceList(source=self.source, encoding=self.encoding)
+        for position, (_, start, end) in enumerate(self.forms):
+            item = self.built.get(position)
+            if item is None:
+                item = self._build(position)
+            items.append(item)
+            items.origins[id(item)] = (item, start, end)
+        return items
+
+    def write_sexpr(self, stream, indent: int = 0, separator: str = ""):
+        """Write the S-Expression of all forms to the given stream by copying their source text.
+        Objects built by ``self.get()`` that were changed since are serialized using their
+        ``write_sexpr(stream, indent)`` function instead.
+
+        Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
+            - indent (int): Number of whitespaces used to indent the first line of each form.
+                            Defaults to 0.
+            - separator (str): String appended after the newline of each form. Defaults to "".
+        """
+        write = stream_writer(stream)
+        indents = " " * indent
+        for position, (_, start, end) in enumerate(self.forms):
+            item = self.built.get(position)
+            if item is not None and not is_watched(item, built=True):
+                item.write_sexpr(stream, indent)
+                write(separator)
+                continue
+            write(
+                f"{indents}{self.source[start:end].decode(self.encoding)}\n{separator}"
+            )
+
+    def to_sexpr(self, indent: int = 0, separator: str = "") -> str:
+        """Generate the S-Expression of all forms by copying their source text
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the first line of each form.
+                            Defaults to 0.
+            - separator (str): String appended after the newline of each form. Defaults to "".
+
+        Returns:
+            - str: S-Expression of the forms
+        """
+        buffer = []
+        self.write_sexpr(buffer, indent=indent, separator=separator)
+        return "".join(buffer)
+
+
+class SourceList(list):
+    """List of the objects built from ``SourceForms`` that remembers the source span of every
+    object. Objects that were not changed since they were built from their span are written back
+    by copying the span (see ``source_text()``), so saving a board only serializes the objects
+    that were changed, added or replaced.
+
+    Objects are watched for changes when they are built (see ``watch()``), which makes the check
+    a constant time lookup. Reading a field that holds a nested object (e.g. the ``position`` of
+    a footprint) counts as change, as the nested object may be changed through the reference.
+    """
+
+    def __init__(self, items=(), source: bytes = b"", encoding: str = "utf-8"):
+        """Create the list
+
+        Args:
+            - items (Iterable): Initial items of the list. Defaults to an empty tuple.
+            - source (bytes): Content of the whole file the objects were built from
+            - encoding (str): Encoding of the source. Defaults to ``utf-8``.
+        """
+        super().__init__(items)
+        self.source = source
+        self.encoding = encoding
+        self.origins = {}
+        """Original object, start offset and end offset of every object built from the source, by
+        the ``id()`` of the object"""
+
+    def source_text(self, item, indent: int = 0) -> Optional[str]:
+        """Get the source text of the given object, if it was not changed since it was built
+
+        Args:
+            - item: Object of this list
+            - indent (int): Number of whitespaces used to indent the first line. Defaults to 0.
+
+        Returns:
+            - str: Source text of the object followed by a newline or None, if the object was not
+                   built from the source or was changed since
+        """
+        origin = self.origins.get(id(item))
+        if origin is None or origin[0] is not item or not is_watched(item, built=True):
+            return None
+        return (
+            f"{' ' * indent}{self.source[origin[1]:origin[2]].decode(self.encoding)}\n"
+        )
+
+
+class LazyList:
+    """Data descriptor for list attributes of dataclasses that may be loaded lazily. A
+    ``SourceForms`` object stored in the attribute is replaced by the list of its objects as soon
+    as the attribute is read.
+    """
+
+    def __init__(self, name: str):
+        """Create the descriptor
+
+        Args:
+            - name (str): Name of the attribute
+        """
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.name]
+        if isinstance(value, SourceForms):
+            value = obj.__dict__[self.name] = value.materialize()
+        return value
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+
+
+def pending(obj, name: str) -> Optional[SourceForms]:
+    """Get the source forms of a lazily loaded attribute without building its objects
+
+    Args:
+        - obj: Object that holds the attribute
+        - name (str): Name of the attribute
+
+    Returns:
+        - SourceForms: The source forms or None, if the objects of the attribute were already built
+    """
+    value = obj.__dict__.get(name)
+    return value if isinstance(value, SourceForms) else None
+
+
+def source_text(items: list, item, indent: int = 0) -> Optional[str]:
+    """Get the source text of an object of a lazily loaded list, if it was not changed since it was
+    built (see ``SourceList.source_text()``)
+
+    Args:
+        - items (list): List that contains the object
+        - item: The object
+        - indent (int): Number of whitespaces used to indent the first line. Defaults to 0.
+
+    Returns:
+        - str: Source text of the object followed by a newline or None, if the list was not loaded
+               lazily or the object has to be serialized
+    """
+    if not isinstance(items, SourceList):
+        return None
+    return items.source_text(item, indent)
+
+
+def split_forms(
+    source: bytes, encoding: str, sections: Dict[str, SourceForms], exact: bool = False
+) -> Iterator:
+    """Iterate over the items of the first expression of the given source like
+    ``sexpr.iterforms()``, but only parse the lists that no section claims. Lists whose head token
+    is found in the ``types`` of a section are appended to that section instead and indexed by
+    their name (see ``SourceForms.names``).
+
+    Args:
+        - source (bytes): Content of the file
+        - encoding (str): Encoding of the file
+        - sections (dict): Sections to fill, by their name
+        - exact (bool): Keep numbers as ``sexpr.Number`` objects (see ``sexpr.parse_sexp()``).
+                        Defaults to False.
+
+    Returns:
+        - Iterator: The head token of the first expression, followed by its unclaimed items
+    """
+    claims = {head: section for section in sections.values() for head in section.types}
+    token = sexpr.first_token(source, encoding)
+    if token is not None:
+        yield token
+
+    for head, name, _, start, end in sexpr.scan_forms(source, encoding):
+        sexpr.check_cancelled()
+        section = claims.get(head)
+        if section is not None:
+            if name is not None:
+                section.names.setdefault(name, len(section.forms))
+            section.forms.append((head, start, end))
+        else:
+            yield sexpr.parse_sexp(source[start:end].decode(encoding), exact=exact)
@@ -0,0 +1,139 @@
+"""Conversion of the top-level forms of a single KiCad file in multiple processes
+
+Author:
+    (C) kiutils contributors - 2026
+
+License identifier:
+    GPL-3.0
+
+Major changes:
+    17.10.2026 - created
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from itertools import chain, repeat
+from typing import Collection, List, Tuple
+
+from kiutils.utils import sexpr
+
+CHUNKS_PER_WORKER = 4
+"""Number of chunks the forms of a file are split into per worker process. More chunks than
+workers even out differences in the time needed per chunk."""
+
+
+def split_chunks(
+    spans: List[Tuple[int, int]], count: int
+) -> List[List[Tuple[int, int]]]:
+    """Split the given spans into at most ``count`` runs of consecutive spans of about the same
+    number of bytes
+
+    Args:
+        - spans (list): Start and end offsets of the forms, in the order of the file
+        - count (int): Maximum number of chunks
+
+    Returns:
+        - list: The chunks, in the order of the file
+    """
+    total = sum(end - start for start, end in spans)
+    chunks = []
+    chunk = []
+    size = 0
+    for start, end in spans:
+        chunk.append((start, end))
+        size += end - start
+        if size * count >= total * (len(chunks) + 1):
+            chunks.append(chunk)
+            chunk = []
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _build_part(
+    cls, token: str, filepath: str, encoding: str, exact: bool, spans: list
+):
+    """Build an object of the given class from the forms at the given spans of the file. Runs in
+    the worker processes."""
+    with sexpr.mapped_file(filepath) as data:
+        items = [
+            sexpr.parse_sexp(data[start:end].decode(encoding), exact=exact)
+            for start, end in spans
+        ]
+    return cls.from_forms(chain((token,), items))
+
+
+def load_parallel(
+    cls,
+    filepath: str,
+    encoding: str,
+    tokens: Collection[str],
+    workers: int,
+    exact: bool = False,
+):
+    """Load an object from a file whose top-level forms are converted in a pool of worker
+    processes.
+
+    The forms whose head token is in ``tokens`` are split into chunks of consecutive forms. Each
+    chunk is converted into a partial object by a worker, while the main process converts all
+    other forms. The list attributes of the partial objects are then appended to the object in the
+    order of the file, so the result is equal to loading the file in a single process. Therefore,
+    the handlers of all given tokens must append to a list attribute of the class and no other
+    token may append to the same lists.
+
+    The class and its token handlers are passed to the workers by reference. Handlers registered
+    at runtime (see ``TokenDispatch.register_token_handler()``) are only known to workers of the
+    ``fork`` start method.
+
+    Args:
+        - cls: Class with a ``from_forms()`` function, e.g. ``Board``
+        - filepath (str): Path or path-like object that points to the file
+        - encoding (str): Encoding of the file
+        - tokens (Collection[str]): Head tokens of the forms to convert in the workers
+        - workers (int): Number of worker processes
+        - exact (bool): Keep numbers as ``sexpr.Number`` objects (see ``sexpr.parse_sexp()``).
+                        Defaults to False.
+
+    Returns:
+        - The loaded object
+    """
+    with sexpr.mapped_file(filepath) as data:
+        token = sexpr.first_token(data, encoding)
+        spans = []
+        serial = []
+        for head, _, _, start, end in sexpr.scan_forms(data, encoding):
+            if head in tokens:
+                spans.append((start, end))
+            else:
+                serial.append((start, end))
+
+        chunks = split_chunks(spans, workers * CHUNKS_PER_WORKER)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(
+                _build_part,
+                repeat(cls),
+                repeat(token),
+                repeat(str(filepath)),
+                repeat(encoding),
+                repeat(exact),
+                chunks,
+            )
+            # Convert the remaining forms while the workers are busy
+            object = cls.from_forms(
+                chain(
+                    (token,),
+                    (
+                        sexpr.parse_sexp(data[start:end].decode(encoding), exact=exact)
+                        for start, end in serial
+                    ),
+                )
+            )
+            listFields = [
+                f.name for f in fields(cls) if isinstance(getattr(object, f.name), list)
+            ]
+            for part in parts:
+                for name in listFields:
+                    items = getattr(part, name)
+                    if items:
+                        getattr(object, name).extend(items)
+    return object
@@ -2,10 +2,20 @@
 # code extracted from: http://rosettacode.org/wiki/S-Expressions
 # Originally taken from: https://gitlab.com/kicad/libraries/kicad-library-utils/-/blob/master/common/sexpr.py
 
+import mmap
+import operator
+import os
 import re
+import sys
+import threading
+from contextlib import contextmanager
+from functools import partial
 
 dbg = False
 
+CHUNK_SIZE = 1 << 16
+"""Number of characters read at once when parsing from a file object"""
+
 term_regex = r"""(?mx)
     \s*(?:
         (?P<brackl>\()|
@@ -15,16 +25,475 @@ term_regex = r"""(?mx)
         (?P<s>[^(^)\s]+)
        )"""
 
+# The token regex of the parse engine. It accepts exactly the same tokens as ``term_regex`` but is
+# laid out so that ``re.findall()`` hands out one tuple per token that can be dispatched on
+# directly:
+#   1. ``(`` directly followed by a plain symbol (the head token of the list, e.g. ``(at``)
+#   2. ``)``
+#   3. Numbers
+#   4. Quoted strings. The first alternative matches strings without escaped quotes in linear
+#      time, the second one is the (backtracking) fallback for strings containing ``\"``
+#   5. Plain symbols
+# A ``(`` that is not followed by a plain symbol yields a tuple of empty strings.
+_token_regex = re.compile(
+    r"""\s*(?:
+        \((?:\s*([^(^)\s"\d+-][^(^)\s]*))?|
+        (\))|
+        ([+-]?\d+\.\d+(?=[\ )])|-?\d+(?=[\ )]))|
+        ("[^"]*(?<!\\)"(?=[\s)])|"(?:[^"]|(?<=\\)")*"(?=[\s)]))|
+        ([^(^)\s]+)
+    )""",
+    re.X,
+)
+
+# The same token regex for parsing ``bytes`` (e.g. memory-mapped files) directly
+_bytes_token_regex = re.compile(_token_regex.pattern.encode(), re.X)
+
+# First quote after a given position that is not escaped by a backslash
+_unescaped_quote_regex = re.compile(r'(?<!\\)"')
+
+_BYTES_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+# Cancellation event of the current thread (see ``cancellable()``)
+_cancellation = threading.local()
+
+
+@contextmanager
+def cancellable(event: threading.Event):
+    """Make ``iterforms()`` and the functions built on top of it (e.g. ``Board.from_file()``)
+    raise a ``concurrent.futures.CancelledError`` before the next top-level form once the given
+    event is set. Only applies to the current thread.
+
+    Args:
+        - event (threading.Event): The event, usually set by another thread
+
+    Returns:
+        - ContextManager: Context in which parsing can be cancelled
+    """
+    previous = getattr(_cancellation, "event", None)
+    _cancellation.event = event
+    try:
+        yield
+    finally:
+        _cancellation.event = previous
+
+
+def check_cancelled():
+    """Raise if the cancellation event of the current thread is set (see ``cancellable()``)
+
+    Raises:
+        - CancelledError: When the event is set
+    """
+    event = getattr(_cancellation, "event", None)
+    if event is not None and event.is_set():
+        from concurrent.futures import CancelledError
+
+        raise CancelledError("Parsing was cancelled")
+
+
+INTERN_TABLE_SIZE = 1 << 16
+"""Maximum number of symbols in the intern table of one parser call. A table that grows larger
+is started again from the vocabulary (see ``intern_vocabulary()``)."""
+
+KICAD_VOCABULARY = (
+    # Copper and technical layers
+    "F.Cu",
+    *(f"In{number}.Cu" for number in range(1, 31)),
+    "B.Cu",
+    "F.Adhes",
+    "B.Adhes",
+    "F.Paste",
+    "B.Paste",
+    "F.SilkS",
+    "B.SilkS",
+    "F.Mask",
+    "B.Mask",
+    "Dwgs.User",
+    "Cmts.User",
+    "Eco1.User",
+    "Eco2.User",
+    "Edge.Cuts",
+    "Margin",
+    "F.CrtYd",
+    "B.CrtYd",
+    "F.Fab",
+    "B.Fab",
+    *(f"User.{number}" for number in range(1, 10)),
+    "*.Cu",
+    "*.Mask",
+    "*.Paste",
+    "*.SilkS",
+    "F&B.Cu",
+    "signal",
+    "power",
+    "mixed",
+    "jumper",
+    "user",
+    # Pad types and shapes
+    "smd",
+    "thru_hole",
+    "np_thru_hole",
+    "connect",
+    "circle",
+    "rect",
+    "oval",
+    "trapezoid",
+    "roundrect",
+    "custom",
+    # Keywords of boards and footprints that appear in every item
+    "segment",
+    "arc",
+    "via",
+    "pad",
+    "start",
+    "mid",
+    "end",
+    "at",
+    "size",
+    "drill",
+    "width",
+    "layer",
+    "layers",
+    "net",
+    "tstamp",
+    "uuid",
+    "locked",
+    "stroke",
+    "type",
+    "solid",
+    "default",
+    "dash",
+    "fill",
+    "none",
+    "yes",
+    "no",
+    "fp_line",
+    "fp_arc",
+    "fp_circle",
+    "fp_rect",
+    "fp_poly",
+    "fp_text",
+    "pts",
+    "xy",
+    "effects",
+    "font",
+    "thickness",
+    "justify",
+    "left",
+    "right",
+    "top",
+    "bottom",
+    "mirror",
+    "hide",
+    "reference",
+    "value",
+    "property",
+    "footprint",
+    "roundrect_rratio",
+    "pinfunction",
+    "pintype",
+    "passive",
+    "input",
+    "output",
+    "bidirectional",
+    "power_in",
+    "power_out",
+    "free",
+    "no_connect",
+    "GND",
+    "",
+)
+"""Layer names, pad types and keywords that occur in almost every board. They are added to the
+vocabulary when the module is loaded (see ``intern_vocabulary()``)."""
+
+# Vocabulary of the parser. Maps every word to its ``sys.intern()``-ed instance.
+_vocabulary = {}
+
+
+def intern_atom(value: str) -> str:
+    """Get the shared instance of the given word of the vocabulary, as the parser does for every
+    symbol and quoted string. Words of the vocabulary are the same object in all parsed files
+    (e.g. the layers of all trace items), other symbols are the same object within the file they
+    were parsed from. Other quoted strings (e.g. net names and texts) are not interned.
+
+    Args:
+        - value (str): The symbol or string
+
+    Returns:
+        - str: The interned word, or the given string if it is not in the vocabulary
+    """
+    return _vocabulary.get(value, value)
+
+
+def intern_vocabulary(words=KICAD_VOCABULARY):
+    """Add the given words to the vocabulary of the parser
+
+    Args:
+        - words (Iterable[str]): The words. Defaults to ``KICAD_VOCABULARY``.
+    """
+    for word in words:
+        _vocabulary.setdefault(word, sys.intern(word))
+
+
+intern_vocabulary()
+
+
+@contextmanager
+def mapped_file(filepath):
+    """Memory-map the given file read-only, to be parsed as ``bytes`` without reading it into a
+    ``str`` first
+
+    Args:
+        - filepath (str): Path or path-like object that points to the file
+
+    Returns:
+        - ContextManager[mmap.mmap]: The mapped file, or ``b""`` for empty files (which cannot be
+                                      mapped)
+    """
+    with open(filepath, "rb") as infile:
+        if os.fstat(infile.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def file_chunks(infile, chunk_size: int = CHUNK_SIZE):
+    """Read the given file object in chunks of fixed size
+
+    Args:
+        - infile: File object opened in text mode
+        - chunk_size (int): Number of characters read at once. Defaults to ``CHUNK_SIZE``.
+
+    Returns:
+        - Iterator[str]: Iterator over the chunks of the file
+    """
+    return iter(partial(infile.read, chunk_size), "")
+
+
+def _split_complete_tokens(buffer: str):
+    """Tokenize the given buffer as far as the tokens cannot change when more input is appended
+
+    The last token of the buffer may be incomplete and is never returned. Tokens starting with a
+    quote are only returned when the first unescaped quote after them is in the buffer and is not
+    its last character, as only then the end of the quoted string is known for sure.
+
+    Args:
+        - buffer (str): Beginning of the not yet tokenized input
+
+    Returns:
+        - tuple: List of token tuples and the position in the buffer up to which it was tokenized
+    """
+    tokens = []
+    previous = None
+    for match in _token_regex.finditer(buffer):
+        if previous is not None:
+            tokens.append(previous.groups(""))
+        previous = match
+        # Only quoted strings and symbols (groups 4 and 5) may start with a quote
+        group = match.lastindex
+        if group is not None and group >= 4 and buffer[match.start(group)] == '"':
+            closing = _unescaped_quote_regex.search(buffer, match.start(group) + 1)
+            if closing is None or closing.end() >= len(buffer):
+                return tokens, match.start()
+    return tokens, (previous.start() if previous is not None else 0)
+
+
+def _iter_chunked_tokens(chunks):
+    """Yield the token tuples of ``_token_regex`` for the S-Expression given in chunks. Tokens
+    crossing the boundary of two chunks are carried over to the next chunk.
+
+    Args:
+        - chunks (Iterable[str]): The S-Expression in chunks of arbitrary size
+
+    Returns:
+        - Iterator[tuple]: Iterator over the token tuples
+    """
+    buffer = ""
+    pending = []
+    pendingSize = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        pendingSize += len(chunk)
+        # Wait for at least as much new input as carried over, so that tokens spanning many chunks
+        # are not rescanned over and over again
+        if pendingSize < len(buffer):
+            continue
+        buffer += "".join(pending)
+        pending = []
+        pendingSize = 0
+        tokens, end = _split_complete_tokens(buffer)
+        yield from tokens
+        buffer = buffer[end:]
+    buffer += "".join(pending)
+    yield from _token_regex.findall(buffer)
+
+
+def _iter_bytes_tokens(buffer, encoding: str):
+    """Yield the token tuples of ``_token_regex`` for an S-Expression given as ``bytes``. The
+    buffer is tokenized in place, only the matched token itself is decoded to ``str``.
+
+    Args:
+        - buffer: The S-Expression as ``bytes`` or another object supporting the buffer protocol
+        - encoding (str): Encoding used to decode the tokens
+
+    Returns:
+        - Iterator[tuple]: Iterator over the token tuples
+    """
+    emptyToken = ("", "", "", "", "")
+    closeToken = ("", ")", "", "", "")
+    for match in _bytes_token_regex.finditer(buffer):
+        group = match.lastindex
+        if group is None:
+            yield emptyToken
+        elif group == 2:
+            yield closeToken
+        else:
+            token = ["", "", "", "", ""]
+            token[group - 1] = match.group(group).decode(encoding)
+            yield token
+
+
+def _iter_tokens(source, encoding: str = "utf-8"):
+    """Yield the token tuples of ``_token_regex`` for the given source one by one
+
+    Args:
+        - source: The S-Expression as ``str``, as file object opened in text mode, as iterable of
+                  ``str`` chunks or as ``bytes``-like object (e.g. ``mmap.mmap``)
+        - encoding (str): Encoding of ``bytes``-like sources. Defaults to ``utf-8``.
+
+    Returns:
+        - Iterator[tuple]: Iterator over the token tuples
+    """
+    if isinstance(source, str):
+        return (match.groups("") for match in _token_regex.finditer(source))
+    if isinstance(source, _BYTES_TYPES):
+        return _iter_bytes_tokens(source, encoding)
+    if hasattr(source, "read"):
+        source = file_chunks(source)
+    return _iter_chunked_tokens(source)
+
+
+def _to_number(value: str):
+    """Convert a numeric token to ``int`` or ``float`` the way the parser always did: integral
+    values are returned as ``int``, everything else as ``float``."""
+    if "." not in value and len(value) < 16:
+        return int(value)
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def _numeric_value(value):
+    """Get the ``int`` or ``float`` value of a ``Number``, other values are returned unchanged"""
+    return value.value if isinstance(value, Number) else value
+
+
+def _numeric_operator(operator, reflected: bool = False):
+    """Create a binary operator method of ``Number`` that works on the converted values"""
+    if reflected:
+
+        def method(self, other):
+            return operator(_numeric_value(other), self.value)
+
+    else:
+
+        def method(self, other):
+            return operator(self.value, _numeric_value(other))
+
+    return method
+
+
+class Number(str):
+    """Numeric token of an S-Expression that keeps its original text (lexeme), as created by the
+    parser functions when called with ``exact=True``.
+
+    The number is only converted to ``int`` or ``float`` (like ``parse_sexp()`` converts numbers
+    by default) when it is used in a calculation or comparison, e.g. ``position.X + 1.27``. The
+    result of a calculation is a plain ``int`` or ``float``. As long as a value is not replaced,
+    it is written back exactly as it was read (e.g. ``1.500`` instead of ``1.5``), without
+    formatting a float.
+
+    Being a ``str`` internally, a ``Number`` is no instance of ``int`` or ``float``. It is equal
+    to numbers of the same value and to plain strings of the same text, so that an unquoted token
+    like ``0402`` still equals ``"0402"``. Its hash is the hash of its value, so as a key of a
+    ``dict`` or ``set`` it only matches numbers, not plain strings.
+    """
+
+    __slots__ = ()
+
+    @property
+    def value(self):
+        """The number converted to ``int`` or ``float``"""
+        return _to_number(str.__str__(self))
+
+    def __repr__(self) -> str:
+        return str.__str__(self)
+
+    def __format__(self, format_spec: str) -> str:
+        if not format_spec:
+            return str.__str__(self)
+        return format(self.value, format_spec)
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, str) and not isinstance(other, Number):
+            return str.__eq__(self, other)
+        return self.value == _numeric_value(other)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
 
-def parse_sexp(sexp):
+    def __float__(self) -> float:
+        return float(str.__str__(self))
+
+    def __int__(self) -> int:
+        return int(self.value)
+
+    def __neg__(self):
+        return -self.value
+
+    def __pos__(self):
+        return self.value
+
+    def __abs__(self):
+        return abs(self.value)
+
+    def __round__(self, ndigits=None):
+        return round(self.value, ndigits)
+
+    __lt__ = _numeric_operator(operator.lt)
+    __le__ = _numeric_operator(operator.le)
+    __gt__ = _numeric_operator(operator.gt)
+    __ge__ = _numeric_operator(operator.ge)
+    __add__ = _numeric_operator(operator.add)
+    __radd__ = _numeric_operator(operator.add, reflected=True)
+    __sub__ = _numeric_operator(operator.sub)
+    __rsub__ = _numeric_operator(operator.sub, reflected=True)
+    __mul__ = _numeric_operator(operator.mul)
+    __rmul__ = _numeric_operator(operator.mul, reflected=True)
+    __truediv__ = _numeric_operator(operator.truediv)
+    __rtruediv__ = _numeric_operator(operator.truediv, reflected=True)
+    __floordiv__ = _numeric_operator(operator.floordiv)
+    __rfloordiv__ = _numeric_operator(operator.floordiv, reflected=True)
+    __mod__ = _numeric_operator(operator.mod)
+    __rmod__ = _numeric_operator(operator.mod, reflected=True)
+    __pow__ = _numeric_operator(operator.pow)
+    __rpow__ = _numeric_operator(operator.pow, reflected=True)
+
+
+def _parse_sexp_debug(sexp, exact: bool = False):
+    """Token-by-token parser printing its state for each token. Used when ``dbg`` is set."""
     stack = []
     out = []
-    if dbg:
-        print("%-6s %-14s %-44s %-s" % tuple("term value out stack".split()))
+    print("%-6s %-14s %-44s %-s" % tuple("term value out stack".split()))
     for termtypes in re.finditer(term_regex, sexp):
-        term, value = [(t, v) for t, v in termtypes.groupdict().items() if v][0]
-        if dbg:
-            print("%-7s %-14s %-44r %-r" % (term, value, out, stack))
+        term, value = termtypes.lastgroup, termtypes.group(termtypes.lastgroup)
+        print("%-7s %-14s %-44r %-r" % (term, value, out, stack))
         if term == "brackl":
             stack.append(out)
             out = []
@@ -33,15 +502,395 @@ def parse_sexp(sexp):
             tmpout, out = out, stack.pop(-1)
             out.append(tmpout)
         elif term == "num":
-            v = float(value)
-            if v.is_integer():
-                v = int(v)
-            out.append(v)
+            out.append(Number(value) if exact else _to_number(value))
         elif term == "sq":
             out.append(value[1:-1].replace(r"\"", '"'))
-        elif term == "s":
-            out.append(value)
         else:
-            raise NotImplementedError("Error: %r %r" % (term, value))
+            out.append(value)
     assert not stack, "Trouble with nesting of brackets"
     return out[0]
+
+
+def parse_sexp(sexp, encoding: str = "utf-8", exact: bool = False):
+    """Parse the given S-Expression into nested lists
+
+    Lists are converted to Python lists, numbers to ``int`` or ``float`` (or ``Number`` if
+    ``exact`` is set) and quoted strings to ``str`` (with the enclosing quotes removed and ``\\"``
+    unescaped). All other tokens are kept as ``str``. Symbols and quoted words of the
+    vocabulary are interned (see ``intern_atom()``), so equal ones are the same object.
+
+    Args:
+        - sexp: The S-Expression to parse as ``str``, as file object opened in text mode (read in
+                chunks of ``CHUNK_SIZE`` characters), as iterable of ``str`` chunks or as
+                ``bytes``-like object like a memory-mapped file (see ``mapped_file()``)
+        - encoding (str): Encoding of ``bytes``-like input. Defaults to ``utf-8``.
+        - exact (bool): Keep numbers as ``Number`` objects holding their original text instead of
+                        converting them. Defaults to False.
+
+    Raises:
+        - AssertionError: When the brackets of the S-Expression are unbalanced
+
+    Returns:
+        - list: The first expression found in the string as nested lists
+    """
+    if dbg:
+        if isinstance(sexp, _BYTES_TYPES):
+            sexp = bytes(sexp).decode(encoding)
+        elif not isinstance(sexp, str):
+            sexp = "".join(file_chunks(sexp) if hasattr(sexp, "read") else sexp)
+        return _parse_sexp_debug(sexp, exact)
+
+    if isinstance(sexp, str):
+        tokens = _token_regex.findall(sexp)
+    else:
+        tokens = _iter_tokens(sexp, encoding)
+
+    # Symbols of this call, see ``INTERN_TABLE_SIZE``
+    symbols = _vocabulary.copy()
+    intern = symbols.setdefault
+    vocabulary = _vocabulary.get
+    stack = []
+    out = []
+    try:
+        for head, close, number, quoted, symbol in tokens:
+            if close:
+                parent = stack.pop()
+                parent.append(out)
+                out = parent
+            elif head:
+                if len(symbols) > INTERN_TABLE_SIZE:
+                    symbols = _vocabulary.copy()
+                    intern = symbols.setdefault
+                stack.append(out)
+                out = [intern(head, head)]
+            elif symbol:
+                out.append(intern(symbol, symbol))
+            elif number:
+                if exact:
+                    out.append(Number(number))
+                elif "." in number or len(number) > 15:
+                    value = float(number)
+                    out.append(int(value) if value.is_integer() else value)
+                else:
+                    out.append(int(number))
+            elif quoted:
+                value = quoted[1:-1].replace('\\"', '"')
+                out.append(vocabulary(value, value))
+            else:
+                stack.append(out)
+                out = []
+    except IndexError:
+        raise AssertionError("Trouble with nesting of brackets") from None
+    if stack:
+        raise AssertionError("Trouble with nesting of brackets")
+    return out[0]
+
+
+def iterparse(sexp, encoding: str = "utf-8", exact: bool = False):
+    """Parse the given S-Expression event by event instead of building the whole tree
+
+    The following events are yielded as ``(event, value)`` tuples:
+        - ``("open", None)``: Start of a list ``(``
+        - ``("atom", value)``: A number, quoted string or symbol, converted as in ``parse_sexp()``
+        - ``("close", None)``: End of a list ``)``
+
+    Args:
+        - sexp: The S-Expression to parse as ``str``, as file object opened in text mode, as
+                iterable of ``str`` chunks or as ``bytes``-like object
+        - encoding (str): Encoding of ``bytes``-like input. Defaults to ``utf-8``.
+        - exact (bool): Keep numbers as ``Number`` objects (see ``parse_sexp()``). Defaults to
+                        False.
+
+    Raises:
+        - AssertionError: When the brackets of the S-Expression are unbalanced
+
+    Returns:
+        - Iterator[tuple]: Iterator over the events found in the S-Expression
+    """
+    symbols = _vocabulary.copy()
+    intern = symbols.setdefault
+    depth = 0
+    for head, close, number, quoted, symbol in _iter_tokens(sexp, encoding):
+        if close:
+            if depth == 0:
+                raise AssertionError("Trouble with nesting of brackets")
+            depth -= 1
+            yield ("close", None)
+        elif head:
+            if len(symbols) > INTERN_TABLE_SIZE:
+                symbols = _vocabulary.copy()
+                intern = symbols.setdefault
+            depth += 1
+            yield ("open", None)
+            yield ("atom", intern(head, head))
+        elif symbol:
+            yield ("atom", intern(symbol, symbol))
+        elif number:
+            yield ("atom", Number(number) if exact else _to_number(number))
+        elif quoted:
+            yield ("atom", intern_atom(quoted[1:-1].replace('\\"', '"')))
+        else:
+            depth += 1
+            yield ("open", None)
+    if depth:
+        raise AssertionError("Trouble with nesting of brackets")
+
+
+def iterforms(sexp, encoding: str = "utf-8", exact: bool = False):
+    """Parse the given S-Expression and yield the items of its first expression one by one.
+    Each child list is yielded as soon as its closing bracket was parsed, so only one of them is
+    held in memory at a time.
+
+    ``list(iterforms(sexp))`` is equal to ``parse_sexp(sexp)`` when the S-Expression is a list.
+
+    Args:
+        - sexp: The S-Expression to parse as ``str``, as file object opened in text mode, as
+                iterable of ``str`` chunks or as ``bytes``-like object, e.g. an opened or
+                memory-mapped ``.kicad_pcb`` file
+        - encoding (str): Encoding of ``bytes``-like input. Defaults to ``utf-8``.
+        - exact (bool): Keep numbers as ``Number`` objects (see ``parse_sexp()``). Defaults to
+                        False.
+
+    Raises:
+        - AssertionError: When the brackets of the S-Expression are unbalanced
+        - Exception: When the S-Expression does not start with a list
+
+    Returns:
+        - Iterator: Iterator over the items (atoms and lists) of the first expression
+    """
+    # The list of the first expression itself is never filled, its items are yielded instead
+    symbols = _vocabulary.copy()
+    intern = symbols.setdefault
+    vocabulary = _vocabulary.get
+    stack = []
+    out = []
+    for head, close, number, quoted, symbol in _iter_tokens(sexp, encoding):
+        if close:
+            if not stack:
+                raise AssertionError("Trouble with nesting of brackets")
+            parent = stack.pop()
+            if not stack:
+                return
+            if len(stack) == 1:
+                check_cancelled()
+                yield out
+            else:
+                parent.append(out)
+            out = parent
+            continue
+
+        if symbol:
+            value = intern(symbol, symbol)
+        elif number:
+            value = Number(number) if exact else _to_number(number)
+        elif quoted:
+            value = quoted[1:-1].replace('\\"', '"')
+            value = vocabulary(value, value)
+        else:
+            if len(symbols) > INTERN_TABLE_SIZE:
+                symbols = _vocabulary.copy()
+                intern = symbols.setdefault
+            stack.append(out)
+            out = [intern(head, head)] if head else []
+            if len(stack) == 1:
+                yield from out
+                out = []
+            continue
+
+        if len(stack) == 1:
+            yield value
+        elif not stack:
+            raise Exception("Expression does not start with a list")
+        else:
+            out.append(value)
+    raise AssertionError("Trouble with nesting of brackets")
+
+
+def first_token(sexp, encoding: str = "utf-8"):
+    """Get the head token of the first expression of the given S-Expression without parsing the
+    rest of it, e.g. ``kicad_pcb`` for a board file
+
+    Args:
+        - sexp: The S-Expression as ``str``, as file object opened in text mode, as iterable of
+                ``str`` chunks or as ``bytes``-like object
+        - encoding (str): Encoding of ``bytes``-like input. Defaults to ``utf-8``.
+
+    Returns:
+        - str: The head token or None, if the S-Expression does not start with a list that starts
+               with a token
+    """
+    events = iterparse(sexp, encoding)
+    try:
+        if next(events, None) == ("open", None):
+            event = next(events, None)
+            if event is not None and event[0] == "atom":
+                return event[1]
+        return None
+    finally:
+        events.close()
+
+
+def _form_pattern(depth: int, group: int = 1) -> str:
+    """Build the pattern of a regex that matches one complete list, including all of its nested
+    lists up to the given depth
+
+    Args:
+        - depth (int): Maximum nesting depth of the matched lists
+        - group (int): Number of the first capturing group used by the pattern. Defaults to 1.
+
+    Returns:
+        - str: The pattern
+    """
+    stringTail = r'[^"]*(?<!\\)"(?=[\s)])'
+    escapedStringTail = r'(?:[^"]|(?<=\\)")*"(?=[\s)])'
+    items = [
+        r'[^()"]+(?![^()"])',
+        rf'"(?:(?<![^\s()^]")(?:{stringTail}|(?!{stringTail})(?=({escapedStringTail}))\{group})'
+        rf'|(?<=[^\s()^]")|(?!{stringTail}|{escapedStringTail}))',
+    ]
+    if depth > 1:
+        items.append(_form_pattern(depth - 1, group + 1))
+    return r"\((?:" + "|".join(items) + r")*\)"
+
+
+# Regex that matches a whole list in one call, so that ``scan_forms()`` can skip over lists without
+# tokenizing them. The re module has no recursion, so the pattern contains itself nested up to
+# ``_FORM_NESTING`` levels. Every level matches a sequence of:
+#   - Runs of characters other than brackets and quotes. They are kept maximal by the lookahead,
+#     which prevents catastrophic backtracking for lists that do not match.
+#   - Quotes. As in the token regex, a quote only starts a string when it starts a token, i.e.
+#     when it follows whitespace, a bracket or ``^``. Strings are matched atomically (``(?=(...))\N``
+#     emulates an atomic group), so backtracking never reinterprets brackets inside of strings.
+#   - Lists of the next level
+# Deeper nested lists make the match fail and are scanned token by token instead.
+_FORM_NESTING = 16
+_form_regex = re.compile(_form_pattern(_FORM_NESTING))
+_bytes_form_regex = re.compile(_form_pattern(_FORM_NESTING).encode())
+
+# Start of a ``(property "Reference" ...)`` or ``(fp_text reference ...)`` list
+_reference_regex = re.compile(
+    r'\(\s*(?:property\s+(?:Reference|"Reference")|fp_text\s+(?:reference|"reference"))(?=[\s)])'
+)
+_bytes_reference_regex = re.compile(_reference_regex.pattern.encode())
+
+# Heads of the lists that carry a reference designator
+_REFERENCE_HEADS = ("footprint", "symbol")
+
+
+def _skip_form(regex, sexp, pos: int) -> int:
+    """Tokenize a list until its closing bracket. This is the fallback for lists that are nested
+    too deep for the form regex.
+
+    Args:
+        - regex: The token regex to use
+        - sexp: The S-Expression
+        - pos (int): Position after the opening bracket of the list
+
+    Raises:
+        - AssertionError: When the list is not closed
+
+    Returns:
+        - int: Position after the closing bracket of the list
+    """
+    depth = 1
+    for match in regex.finditer(sexp, pos):
+        group = match.lastindex
+        if group == 2:
+            depth -= 1
+            if depth == 0:
+                return match.end()
+        elif group is None or group == 1:
+            depth += 1
+    raise AssertionError("Trouble with nesting of brackets")
+
+
+def scan_forms(sexp, encoding: str = "utf-8"):
+    """Scan the given S-Expression and yield the position of every list in its first expression,
+    without building any of them. The lists are skipped in a single regex call each, which is a
+    lot faster than tokenizing them.
+
+    For every list, a tuple ``(head, name, reference, start, end)`` is yielded:
+        - ``head``: The first token of the list (e.g. ``footprint``) or None if it is not a symbol
+        - ``name``: The second item of the list as string, if it is not a list (e.g. the library
+          ID of a footprint or the name of a symbol in a symbol library)
+        - ``reference``: Value of the first ``(property "Reference" ...)`` or
+          ``(fp_text reference ...)`` item inside of ``footprint`` and ``symbol`` lists, if present
+        - ``start``: Position of the opening bracket of the list
+        - ``end``: Position after the closing bracket of the list
+
+    Args:
+        - sexp: The S-Expression as ``str`` or ``bytes``-like object (e.g. a memory-mapped file).
+                Positions are byte offsets for ``bytes``-like input.
+        - encoding (str): Encoding of ``bytes``-like input. Defaults to ``utf-8``.
+
+    Raises:
+        - AssertionError: When the brackets of the S-Expression are unbalanced
+        - Exception: When the given S-Expression is neither ``str`` nor ``bytes``-like
+
+    Returns:
+        - Iterator[tuple]: Iterator over the tuples described above
+    """
+    if isinstance(sexp, str):
+        regex, formRegex, referenceRegex = _token_regex, _form_regex, _reference_regex
+        opening = "("
+
+        def decode(value):
+            return value
+
+    elif isinstance(sexp, _BYTES_TYPES):
+        regex, formRegex, referenceRegex = (
+            _bytes_token_regex,
+            _bytes_form_regex,
+            _bytes_reference_regex,
+        )
+        opening = b"("
+
+        def decode(value):
+            return value.decode(encoding)
+
+    else:
+        raise Exception("Only str and bytes-like objects can be scanned")
+
+    def atom(pos):
+        match = regex.search(sexp, pos)
+        group = match.lastindex if match is not None else None
+        if group is None or group < 3:
+            return None
+        value = decode(match.group(group))
+        if group == 4:
+            value = value[1:-1].replace('\\"', '"')
+        return value
+
+    depth = 0
+    pos = 0
+    while True:
+        match = regex.search(sexp, pos)
+        if match is None:
+            break
+        pos = match.end()
+        group = match.lastindex
+        if group == 2:
+            depth -= 1
+            if depth == 0:
+                return
+            if depth < 0:
+                raise AssertionError("Trouble with nesting of brackets")
+        elif group is None or group == 1:
+            if depth != 1:
+                depth += 1
+                continue
+
+            start = match.start() + match.group(0).find(opening)
+            form = formRegex.match(sexp, start)
+            end = form.end() if form is not None else _skip_form(regex, sexp, pos)
+            head = decode(match.group(1)) if group else None
+            name = atom(pos) if head is not None else None
+            reference = None
+            if head in _REFERENCE_HEADS:
+                found = referenceRegex.search(sexp, pos, end)
+                if found is not None:
+                    reference = atom(found.end())
+            yield (head, name, reference, start, end)
+            pos = end
+    if depth:
+        raise AssertionError("Trouble with nesting of brackets")
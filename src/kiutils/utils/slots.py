@@ -0,0 +1,85 @@
+"""Compact dataclasses whose objects store their fields in ``__slots__``
+
+Author:
+    (C) kiutils contributors - 2026
+
+License identifier:
+    GPL-3.0
+
+Major changes:
+    17.10.2026 - created
+"""
+
+from dataclasses import fields
+from operator import attrgetter
+from typing import Callable, Dict
+
+_getters: Dict[type, Callable] = {}
+"""Functions that get the values of all fields of an object as tuple, by dataclass"""
+
+
+def _rebuild(cls: type, values: dict):
+    """Rebuild a slotted object whose fields were not all set when it was pickled"""
+    object = cls.__new__(cls)
+    for name, value in values.items():
+        setattr(object, name, value)
+    return object
+
+
+def _reduce(self):
+    """Pickle a slotted object as call of its class with the values of its fields, which is
+    smaller and faster to load than the names and values of the slots"""
+    cls = type(self)
+    getter = _getters.get(cls)
+    if getter is None:
+        names = [f.name for f in fields(cls)]
+        getter = attrgetter(*names)
+        if len(names) == 1:
+
+            def getter(object, get=getter):
+                return (get(object),)
+
+        _getters[cls] = getter
+    try:
+        values = getter(self)
+    except AttributeError:
+        # Fields that were not set yet (see ``construct.new_object()``)
+        values = {}
+        for f in fields(cls):
+            try:
+                values[f.name] = getattr(self, f.name)
+            except AttributeError:
+                pass
+        return _rebuild, (cls, values), getattr(self, "__dict__", None)
+    return cls, values, getattr(self, "__dict__", None)
+
+
+def slotted(cls: type) -> type:
+    """Class decorator that recreates a dataclass with a ``__slots__`` entry for every field. Its
+    objects have no ``__dict__``, which makes them a lot smaller and their attributes faster to
+    access, while the fields, ``__init__()``, comparison, ``dataclasses.replace()``, copying and
+    pickling behave as before. Must be applied above ``@dataclass``.
+
+    This is what ``@dataclass(slots=True)`` does since Python 3.10. All base classes of the
+    dataclass must define ``__slots__`` as well (e.g. ``SexprWritable``), and its methods must
+    not use ``super()`` without arguments.
+
+    Args:
+        - cls (type): The dataclass
+
+    Returns:
+        - type: The slotted dataclass
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        # Default values are kept by ``__init__()`` and ``fields()``, but would conflict with
+        # the slots of the same name
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    namespace["__reduce__"] = _reduce
+    slottedClass = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slottedClass.__qualname__ = cls.__qualname__
+    return slottedClass
@@ -0,0 +1,66 @@
+"""Throughput statistics of loading KiCad files
+
+Author:
+    (C) kiutils contributors - 2026
+
+License identifier:
+    GPL-3.0
+
+Major changes:
+    17.10.2026 - created
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class LoadStatistics:
+    """The ``LoadStatistics`` token defines how many files and bytes were loaded in how much time"""
+
+    files: int = 0
+    """The ``files`` token defines the number of loaded files"""
+
+    bytes: int = 0
+    """The ``bytes`` token defines the total size of the loaded files in bytes"""
+
+    seconds: float = 0.0
+    """The ``seconds`` token defines the wall-clock time spent loading the files"""
+
+    def add(self, files: int, bytes: int, seconds: float):
+        """Account for further loaded files
+
+        Args:
+            - files (int): Number of loaded files
+            - bytes (int): Total size of the loaded files in bytes
+            - seconds (float): Wall-clock time spent loading them
+        """
+        self.files += files
+        self.bytes += bytes
+        self.seconds += seconds
+
+    def files_per_second(self) -> float:
+        """Get the number of files loaded per second
+
+        Returns:
+            - float: Files per second or 0.0, if no time was spent yet
+        """
+        return self.files / self.seconds if self.seconds > 0 else 0.0
+
+    def megabytes_per_second(self) -> float:
+        """Get the number of megabytes (10^6 bytes) loaded per second
+
+        Returns:
+            - float: Megabytes per second or 0.0, if no time was spent yet
+        """
+        return self.bytes / 1e6 / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        """Get a one-line summary of the statistics
+
+        Returns:
+            - str: Summary like ``120 files, 3.52 MB in 0.84 s (142.9 files/s, 4.19 MB/s)``
+        """
+        return (
+            f"{self.files} files, {self.bytes / 1e6:.2f} MB in {self.seconds:.2f} s "
+            f"({self.files_per_second():.1f} files/s, {self.megabytes_per_second():.2f} MB/s)"
+        )
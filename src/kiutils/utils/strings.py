@@ -10,6 +10,10 @@ Major changes:
     28.02.2022 - created
 """
 
+import os
+import re
+from typing import Mapping, Optional
+
 
 def dequote(input: str) -> str:
     """Escapes double-quotes in a string using a backslash
@@ -35,3 +39,29 @@ def remove_prefix(input: str, prefix: str) -> str:
         - str: String with removed prefix, or the ``input`` string as is, if the prefix was not found
     """
     return input[len(prefix) :] if input.startswith(prefix) else input
+
+
+_variable_regex = re.compile(r"\$\{([^}]*)\}|\$\(([^)]*)\)")
+
+
+def expand_variables(input: str, variables: Optional[Mapping[str, str]] = None) -> str:
+    """Expands KiCad path variables like ``${KICAD8_FOOTPRINT_DIR}`` or ``$(KIPRJMOD)`` in a string.
+    Variables are looked up in ``variables`` first and in the environment of the process second.
+    Unknown variables are kept as they are, as KiCad does.
+
+    Args:
+        - input (str): String to expand, e.g. the ``uri`` of a library
+        - variables (Mapping[str, str], optional): Values of variables that take precedence over
+                                                   the environment. Defaults to None.
+
+    Returns:
+        - str: String with expanded variables
+    """
+
+    def replace(match):
+        name = match.group(1) if match.group(1) is not None else match.group(2)
+        if variables is not None and name in variables:
+            return variables[name]
+        return os.environ.get(name, match.group(0))
+
+    return _variable_regex.sub(replace, input)
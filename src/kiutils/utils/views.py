@@ -0,0 +1,329 @@
+"""Objects that write changes through to the array or table they were taken from
+
+Author:
+    (C) kiutils contributors - 2026
+
+License identifier:
+    GPL-3.0
+
+Major changes:
+    17.10.2026 - created
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from weakref import ref
+
+# View subclass of every class and its functions
+_view_classes: Dict[Tuple[type, Callable, Callable, Callable], type] = {}
+
+
+def view_class(
+    cls: type,
+    load: Callable[[object, str], object],
+    store: Callable[[object, str, object], None],
+    build: Callable[[object], object],
+) -> type:
+    """Get the subclass of the given dataclass whose objects are views of an item of an array or
+    table (e.g. a point of a ``PositionArray``). Views hold no values. Reading a field of a view
+    calls ``load(view, name)``, which reads the value from the array, and assigning a field calls
+    ``store(view, name, value)``, which writes it through to the array. Creating a view is
+    therefore about as cheap as creating an empty object.
+
+    Once a view was detached from its array (see ``detach()``), it holds a copy of its item built
+    by ``build(view)`` and behaves like it.
+
+    Views are equal to objects of the dataclass with the same values. Copies, pickles and the
+    results of ``dataclasses.replace()`` of a view are objects of the dataclass.
+
+    Args:
+        - cls (type): The dataclass, e.g. ``Position``
+        - load (Callable): Function called with the view and the name of the read field
+        - store (Callable): Function called with the view, the name of the assigned field and the
+                            new value
+        - build (Callable): Function called with the view that creates an object of the
+                            dataclass with the current values of the item
+
+    Returns:
+        - type: The view subclass. Views have the additional slots ``owner`` (the array or table,
+                None once the view was detached), ``index`` (the index of the item), ``field``
+                (the field of the item the view is held by, e.g. ``start``, or None for views of
+                items) and ``item`` (the copy of a detached view).
+    """
+    key = (cls, load, store, build)
+    view = _view_classes.get(key)
+    if view is not None:
+        return view
+
+    names = [f.name for f in fields(cls)]
+    compared = [f.name for f in fields(cls) if f.compare]
+
+    def field_property(name: str) -> property:
+        def get(self):
+            if self.owner is None:
+                return getattr(self.item, name)
+            return load(self, name)
+
+        def set(self, value):
+            if self.owner is None:
+                setattr(self.item, name, value)
+            else:
+                store(self, name, value)
+
+        return property(get, set)
+
+    def _detach(self):
+        if self.owner is not None:
+            object.__setattr__(self, "item", build(self))
+            object.__setattr__(self, "owner", None)
+
+    def __eq__(self, other):
+        if isinstance(other, cls):
+            return all(getattr(self, name) == getattr(other, name) for name in compared)
+        return NotImplemented
+
+    def __reduce__(self):
+        return cls, tuple(getattr(self, name) for name in names)
+
+    def __new__(subclass, *args, **kwargs):
+        # dataclasses.replace() creates objects of the class of the given object. Return an
+        # object of the original class instead.
+        return cls(*args, **kwargs)
+
+    namespace = {name: field_property(name) for name in names}
+    namespace.update(
+        {
+            "__slots__": ("owner", "index", "field", "item", "__weakref__"),
+            "__module__": __name__,
+            "__qualname__": cls.__qualname__,
+            "__eq__": __eq__,
+            "__hash__": None,
+            "__reduce__": __reduce__,
+            "__new__": __new__,
+            "_detach": _detach,
+        }
+    )
+    view = _view_classes[key] = type(cls.__name__, (cls,), namespace)
+    return view
+
+
+def new_view(view: type, owner, index: int, field: Optional[str] = None):
+    """Create a view (see ``view_class()``)
+
+    Args:
+        - view (type): The view class
+        - owner: The array or table
+        - index (int): Index of the item
+        - field (str, optional): Field of the item the view is held by. Defaults to None (view of
+                                 the item itself).
+
+    Returns:
+        - The view
+    """
+    object_ = object.__new__(view)
+    set = object.__setattr__
+    set(object_, "owner", owner)
+    set(object_, "index", index)
+    set(object_, "field", field)
+    return object_
+
+
+class ViewList(list):
+    """List held by a view (e.g. the layers of a via of a ``TraceTable``) that calls
+    ``store(list, field)`` whenever it is changed, as long as its ``owner`` is set. Copies and
+    pickles are plain lists.
+    """
+
+    __slots__ = ("owner", "index", "field", "store", "__weakref__")
+
+    def __init__(
+        self,
+        items: Iterable,
+        owner,
+        index: int,
+        field: str,
+        store: Callable[[object, str], None],
+    ):
+        """Create the list
+
+        Args:
+            - items (Iterable): Items of the list
+            - owner: The array or table
+            - index (int): Index of the item that holds the list
+            - field (str): Field of the item that holds the list
+            - store (Callable): Function that writes the list through to the owner
+        """
+        super().__init__(items)
+        self.owner = owner
+        self.index = index
+        self.field = field
+        self.store = store
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    def _changed(self):
+        if self.owner is not None:
+            self.store(self, self.field)
+
+    def _detach(self):
+        self.owner = None
+
+
+def _write_through(name: str):
+    """Wrap a changing method of ``list`` so that it calls ``ViewList._changed()``"""
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._changed()
+        return result
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in (
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(ViewList, _name, _write_through(_name))
+
+
+def detach(view):
+    """Disconnect a view from its array or table, e.g. before its item is changed or removed.
+    The view keeps the current values of its item, and changes of a detached view are not
+    written through anymore.
+
+    Args:
+        - view: The view or ``ViewList``
+    """
+    view._detach()
+
+
+class ViewRegistry:
+    """The views of the items of an array or table that are still referenced, by the index of
+    their item and the field that holds them. Views that are not referenced anymore are dropped,
+    so that iterating over a large array does not keep an object per item. Keeps the indices of
+    the views in sync when items are inserted or removed.
+
+    Views hold no reference to each other or to the objects they were taken from, only to their
+    owner. Dropping a view therefore never needs the garbage collector. The registry holds weak
+    references without callbacks, which are cheaper to create, and drops the dead ones whenever
+    it has grown to twice its size after the last sweep.
+    """
+
+    def __init__(self):
+        """Create an empty registry"""
+        self.views: Dict[Tuple[int, Optional[str]], ref] = {}
+        """Weak references to the views, by the index of their item and their ``field``"""
+        self.limit = 64
+        """Number of references at which the dead ones are dropped"""
+
+    def get(self, index: int, field: Optional[str] = None):
+        """Get the view of an item or of a field of an item, if it is still referenced
+
+        Args:
+            - index (int): Index of the item
+            - field (str, optional): Field of the item or None for the item itself
+
+        Returns:
+            - The view or None
+        """
+        reference = self.views.get((index, field))
+        return None if reference is None else reference()
+
+    def add(self, view):
+        """Register a view by its ``index`` and ``field``, replacing and detaching the view
+        registered before
+
+        Args:
+            - view: The view
+        """
+        key = (view.index, view.field)
+        previous = self.views.get(key)
+        if previous is not None:
+            previous = previous()
+            if previous is not None and previous is not view:
+                detach(previous)
+        self.views[key] = ref(view)
+        if len(self.views) > self.limit:
+            self._sweep()
+
+    def _sweep(self):
+        """Drop the references to views that are not referenced anymore"""
+        self.views = {
+            key: reference
+            for key, reference in self.views.items()
+            if reference() is not None
+        }
+        self.limit = max(64, 2 * len(self.views))
+
+    def _live(self) -> List:
+        """Get the views that are still referenced"""
+        views = [reference() for reference in self.views.values()]
+        return [view for view in views if view is not None]
+
+    def shift(self, index: int, offset: int):
+        """Move the views of all items at or after the given index by an offset, after items were
+        inserted (positive offset) or removed (negative offset)
+
+        Args:
+            - index (int): Index of the first moved item
+            - offset (int): The offset
+        """
+        views = self._live()
+        self.views = {}
+        for view in views:
+            if view.index >= index:
+                object.__setattr__(view, "index", view.index + offset)
+            self.views[(view.index, view.field)] = ref(view)
+        self.limit = max(64, 2 * len(self.views))
+
+    def remove(self, index: int):
+        """Detach and drop all views of the item at the given index
+
+        Args:
+            - index (int): Index of the item
+        """
+        for key in [key for key in self.views if key[0] == index]:
+            self.discard(*key)
+
+    def discard(self, index: int, field: Optional[str] = None):
+        """Detach and drop the view of an item or of a field of an item, if there is one
+
+        Args:
+            - index (int): Index of the item
+            - field (str, optional): Field of the item or None for the item itself
+        """
+        reference = self.views.pop((index, field), None)
+        view = None if reference is None else reference()
+        if view is not None:
+            detach(view)
+
+    def clear(self):
+        """Detach and drop all views"""
+        for view in self._live():
+            detach(view)
+        self.views = {}
+        self.limit = 64
+
+    def __len__(self) -> int:
+        return len(self._live())
+
+    def __reduce__(self):
+        # Copies and pickles of an array or table have no views yet
+        return ViewRegistry, ()
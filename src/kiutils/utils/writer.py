@@ -0,0 +1,48 @@
+"""Protocol for writing S-Expressions to streams piece by piece
+
+Author:
+    (C) kiutils contributors - 2026
+
+License identifier:
+    GPL-3.0
+
+Major changes:
+    17.10.2026 - created
+"""
+
+from typing import Callable
+
+
+def stream_writer(stream) -> Callable[[str], object]:
+    """Get the function that appends a piece of text to the given stream
+
+    Args:
+        - stream: Text stream (e.g. an ``io.TextIOBase`` like an opened file or ``io.StringIO``)
+                  or a ``list`` that collects the written pieces
+
+    Returns:
+        - Callable: ``stream.append`` for lists, ``stream.write`` otherwise
+    """
+    return stream.append if isinstance(stream, list) else stream.write
+
+
+class SexprWritable:
+    """Base class of all classes with a ``to_sexpr()`` function. It adds the ``write_sexpr()``
+    function, which writes the S-Expression to a stream instead of returning it.
+
+    Classes with large S-Expressions (e.g. boards, footprints and zones) override
+    ``write_sexpr()`` to write their items piece by piece and implement ``to_sexpr()`` on top of
+    it. Other classes write the output of their ``to_sexpr()`` function as one piece.
+    """
+
+    __slots__ = ()
+
+    def write_sexpr(self, stream, *args, **kwargs):
+        """Write the S-Expression representing this object to the given stream
+
+        Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
+            - *args, **kwargs: Arguments of the ``to_sexpr()`` function of the class, e.g. the
+                               ``indent``
+        """
+        stream_writer(stream)(self.to_sexpr(*args, **kwargs))
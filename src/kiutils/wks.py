@@ -25,11 +25,14 @@ from kiutils.misc.config import (
     KIUTILS_CREATE_NEW_VERSION_STR,
 )
 from kiutils.utils import sexpr
+from kiutils.utils.aio import AsyncFile
+from kiutils.utils.construct import fill_defaults, new_object
 from kiutils.utils.strings import dequote
+from kiutils.utils.writer import SexprWritable, stream_writer
 
 
 @dataclass
-class WksFontSize:
+class WksFontSize(SexprWritable):
     """The ``WksFontSize`` token defines the size of a font in a worksheet"""
 
     width: float = 1.0
@@ -79,7 +82,7 @@ class WksFontSize:
 
 
 @dataclass
-class WksFont:
+class WksFont(SexprWritable):
     """The ``WksFont`` token defines how a text is drawn"""
 
     linewidth: Optional[float] = None
@@ -125,7 +128,7 @@ class WksFont:
             if item[0] == "linewidth":
                 object.linewidth = item[1]
             if item[0] == "size":
-                object.size = WksFontSize().from_sexpr(item)
+                object.size = WksFontSize.from_sexpr(item)
         return object
 
     def to_sexpr(self, indent=0, newline=False):
@@ -154,7 +157,7 @@ class WksFont:
 
 
 @dataclass
-class WksPosition:
+class WksPosition(SexprWritable):
     """The ``WksPosition`` token defines the positional coordinates and rotation of an worksheet
     object.
     """
@@ -203,7 +206,7 @@ class WksPosition:
 
 
 @dataclass
-class Line:
+class Line(SexprWritable):
     """The ``Line`` token defines how a line is drawn in a work sheet
 
     Documentation:
@@ -260,14 +263,14 @@ class Line:
         if exp[0] != "line":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp[1:]:
             if item[0] == "name":
                 object.name = item[1]
             if item[0] == "start":
-                object.start = WksPosition().from_sexpr(item)
+                object.start = WksPosition.from_sexpr(item)
             if item[0] == "end":
-                object.end = WksPosition().from_sexpr(item)
+                object.end = WksPosition.from_sexpr(item)
             if item[0] == "option":
                 object.option = item[1]
             if item[0] == "linewidth":
@@ -280,7 +283,7 @@ class Line:
                 object.incry = item[1]
             if item[0] == "comment":
                 object.comment = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True):
         """Generate the S-Expression representing this object
@@ -316,7 +319,7 @@ class Line:
 
 
 @dataclass
-class Rect:
+class Rect(SexprWritable):
     """The ``Rect`` token defines how a rectangle is drawn in a work sheet
 
     Documentation:
@@ -374,14 +377,14 @@ class Rect:
         if exp[0] != "rect":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp[1:]:
             if item[0] == "name":
                 object.name = item[1]
             if item[0] == "start":
-                object.start = WksPosition().from_sexpr(item)
+                object.start = WksPosition.from_sexpr(item)
             if item[0] == "end":
-                object.end = WksPosition().from_sexpr(item)
+                object.end = WksPosition.from_sexpr(item)
             if item[0] == "option":
                 object.option = item[1]
             if item[0] == "linewidth":
@@ -394,7 +397,7 @@ class Rect:
                 object.incry = item[1]
             if item[0] == "comment":
                 object.comment = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True):
         """Generate the S-Expression representing this object
@@ -430,7 +433,7 @@ class Rect:
 
 
 @dataclass
-class Polygon:
+class Polygon(SexprWritable):
     """The ``Polygon`` token defines a graphical polygon in a worksheet
 
     Documentation:
@@ -503,7 +506,7 @@ class Polygon:
 
 
 @dataclass
-class Bitmap:
+class Bitmap(SexprWritable):
     """The ``Polygon`` token defines on or more embedded images
 
     Documentation:
@@ -571,12 +574,12 @@ class Bitmap:
         if exp[0] != "bitmap":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp[1:]:
             if item[0] == "name":
                 object.name = item[1]
             if item[0] == "pos":
-                object.position = WksPosition().from_sexpr(item)
+                object.position = WksPosition.from_sexpr(item)
             if item[0] == "option":
                 object.option = item[1]
             if item[0] == "scale":
@@ -596,7 +599,7 @@ class Bitmap:
                     if data[0] != "data":
                         continue
                     object.pngdata.append(data[1])
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True):
         """Generate the S-Expression representing this object
@@ -632,7 +635,7 @@ class Bitmap:
 
 
 @dataclass
-class TbText:
+class TbText(SexprWritable):
     """The ``TbText`` token define text used in the title block of a work sheet
 
     Documentation:
@@ -705,21 +708,21 @@ class TbText:
         if exp[0] != "tbtext":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         object.text = exp[1]
         for item in exp[2:]:
             if item[0] == "name":
                 object.name = item[1]
             if item[0] == "pos":
-                object.position = WksPosition().from_sexpr(item)
+                object.position = WksPosition.from_sexpr(item)
             if item[0] == "option":
                 object.option = item[1]
             if item[0] == "rotate":
                 object.rotate = item[1]
             if item[0] == "font":
-                object.font = WksFont().from_sexpr(item)
+                object.font = WksFont.from_sexpr(item)
             if item[0] == "justify":
-                object.justify = Justify().from_sexpr(item)
+                object.justify = Justify.from_sexpr(item)
             if item[0] == "maxlen":
                 object.maxlen = item[1]
             if item[0] == "maxheight":
@@ -734,7 +737,7 @@ class TbText:
                 object.incrlabel = item[1]
             if item[0] == "comment":
                 object.comment = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True):
         """Generate the S-Expression representing this object
@@ -781,7 +784,7 @@ class TbText:
 
 
 @dataclass
-class TextSize:
+class TextSize(SexprWritable):
     """The ``TextSize`` define the default width and height of text"""
 
     width: float = 1.5
@@ -831,7 +834,7 @@ class TextSize:
 
 
 @dataclass
-class Setup:
+class Setup(SexprWritable):
     """The ``setup`` token defines the configuration information for the work sheet
 
     Documentation:
@@ -879,10 +882,10 @@ class Setup:
         if exp[0] != "setup":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp[1:]:
             if item[0] == "textsize":
-                object.textSize = TextSize().from_sexpr(item)
+                object.textSize = TextSize.from_sexpr(item)
             if item[0] == "linewidth":
                 object.lineWidth = item[1]
             if item[0] == "textlinewidth":
@@ -895,7 +898,7 @@ class Setup:
                 object.topMargin = item[1]
             if item[0] == "bottom_margin":
                 object.bottomMargin = item[1]
-        return object
+        return fill_defaults(object)
 
     def to_sexpr(self, indent=2, newline=True):
         """Generate the S-Expression representing this object
@@ -927,7 +930,7 @@ class Setup:
 
 
 @dataclass
-class WorkSheet:
+class WorkSheet(SexprWritable, AsyncFile):
     """The ``WorkSheet`` token defines a KiCad worksheet (.kicad_wks file)
 
     Documentation:
@@ -969,25 +972,25 @@ class WorkSheet:
         if exp[0] != "kicad_wks":
             raise Exception("Expression does not have the correct type")
 
-        object = cls()
+        object = new_object(cls)
         for item in exp[1:]:
             if item[0] == "version":
                 object.version = item[1]
             if item[0] == "generator":
                 object.generator = item[1]
             if item[0] == "setup":
-                object.setup = Setup().from_sexpr(item)
+                object.setup = Setup.from_sexpr(item)
             if item[0] == "rect":
-                object.drawingObjects.append(Rect().from_sexpr(item))
+                object.drawingObjects.append(Rect.from_sexpr(item))
             if item[0] == "line":
-                object.drawingObjects.append(Line().from_sexpr(item))
+                object.drawingObjects.append(Line.from_sexpr(item))
             if item[0] == "polygon":
-                object.drawingObjects.append(Polygon().from_sexpr(item))
+                object.drawingObjects.append(Polygon.from_sexpr(item))
             if item[0] == "tbtext":
-                object.drawingObjects.append(TbText().from_sexpr(item))
+                object.drawingObjects.append(TbText.from_sexpr(item))
             if item[0] == "bitmap":
-                object.drawingObjects.append(Bitmap().from_sexpr(item))
-        return object
+                object.drawingObjects.append(Bitmap.from_sexpr(item))
+        return fill_defaults(object)
 
     @classmethod
     def from_file(cls, filepath: str, encoding: Optional[str] = None) -> WorkSheet:
@@ -1009,7 +1012,7 @@ class WorkSheet:
             raise Exception("Given path is not a file!")
 
         with open(filepath, "r", encoding=encoding) as infile:
-            item = cls.from_sexpr(sexpr.parse_sexp(infile.read()))
+            item = cls.from_sexpr(sexpr.parse_sexp(infile))
             item.filePath = filepath
             return item
 
@@ -1041,25 +1044,38 @@ class WorkSheet:
             filepath = self.filePath
 
         with open(filepath, "w") as outfile:
-            outfile.write(self.to_sexpr())
+            self.write_sexpr(outfile)
 
-    def to_sexpr(self, indent=0, newline=True):
-        """Generate the S-Expression representing this object
+    def write_sexpr(self, stream, indent=0, newline=True):
+        """Write the S-Expression representing this object to the given stream
 
         Args:
+            - stream: Text stream (e.g. an opened file) or ``list`` buffer
             - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
+        write = stream_writer(stream)
         indents = " " * indent
         endline = "\n" if newline else ""
 
-        expression = f"{indents}(kicad_wks (version {self.version}) (generator {self.generator})\n"
-        expression += self.setup.to_sexpr(indent + 2)
+        write(
+            f"{indents}(kicad_wks (version {self.version}) (generator {self.generator})\n"
+        )
+        self.setup.write_sexpr(stream, indent + 2)
         for item in self.drawingObjects:
-            expression += item.to_sexpr(indent + 2)
-        expression += f"{indents}){endline}"
+            item.write_sexpr(stream, indent + 2)
+        write(f"{indents}){endline}")
 
-        return expression
+    def to_sexpr(self, indent=0, newline=True):
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buffer = []
+        self.write_sexpr(buffer, indent=indent, newline=newline)
+        return "".join(buffer)
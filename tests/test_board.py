@@ -7,11 +7,32 @@ License identifier:
     GPL-3.0
 """
 
+import asyncio
+import io
+import pickle
+import shutil
+import tempfile
+import threading
 import unittest
+from concurrent.futures import CancelledError
+from dataclasses import replace
 from os import path
 
+from kiutils.batch import aload_files
 from kiutils.board import Board
-from kiutils.footprint import Attributes
+from kiutils.footprint import Attributes, Footprint
+from kiutils.items.brditems import Segment, TraceTable, Via
+from kiutils.items.common import Position, PositionArray, Stroke
+from kiutils.utils import sexpr
+from kiutils.utils.flyweight import (
+    FlyweightPool,
+    SharedObjectError,
+    is_shared,
+    sharing,
+    unshare,
+    writable,
+)
+from kiutils.utils.lazy import is_watched
 from tests.testfunctions import (
     TEST_BASE,
     prepare_test,
@@ -130,6 +151,371 @@ class Tests_Board(unittest.TestCase):
         board = Board().from_file(self.testData.pathToTestFile)
         self.assertTrue(to_file_and_compare(board, self.testData))
 
+    def test_boardFromMappedFile(self):
+        """Tests loading a board from a memory-mapped file, which parses its bytes directly"""
+        self.testData.compareToTestFile = True
+        self.testData.pathToTestFile = path.join(BOARD_BASE, "test_boardTraceArcs")
+        board = Board.from_file(self.testData.pathToTestFile, mmap=True)
+        self.assertEqual(board, Board.from_file(self.testData.pathToTestFile))
+        self.assertTrue(to_file_and_compare(board, self.testData))
+
+    def test_boardLazyLoadingUntouched(self):
+        """Tests that footprints, trace items and zones of a lazily loaded board that were never
+        accessed are written back verbatim"""
+        self.testData.compareToTestFile = True
+        self.testData.pathToTestFile = path.join(
+            BOARD_BASE, "test_boardWithAllPrimitives"
+        )
+        board = Board.from_file(self.testData.pathToTestFile, lazy=True)
+        self.assertEqual(len(board.nets), 5)
+        self.assertTrue(to_file_and_compare(board, self.testData))
+
+    def test_boardLazyLoadingAccessed(self):
+        """Tests that the lists of a lazily loaded board are built when they are accessed and that
+        unchanged objects are written back verbatim"""
+        self.testData.compareToTestFile = True
+        self.testData.pathToTestFile = path.join(
+            BOARD_BASE, "test_boardWithAllPrimitives"
+        )
+        board = Board.from_file(self.testData.pathToTestFile, lazy=True)
+        self.assertEqual(board, Board.from_file(self.testData.pathToTestFile))
+        self.assertTrue(to_file_and_compare(board, self.testData))
+
+    def test_boardLazyLoadingEditedFootprint(self):
+        """Tests that only the changed footprint of a lazily loaded board is serialized again"""
+        self.testData.pathToTestFile = path.join(
+            BOARD_BASE, "test_boardLazyLoadingEditedFootprint"
+        )
+        board = Board.from_file(self.testData.pathToTestFile, lazy=True)
+        board.footprints[1].position.X = 150
+        self.assertEqual(len(board.traceItems), 32)
+
+        # Reading plain values, comparing and serializing does not count as change
+        footprint = board.footprints[0]
+        self.assertEqual(footprint.layer, "F.Cu")
+        self.assertEqual(
+            footprint, Footprint.from_sexpr(sexpr.parse_sexp(footprint.to_sexpr()))
+        )
+        self.assertTrue(is_watched(footprint, built=True))
+        self.assertFalse(is_watched(board.footprints[1]))
+        self.assertTrue(to_file_and_compare(board, self.testData))
+
+    def test_boardExactNumbers(self):
+        """Tests that a board loaded with ``exact=True`` writes its numbers back as they were
+        read, e.g. ``0.0`` instead of ``0``"""
+        self.testData.compareToTestFile = True
+        self.testData.pathToTestFile = path.join(BOARD_BASE, "test_createEmptyBoard")
+        board = Board.from_file(self.testData.pathToTestFile, exact=True)
+        self.assertEqual(board, Board.from_file(self.testData.pathToTestFile))
+        self.assertEqual(f"{board.setup.packToMaskClearance}", "0.0")
+        self.assertTrue(to_file_and_compare(board, self.testData))
+
+    def test_boardParallelLoading(self):
+        """Tests that loading a board in multiple processes gives the same result as loading it in
+        a single process"""
+        self.testData.pathToTestFile = path.join(
+            BOARD_BASE, "test_boardWithAllPrimitives"
+        )
+        board = Board.from_file(self.testData.pathToTestFile, workers=2)
+        self.assertEqual(board, Board.from_file(self.testData.pathToTestFile))
+        self.assertTrue(to_file_and_compare(board, self.testData))
+
+        with self.assertRaises(Exception):
+            Board.from_file(self.testData.pathToTestFile, lazy=True, workers=2)
+
+    def test_boardAsyncLoading(self):
+        """Tests loading and saving boards from asyncio code, loading multiple files with a
+        concurrency limit and cancelling the parser between top-level forms"""
+        self.testData.pathToTestFile = path.join(
+            BOARD_BASE, "test_boardWithAllPrimitives"
+        )
+        expected = Board.from_file(self.testData.pathToTestFile)
+        board = asyncio.run(Board.afrom_file(self.testData.pathToTestFile))
+        self.assertEqual(board, expected)
+
+        directory = tempfile.mkdtemp()
+        try:
+            boardPath = path.join(directory, "board.kicad_pcb")
+            asyncio.run(board.ato_file(boardPath))
+            footprintPath = path.join(directory, "footprint.kicad_mod")
+            shutil.copyfile(
+                path.join(TEST_BASE, "footprint", "test_createNewFootprintTypeSMD"),
+                footprintPath,
+            )
+            loaded = asyncio.run(aload_files([boardPath, footprintPath], limit=1))
+            self.assertEqual(loaded[0].to_sexpr(), expected.to_sexpr())
+            self.assertIsInstance(loaded[1], Footprint)
+
+            loaded = asyncio.run(
+                aload_files(
+                    [boardPath, self.testData.pathToTestFile], return_exceptions=True
+                )
+            )
+            self.assertIsInstance(loaded[1], Exception)
+        finally:
+            shutil.rmtree(directory)
+
+        cancelled = threading.Event()
+        cancelled.set()
+        with sexpr.cancellable(cancelled):
+            with self.assertRaises(CancelledError):
+                Board.from_file(self.testData.pathToTestFile)
+            with self.assertRaises(CancelledError):
+                Board.from_file(self.testData.pathToTestFile, lazy=True)
+
+        async def cancel():
+            task = asyncio.ensure_future(Board.afrom_file(self.testData.pathToTestFile))
+            await asyncio.sleep(0)
+            task.cancel()
+            await task
+
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(cancel())
+
+    def test_boardSharedObjects(self):
+        """Tests that boards loaded with shared objects are equal to boards loaded without them,
+        that equal text effects are shared between footprints and that shared objects are only
+        changed through copies"""
+        self.testData.pathToTestFile = path.join(
+            BOARD_BASE, "test_boardWithAllPrimitives"
+        )
+        expected = Board.from_file(self.testData.pathToTestFile)
+        pool = FlyweightPool()
+        board = Board.from_file(self.testData.pathToTestFile, share=pool)
+        self.assertEqual(board, expected)
+        self.assertEqual(expected, board)
+        self.assertEqual(board.to_sexpr(), expected.to_sexpr())
+        self.assertGreater(pool.hits, 0)
+        self.assertEqual(pickle.loads(pickle.dumps(board)), expected)
+
+        effects = [
+            item.effects
+            for footprint in board.footprints
+            for item in footprint.graphicItems
+            if getattr(item, "effects", None) is not None
+        ]
+        self.assertLess(len({id(item) for item in effects}), len(effects))
+        self.assertTrue(is_shared(effects[0]))
+        with self.assertRaises(SharedObjectError):
+            effects[0].hide = True
+        with self.assertRaises(AttributeError):
+            effects[0].font.height = 2.0
+
+        changed = replace(effects[0], hide=True)
+        changed.font = unshare(changed.font)
+        changed.font.height = 2.0
+        self.assertFalse(effects[0].hide)
+        self.assertNotEqual(effects[0].font.height, 2.0)
+
+        owner = next(
+            item
+            for footprint in board.footprints
+            for item in footprint.graphicItems
+            if getattr(item, "effects", None) is effects[0]
+        )
+        writable(owner, "effects").font.height = 2.0
+        self.assertEqual(owner.effects.font.height, 2.0)
+        self.assertIs(writable(owner, "effects"), owner.effects)
+        self.assertNotEqual(effects[0].font.height, 2.0)
+
+        # Loading again with the same pool reuses its objects
+        again = Board.from_file(self.testData.pathToTestFile, share=pool)
+        self.assertIs(again.footprints[0].graphicItems[0].effects, effects[0])
+
+        # Positions of footprint items are shared, the positions of footprints are not
+        self.assertIs(
+            again.footprints[0].graphicItems[0].position,
+            board.footprints[0].graphicItems[0].position,
+        )
+        self.assertFalse(is_shared(board.footprints[0].position))
+
+        # Exact numbers of equal value but different text are not shared
+        with sharing(FlyweightPool(), exact=True):
+            strokes = [
+                Stroke.from_sexpr(sexpr.parse_sexp(text, exact=True))
+                for text in (
+                    "(stroke (width 1) (type solid))",
+                    "(stroke (width 1.0) (type solid))",
+                )
+            ]
+        self.assertIsNot(strokes[0], strokes[1])
+        exact = Board.from_file(self.testData.pathToTestFile, exact=True, share=True)
+        self.assertEqual(
+            exact.to_sexpr(),
+            Board.from_file(self.testData.pathToTestFile, exact=True).to_sexpr(),
+        )
+
+    def test_boardColumnarTraceItems(self):
+        """Tests that boards loaded with columnar trace items are equal to boards loaded without
+        them, that the table can be filtered and that changed items are written out"""
+        self.testData.pathToTestFile = path.join(BOARD_BASE, "test_boardTraceArcs")
+        expected = Board.from_file(self.testData.pathToTestFile)
+        board = Board.from_file(self.testData.pathToTestFile, columnar=True)
+        table = board.traceItems
+        self.assertIsInstance(table, TraceTable)
+        self.assertEqual(board, expected)
+        self.assertEqual(board.to_sexpr(), expected.to_sexpr())
+        self.assertEqual(pickle.loads(pickle.dumps(board)), expected)
+
+        self.assertEqual(
+            list(table.filter_by_net(2)),
+            [item for item in expected.traceItems if item.net == 2],
+        )
+        self.assertEqual(len(table.filter_by_layer("F.Cu")), len(table))
+        self.assertEqual(len(table.filter_by_layer("B.Cu")), 0)
+        self.assertEqual(
+            list(table.column("nets")), [i.net for i in expected.traceItems]
+        )
+
+        # Changes of items taken from the table are written through to the columns
+        table[0].width = 1.5
+        expected.traceItems[0].width = 1.5
+        table[2].end.X = 120
+        expected.traceItems[2].end.X = 120
+        self.assertEqual(len(table.views), 0)
+        end = table[3].end
+        end.Y = 7.5
+        expected.traceItems[3].end.Y = 7.5
+        self.assertIs(table[3].end, end)
+        segment = Segment(
+            start=Position(1, 2),
+            end=Position(3, 4.5),
+            width=0.5,
+            layer="B.Cu",
+            net=1,
+            tstamp="abc",
+        )
+        table.insert(1, segment)
+        expected.traceItems.insert(1, segment)
+        del table[-1]
+        del expected.traceItems[-1]
+        self.assertEqual(board.to_sexpr(), expected.to_sexpr())
+        self.assertEqual(len(table.filter_by_layer("B.Cu")), 1)
+
+        with self.assertRaises(Exception):
+            Board.from_file(self.testData.pathToTestFile, columnar=True, exact=True)
+
+        vias = TraceTable([Via(layers=["F.Cu", "B.Cu"], net=1)])
+        vias[0].layers.append("In1.Cu")
+        self.assertEqual(vias.where(layer="In1.Cu"), [0])
+        self.assertEqual(vias[0].layers, ["F.Cu", "B.Cu", "In1.Cu"])
+
+        # Views of removed items keep their values
+        via = vias[0]
+        del vias[0]
+        self.assertIsNone(via.owner)
+        self.assertEqual(via.layers, ["F.Cu", "B.Cu", "In1.Cu"])
+        self.assertEqual(via.net, 1)
+
+    def test_boardFilledPolygonArrays(self):
+        """Tests that the points of zone fills are stored in arrays, behave like lists of positions
+        and that changed points are written out"""
+        self.testData.pathToTestFile = path.join(
+            BOARD_BASE, "test_boardWithAllPrimitives"
+        )
+        board = Board.from_file(self.testData.pathToTestFile)
+        polygon = board.zones[0].filledPolygons[0]
+        points = polygon.coordinates
+        self.assertIsInstance(points, PositionArray)
+        self.assertEqual(len(points.views), 0)
+
+        # The positions of the expected list are built from another board, so that the points of
+        # the first one are written in one batch without building any objects
+        other = Board.from_file(self.testData.pathToTestFile)
+        expected = replace(
+            polygon, coordinates=list(other.zones[0].filledPolygons[0].coordinates)
+        )
+        self.assertEqual(polygon.to_sexpr(), expected.to_sexpr())
+        self.assertEqual(points, expected.coordinates)
+        self.assertEqual(repr(points), repr(expected.coordinates))
+        self.assertEqual(pickle.loads(pickle.dumps(board)), board)
+        first = expected.coordinates[0]
+        self.assertEqual(len(points.xy()), 2 * len(points))
+        self.assertEqual([float(v) for v in points.xy()[:2]], [first.X, first.Y])
+        self.assertEqual([float(v) for v in points.xy2d()[0]], [first.X, first.Y])
+        self.assertEqual(len(points.views), 0)
+
+        # Views write their changes through and follow their point when points are inserted or
+        # removed before it
+        fourth = points[3]
+        for coordinates in (points, expected.coordinates):
+            point = coordinates[3]
+            coordinates[0].X = 1.5
+            del coordinates[1]
+            coordinates.insert(2, Position(3, 4))
+            coordinates.insert(0, Position(5, 6))
+            point.Y = 2.5
+        self.assertIs(points[4], fourth)
+        self.assertEqual(polygon.to_sexpr(), expected.to_sexpr())
+        self.assertEqual(points, expected.coordinates)
+        del fourth
+        self.assertEqual(len(points.views), 0)
+
+        # Numbers parsed with ``exact=True`` are kept unchanged
+        exact = Board.from_file(self.testData.pathToTestFile, exact=True)
+        points = exact.zones[0].filledPolygons[0].coordinates
+        self.assertEqual(len(points.lexemes), 2 * len(points))
+        self.assertIsInstance(points[0].X, sexpr.Number)
+        points = PositionArray.from_sexpr(
+            sexpr.parse_sexp("(pts (xy 1.500 2) (xy 3.0 4.25))", exact=True)
+        )
+        self.assertEqual(points.to_sexpr(), "(xy 1.500 2)\n(xy 3.0 4.25)\n")
+        points[0].Y = 5
+        self.assertEqual(points.to_sexpr(), "(xy 1.500 5)\n(xy 3.0 4.25)\n")
+
+    def test_writeSexprToStreams(self):
+        """Tests that ``write_sexpr()`` writes the same text to files, text streams and list buffers
+        as ``to_sexpr()`` returns"""
+        self.testData.pathToTestFile = path.join(
+            BOARD_BASE, "test_boardWithAllPrimitives"
+        )
+        board = Board.from_file(self.testData.pathToTestFile)
+        expected = board.to_sexpr()
+
+        stream = io.StringIO()
+        board.write_sexpr(stream)
+        self.assertEqual(stream.getvalue(), expected)
+
+        buffer = []
+        board.write_sexpr(buffer)
+        self.assertGreater(len(buffer), 1)
+        self.assertEqual("".join(buffer), expected)
+
+        buffer = []
+        board.footprints[0].write_sexpr(buffer, indent=2, layerInFirstLine=True)
+        self.assertEqual(
+            "".join(buffer), board.footprints[0].to_sexpr(2, layerInFirstLine=True)
+        )
+        self.assertTrue(to_file_and_compare(board, self.testData))
+
+    def test_registerTokenHandler(self):
+        """Tests that handlers registered for a token on a subclass of ``Board`` are called for
+        the items with that token, while ``Board`` itself is not changed"""
+        self.testData.pathToTestFile = path.join(
+            BOARD_BASE, "test_boardWithAllPrimitives"
+        )
+
+        class NetCountingBoard(Board):
+            pass
+
+        handledNets = []
+        netHandler = Board.tokenHandlers["net"]
+
+        def countNets(board, item):
+            handledNets.append(item[1])
+            netHandler(board, item)
+
+        NetCountingBoard.register_token_handler("net", countNets)
+        board = NetCountingBoard.from_file(self.testData.pathToTestFile)
+        self.assertEqual(handledNets, [net.number for net in board.nets])
+        self.assertIs(Board.tokenHandlers["net"], netHandler)
+        self.assertTrue(to_file_and_compare(board, self.testData))
+
+        self.assertIs(NetCountingBoard.unregister_token_handler("net"), countNets)
+        self.assertEqual(
+            NetCountingBoard.from_file(self.testData.pathToTestFile).nets, []
+        )
+
 
 class Tests_Board_Since_V7(unittest.TestCase):
     """Test cases for Boards since KiCad 7"""
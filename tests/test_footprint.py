@@ -7,10 +7,12 @@ License identifier:
     GPL-3.0
 """
 
+import shutil
+import tempfile
 import unittest
 from os import path
 
-from kiutils.footprint import Footprint
+from kiutils.footprint import Footprint, FootprintLibrary
 from tests.testfunctions import (
     TEST_BASE,
     prepare_test,
@@ -218,3 +220,69 @@ class Tests_Footprint_Since_V7(unittest.TestCase):
         )
         footprint = Footprint().from_file(self.testData.pathToTestFile)
         self.assertTrue(to_file_and_compare(footprint, self.testData))
+
+
+class Tests_FootprintLibrary(unittest.TestCase):
+    """Test cases for footprint libraries"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp(suffix=".pretty")
+        self.names = [
+            "test_createNewFootprintTypeOther",
+            "test_createNewFootprintTypeSMD",
+            "test_createNewFootprintTypeTHT",
+        ]
+        for name in self.names:
+            shutil.copyfile(
+                path.join(FOOTPRINT_BASE, name),
+                path.join(self.directory, f"{name}.kicad_mod"),
+            )
+        with open(path.join(self.directory, "README.txt"), "w") as outfile:
+            outfile.write("Not a footprint")
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+        return super().tearDown()
+
+    def test_footprintLibraryOnDemand(self):
+        """Tests listing a footprint library and loading its footprints on demand with a bounded
+        cache of the most recently used ones"""
+        library = FootprintLibrary.from_directory(self.directory, cacheSize=2)
+        self.assertEqual(library.names(), self.names)
+        self.assertEqual(len(library), 3)
+        self.assertIn("test_createNewFootprintTypeSMD", library)
+        self.assertNotIn("README", library)
+        self.assertEqual(library.statistics.files, 0)
+
+        footprint = library.get("test_createNewFootprintTypeSMD")
+        expected = Footprint.from_file(
+            path.join(FOOTPRINT_BASE, "test_createNewFootprintTypeSMD")
+        )
+        expected.filePath = library.footprint_path("test_createNewFootprintTypeSMD")
+        self.assertEqual(footprint, expected)
+        self.assertIs(library.get("test_createNewFootprintTypeSMD"), footprint)
+        library.get("test_createNewFootprintTypeOther")
+        library.get("test_createNewFootprintTypeTHT")
+        self.assertEqual(
+            list(library.recentlyUsed),
+            ["test_createNewFootprintTypeOther", "test_createNewFootprintTypeTHT"],
+        )
+        self.assertEqual(library.statistics.files, 3)
+
+        with self.assertRaises(Exception):
+            library.get("missing")
+        with self.assertRaises(Exception):
+            FootprintLibrary.from_directory(path.join(self.directory, "missing"))
+
+    def test_footprintLibraryLoadAll(self):
+        """Tests bulk-loading all footprints of a library in worker processes"""
+        library = FootprintLibrary.from_directory(self.directory)
+        footprints = library.load_all(workers=2)
+        self.assertEqual(list(footprints), self.names)
+        self.assertEqual(library.load_all(workers=1), footprints)
+        for name, footprint in footprints.items():
+            self.assertEqual(footprint.filePath, library.footprint_path(name))
+        self.assertEqual(library.statistics.files, 6)
+        self.assertGreater(library.statistics.bytes, 0)
+        self.assertEqual(library.recentlyUsed, {})
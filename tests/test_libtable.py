@@ -7,10 +7,16 @@ License identifier:
     GPL-3.0
 """
 
+import os
+import shutil
+import tempfile
+import threading
 import unittest
 from os import path
 
-from kiutils.libraries import Library, LibTable
+from kiutils.footprint import Footprint
+from kiutils.libraries import Library, LibraryCache, LibTable
+from kiutils.symbol import SymbolLib
 from tests.testfunctions import (
     TEST_BASE,
     prepare_test,
@@ -76,3 +82,139 @@ class Tests_LibTable(unittest.TestCase):
         self.assertTrue(to_file_and_compare(libtable, self.testData))
 
     # TODO: Tests with invalid type token
+
+    def test_resolveLibraryIds(self):
+        """Tests resolving library IDs through a project and a global library table with path
+        variables, and the invalidation of memoized library files by their modification time
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            os.mkdir(path.join(directory, "Project.pretty"))
+            shutil.copyfile(
+                path.join(TEST_BASE, "footprint", "test_createNewFootprintTypeSMD"),
+                path.join(directory, "Project.pretty", "R_SMD.kicad_mod"),
+            )
+            symbolFile = path.join(directory, "Symbols.kicad_sym")
+            shutil.copyfile(
+                path.join(TEST_BASE, "symbol", "test_bigSymbolLibrary"), symbolFile
+            )
+
+            projectTable = LibTable.create_new("fp_lib_table")
+            projectTable.filePath = path.join(directory, "fp-lib-table")
+            projectTable.libs.append(
+                Library(name="Project", uri="${KIPRJMOD}/Project.pretty")
+            )
+            globalTable = LibTable.create_new("fp_lib_table")
+            globalTable.libs.append(Library(name="Project", uri="/nowhere"))
+            globalTable.libs.append(
+                Library(name="Global", uri="$(GLOBAL_DIR)/x.pretty")
+            )
+
+            resolver = projectTable.resolver(globalTable, {"GLOBAL_DIR": "/global"})
+            self.assertEqual(
+                [lib.name for lib in resolver.table.libs], ["Project", "Global"]
+            )
+            self.assertEqual(resolver.library_path("Global"), "/global/x.pretty")
+            footprint = resolver.resolve("Project:R_SMD")
+            self.assertEqual(
+                footprint,
+                Footprint.from_file(
+                    path.join(TEST_BASE, "footprint", "test_createNewFootprintTypeSMD")
+                ),
+            )
+            self.assertIs(resolver.resolve("Project:R_SMD"), footprint)
+            self.assertEqual((resolver.hits, resolver.misses), (1, 1))
+            with self.assertRaises(Exception):
+                resolver.resolve("Unknown:R_SMD")
+            with self.assertRaises(Exception):
+                resolver.resolve("R_SMD")
+
+            symbolTable = LibTable.create_new("sym_lib_table")
+            symbolTable.libs.append(
+                Library(name="Symbols", uri="${SYMBOL_DIR}/Symbols.kicad_sym")
+            )
+            resolver = symbolTable.resolver(variables={"SYMBOL_DIR": directory})
+            symbol = resolver.resolve("Symbols:MN3101")
+            self.assertEqual(symbol, SymbolLib.from_file(symbolFile).get("MN3101"))
+            resolver.resolve("Symbols:AD1853")
+            self.assertEqual((resolver.hits, resolver.misses), (1, 1))
+
+            stat = os.stat(symbolFile)
+            os.utime(symbolFile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertIsNot(resolver.resolve("Symbols:MN3101"), symbol)
+            self.assertEqual((resolver.hits, resolver.misses), (1, 2))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_libraryCacheChanges(self):
+        """Tests that the library cache only reloads added and modified files and reports every
+        change to its listeners"""
+        directory = tempfile.mkdtemp()
+        try:
+            libraryPath = path.join(directory, "Library.pretty")
+            os.mkdir(libraryPath)
+            footprintPath = path.join(libraryPath, "R.kicad_mod")
+            shutil.copyfile(
+                path.join(TEST_BASE, "footprint", "test_createNewFootprintTypeSMD"),
+                footprintPath,
+            )
+            symbolPath = path.join(directory, "Symbols.kicad_sym")
+            shutil.copyfile(
+                path.join(TEST_BASE, "symbol", "test_bigSymbolLibrary"), symbolPath
+            )
+
+            cache = LibraryCache(paths=[libraryPath, symbolPath], lazy=True)
+            changes = []
+            cache.add_listener(changes.append)
+            cache.scan()
+            self.assertEqual(
+                sorted((change.kind, change.filePath) for change in changes),
+                [("added", footprintPath), ("added", symbolPath)],
+            )
+            symbolLib = cache.items[symbolPath]
+            self.assertEqual(symbolLib.get("MN3101").libId, "MN3101")
+            self.assertEqual(cache.scan(), [])
+
+            with open(footprintPath, "a") as outfile:
+                outfile.write("\n")
+            brokenPath = path.join(libraryPath, "Broken.kicad_mod")
+            with open(brokenPath, "w") as outfile:
+                outfile.write("(footprint")
+            changes.clear()
+            cache.scan()
+            self.assertEqual(
+                [(change.kind, change.filePath) for change in changes],
+                [("modified", footprintPath)],
+            )
+            self.assertIsNot(changes[0].item, changes[0].previous)
+            self.assertIn(brokenPath, cache.errors)
+            self.assertIs(cache.items[symbolPath], symbolLib)
+
+            os.remove(symbolPath)
+            os.remove(brokenPath)
+            changes.clear()
+            cache.scan()
+            self.assertEqual(
+                [(change.kind, change.previous) for change in changes],
+                [("removed", symbolLib)],
+            )
+            self.assertEqual(list(cache.items), [footprintPath])
+            self.assertEqual(cache.errors, {})
+
+            stop = threading.Event()
+            watcher = threading.Thread(
+                target=cache.watch, args=(0.01, stop, "poll"), daemon=True
+            )
+            watcher.start()
+            try:
+                shutil.copyfile(footprintPath, path.join(libraryPath, "C.kicad_mod"))
+                for _ in range(500):
+                    if len(cache.items) == 2:
+                        break
+                    stop.wait(0.01)
+                self.assertEqual(len(cache.items), 2)
+            finally:
+                stop.set()
+                watcher.join()
+        finally:
+            shutil.rmtree(directory)
@@ -7,10 +7,27 @@ License identifier:
     GPL-3.0
 """
 
+import copy
+import io
+import os
+import pickle
+import shutil
+import tempfile
 import unittest
+from contextlib import redirect_stdout
+from dataclasses import replace
 from os import path
+from unittest import mock
 
+from kiutils.__main__ import main
+from kiutils.footprint import Footprint
+from kiutils.items.brditems import Segment
+from kiutils.items.common import Effects, Justify
 from kiutils.schematic import Schematic
+from kiutils.symbol import Symbol
+from kiutils.utils.cache import ParseCache
+from kiutils.utils.construct import fill_defaults, new_object
+from kiutils.utils.formindex import FormIndex
 from tests.testfunctions import TEST_BASE, prepare_test, to_file_and_compare
 
 MISC_BASE = path.join(TEST_BASE, "misc")
@@ -36,3 +53,176 @@ class Tests_Misc(unittest.TestCase):
         self.testData.compareToTestFile = True
         libtable = Schematic().from_file(self.testData.pathToTestFile)
         self.assertTrue(to_file_and_compare(libtable, self.testData))
+
+    def test_formIndexRandomAccess(self):
+        """Tests loading single footprints and symbols through the top-level form index"""
+        board = path.join(TEST_BASE, "board", "test_allFpManufacturingAttributes")
+        index = FormIndex.from_file(board)
+        self.assertEqual(index.forms[0].head, "version")
+        footprints = index.find(head="footprint")
+        self.assertEqual(len(footprints), 24)
+        footprint = Footprint.from_sexpr(index.read(footprints[3]))
+        self.assertEqual(footprint.libId, footprints[3].name)
+
+        library = path.join(TEST_BASE, "symbol", "test_bigSymbolLibrary")
+        index = FormIndex.from_file(library)
+        entry = index.find(head="symbol")[-1]
+        symbol = Symbol.from_sexpr(index.read(entry))
+        self.assertEqual(symbol.libId, entry.name)
+
+    def test_formIndexPersistence(self):
+        """Tests that a persisted form index is reused only while the indexed file is unchanged"""
+        directory = tempfile.mkdtemp()
+        try:
+            board = path.join(directory, "board.kicad_pcb")
+            shutil.copyfile(path.join(TEST_BASE, "board", "test_boardTraceArcs"), board)
+            index = FormIndex.from_file(board, persist=True)
+            self.assertTrue(path.isfile(FormIndex.index_path(board)))
+            self.assertEqual(FormIndex.load(FormIndex.index_path(board)), index)
+
+            with open(board, "a") as outfile:
+                outfile.write("\n")
+            self.assertFalse(index.is_valid())
+            reindexed = FormIndex.from_file(board, persist=True)
+            self.assertEqual(reindexed.size, index.size + 1)
+            self.assertEqual(FormIndex.load(FormIndex.index_path(board)), reindexed)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_defaultsOfMissingTokens(self):
+        """Tests that fields whose tokens are missing in the S-Expression get their default values
+        and that these are not shared between objects"""
+        first = Effects.from_sexpr(["effects", ["font", ["size", 1.27, 1.27]]])
+        self.assertEqual(first.justify, Justify())
+        second = Effects.from_sexpr(["effects", ["font", ["size", 1.27, 1.27]]])
+        self.assertIsNot(first.justify, second.justify)
+
+        segment = Segment.from_sexpr(["segment", ["width", 0.25], ["net", 1]])
+        self.assertEqual(segment, Segment(width=0.25, net=1))
+
+    def test_slottedItems(self):
+        """Tests that objects of slotted classes have no ``__dict__`` and can be pickled with all
+        protocols, copied and replaced, also before all of their fields are set"""
+        segment = Segment.from_sexpr(
+            [
+                "segment",
+                ["start", 1, 2.5],
+                ["end", 3, 4],
+                ["width", 0.25],
+                ["layer", "F.Cu"],
+                ["net", 1],
+                ["tstamp", "abc"],
+            ]
+        )
+        self.assertFalse(hasattr(segment, "__dict__"))
+        self.assertFalse(hasattr(segment.start, "__dict__"))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(segment, protocol)), segment)
+        self.assertEqual(copy.deepcopy(segment), segment)
+        self.assertIsNot(copy.deepcopy(segment).start, segment.start)
+        changed = replace(segment, width=0.5)
+        self.assertEqual(changed.width, 0.5)
+        self.assertIs(changed.start, segment.start)
+
+        unfinished = new_object(Segment)
+        self.assertEqual(
+            fill_defaults(pickle.loads(pickle.dumps(unfinished))),
+            fill_defaults(unfinished),
+        )
+
+    def test_parseCache(self):
+        """Tests that the parse cache reuses objects of unchanged files only and counts its hits
+        and misses"""
+        directory = tempfile.mkdtemp()
+        try:
+            footprint = path.join(directory, "footprint.kicad_mod")
+            shutil.copyfile(
+                path.join(TEST_BASE, "footprint", "test_createNewFootprintTypeSMD"),
+                footprint,
+            )
+            cache = ParseCache(directory=path.join(directory, "cache"))
+            loaded = Footprint.from_file(footprint, cache=cache)
+            self.assertEqual(Footprint.from_file(footprint, cache=cache), loaded)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+            # Only the modification time changed, the content hash still matches
+            stat = os.stat(footprint)
+            os.utime(footprint, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertEqual(Footprint.from_file(footprint, cache=cache), loaded)
+            self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+            with open(footprint, "a") as outfile:
+                outfile.write("\n")
+            Footprint.from_file(footprint, cache=cache)
+            self.assertEqual((cache.hits, cache.misses), (2, 2))
+            self.assertAlmostEqual(cache.hit_rate(), 0.5)
+
+            # The size of the entries is tracked without scanning the directory on every miss
+            entries = [entry.path for entry in os.scandir(cache.directory)]
+            self.assertEqual(cache._size, sum(map(path.getsize, entries)))
+
+            # Entries written for another layout of the classes are ignored
+            with mock.patch("kiutils.utils.cache._layout", "other"):
+                Footprint.from_file(footprint, cache=cache)
+            Footprint.from_file(footprint, cache=cache)
+            self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+            # Entries of other options or classes are separate, the oldest ones are evicted
+            cache.maxSize = 1
+            Footprint.from_file(footprint, exact=True, cache=cache)
+            self.assertEqual(cache.misses, 5)
+            self.assertGreater(cache.evictions, 0)
+            cache.clear()
+            self.assertEqual(os.listdir(cache.directory), [])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_batchCommandLine(self):
+        """Tests validating, reformatting and counting the items of a directory of KiCad files
+        with the ``python -m kiutils`` command line interface"""
+        directory = tempfile.mkdtemp()
+        try:
+            os.mkdir(path.join(directory, "Library.pretty"))
+            shutil.copyfile(
+                path.join(TEST_BASE, "footprint", "test_createNewFootprintTypeSMD"),
+                path.join(directory, "Library.pretty", "R.kicad_mod"),
+            )
+            shutil.copyfile(
+                path.join(TEST_BASE, "symbol", "test_bigSymbolLibrary"),
+                path.join(directory, "Symbols.kicad_sym"),
+            )
+            shutil.copyfile(
+                path.join(TEST_BASE, "libtable", "test_parseSymLibTable.expected"),
+                path.join(directory, "sym-lib-table"),
+            )
+            with open(path.join(directory, "README.md"), "w") as outfile:
+                outfile.write("Not a KiCad file")
+
+            output = io.StringIO()
+            with redirect_stdout(output):
+                exitCode = main(["stats", directory, "--workers", "2"])
+            lines = output.getvalue().splitlines()
+            self.assertEqual(exitCode, 0)
+            self.assertEqual(len(lines), 4)
+            self.assertTrue(lines[0].endswith("Symbols.kicad_sym symbols=60"))
+            self.assertTrue(lines[-1].startswith("3 files"))
+
+            with open(path.join(directory, "Broken.kicad_sch"), "w") as outfile:
+                outfile.write("(kicad_pcb)")
+            output = io.StringIO()
+            with redirect_stdout(output):
+                exitCode = main(["reformat", directory, "-j", "1", "--quiet"])
+            lines = output.getvalue().splitlines()
+            self.assertEqual(exitCode, 1)
+            self.assertEqual(len(lines), 2)
+            self.assertTrue(lines[0].startswith("ERROR"))
+            self.assertTrue(lines[1].endswith("1 failed"))
+
+            expected = Footprint.from_file(
+                path.join(TEST_BASE, "footprint", "test_createNewFootprintTypeSMD")
+            )
+            reformatted = path.join(directory, "Library.pretty", "R.kicad_mod")
+            with open(reformatted) as infile:
+                self.assertEqual(infile.read(), expected.to_sexpr())
+        finally:
+            shutil.rmtree(directory)
@@ -0,0 +1,174 @@
+"""Unittests of the S-Expression parser
+
+Authors:
+    (C) Marvin Mager - @mvnmgrx - 2022
+
+License identifier:
+    GPL-3.0
+"""
+
+import io
+import unittest
+from os import path
+
+from kiutils.board import Board
+from kiutils.items.brditems import Via
+from kiutils.utils import sexpr
+from kiutils.utils.sexpr import Number, iterforms, iterparse, parse_sexp
+from tests.testfunctions import TEST_BASE, load_contents
+
+
+class Tests_Sexpr(unittest.TestCase):
+    """Test cases for the S-Expression parser"""
+
+    def test_parseNumbers(self):
+        """Tests that numbers are converted to int or float and that number-like tokens which are
+        not followed by a space or closing bracket are kept as strings"""
+        self.assertEqual(
+            parse_sexp("(at 1 -2.5 1.0 +3 +3.5 0402)"),
+            ["at", 1, -2.5, 1, "+3", 3.5, 402],
+        )
+        self.assertEqual(
+            parse_sexp('(render_cache "t" 0\n (polygon))'),
+            ["render_cache", "t", "0", ["polygon"]],
+        )
+        self.assertEqual(
+            parse_sexp("(a 1.5.3 12abc 1e5)"), ["a", "1.5.3", "12abc", "1e5"]
+        )
+
+    def test_parseExactNumbers(self):
+        """Tests that numbers parsed with ``exact=True`` keep their text and behave like the
+        numbers they represent"""
+        exp = parse_sexp("(at 1 -2.50 1.0 +3 0402)", exact=True)
+        self.assertEqual(exp, ["at", 1, -2.5, 1, "+3", 402])
+        self.assertEqual(
+            [f"{value}" for value in exp[1:]], ["1", "-2.50", "1.0", "+3", "0402"]
+        )
+        self.assertIsInstance(exp[2], Number)
+        self.assertNotIsInstance(exp[4], Number)
+
+        self.assertEqual(exp[2] + 1, -1.5)
+        self.assertEqual(2 * exp[2], -5.0)
+        self.assertEqual(-exp[2], 2.5)
+        self.assertTrue(exp[1] < exp[3] + 1)
+        self.assertEqual(f"{exp[2]:.3f}", "-2.500")
+        self.assertEqual(float(exp[2]), -2.5)
+        self.assertEqual(hash(exp[3]), hash(1))
+        self.assertFalse(Number("0.0"))
+        # Plain strings are compared by their text
+        self.assertEqual(exp[5], "0402")
+        self.assertNotEqual(Number("1.0"), "1")
+        self.assertEqual(list(iterforms("(a (b 1.50))", exact=True)), ["a", ["b", 1.5]])
+        self.assertEqual(repr(list(iterparse("(a 1.50)", exact=True))[2][1]), "1.50")
+
+    def test_parseQuotedStrings(self):
+        """Tests quoted strings, including empty strings and escaped quotes"""
+        self.assertEqual(parse_sexp('(a "" "b c" (d))'), ["a", "", "b c", ["d"]])
+        self.assertEqual(parse_sexp('(a "b \\"c\\"" d)'), ["a", 'b "c"', "d"])
+        self.assertEqual(parse_sexp('(a "C:\\\\" "x")'), ["a", "C:\\\\", "x"])
+        self.assertEqual(parse_sexp('(a "b"c d)'), ["a", '"b"c', "d"])
+
+    def test_parseNesting(self):
+        """Tests nested lists and lists whose first item is not a plain symbol"""
+        self.assertEqual(
+            parse_sexp('(a (b (c 1)) ( d) ("e") (1 2) ())'),
+            ["a", ["b", ["c", 1]], ["d"], ["e"], [1, 2], []],
+        )
+        with self.assertRaises(AssertionError):
+            parse_sexp("(a (b)")
+        with self.assertRaises(AssertionError):
+            parse_sexp("(a))")
+
+    def test_iterparseEvents(self):
+        """Tests the events yielded by the streaming parser"""
+        self.assertEqual(
+            list(iterparse('(a 1 ("b") ())')),
+            [
+                ("open", None),
+                ("atom", "a"),
+                ("atom", 1),
+                ("open", None),
+                ("atom", "b"),
+                ("close", None),
+                ("open", None),
+                ("close", None),
+                ("close", None),
+            ],
+        )
+        with self.assertRaises(AssertionError):
+            list(iterparse("(a (b)"))
+
+    def test_iterformsEqualsParseSexp(self):
+        """Tests that the items yielded by ``iterforms()`` are the same as the ones of the parsed
+        S-Expression and that a board loaded from them equals the one loaded from ``parse_sexp()``
+        """
+        content = load_contents(
+            path.join(TEST_BASE, "board", "test_boardWithAllPrimitives")
+        )
+        self.assertEqual(list(iterforms(content)), parse_sexp(content))
+        self.assertEqual(
+            Board.from_forms(iterforms(content)),
+            Board.from_sexpr(parse_sexp(content)),
+        )
+        with self.assertRaises(AssertionError):
+            list(iterforms("(a (b)"))
+
+    def test_parseChunkedInput(self):
+        """Tests that parsing the input in chunks of any size gives the same result as parsing it
+        at once, also when tokens and quoted strings cross the chunk boundaries"""
+        contents = [
+            '(a "b \\" c" "C:\\\\" d "e f")',
+            '(a "q"(b) 12\n3 -4.5)',
+            load_contents(
+                path.join(TEST_BASE, "misc", "test_quotesAndBackslashInSexpr")
+            ),
+        ]
+        for content in contents:
+            expected = parse_sexp(content)
+            for size in (1, 2, 3, 7, 64):
+                chunks = [content[i : i + size] for i in range(0, len(content), size)]
+                self.assertEqual(parse_sexp(chunks), expected)
+                self.assertEqual(list(iterforms(iter(chunks))), expected)
+            self.assertEqual(parse_sexp(io.StringIO(content)), expected)
+
+    def test_parseBytes(self):
+        """Tests that ``bytes`` input is tokenized in place and gives the same result as ``str``"""
+        content = '(a "b \\" c" 1 -2.5 "\xfc" (d))'
+        self.assertEqual(parse_sexp(content.encode("utf-8")), parse_sexp(content))
+        self.assertEqual(
+            list(iterforms(content.encode("latin-1"), "latin-1")), parse_sexp(content)
+        )
+
+    def test_internAtoms(self):
+        """Tests that equal symbols and words of the vocabulary are parsed into the same object,
+        that other quoted strings are not interned and that the intern table of a parser call is
+        bounded"""
+        board = Board.from_file(
+            path.join(TEST_BASE, "board", "test_boardStackup32LayerDielectricsVias")
+        )
+        layers = [
+            layer
+            for item in board.traceItems
+            for layer in (item.layers if isinstance(item, Via) else [item.layer])
+        ]
+        self.assertEqual(len({id(layer) for layer in layers}), len(set(layers)))
+        self.assertIs(
+            next(layer for layer in layers if layer == "F.Cu"),
+            sexpr.intern_atom("".join("F.Cu")),
+        )
+
+        exp = parse_sexp('(a "net name" "net name" symbol symbol "F.Cu")')
+        self.assertIsNot(exp[1], exp[2])
+        self.assertIs(exp[3], exp[4])
+        self.assertIs(exp[5], sexpr.intern_atom("".join("F.Cu")))
+        # Symbols outside the vocabulary are only shared within one parser call
+        self.assertIsNot(parse_sexp("(a symbol)")[1], exp[3])
+
+        size = sexpr.INTERN_TABLE_SIZE
+        try:
+            sexpr.INTERN_TABLE_SIZE = len(sexpr.KICAD_VOCABULARY)
+            exp = list(iterforms("(a symbol (b) symbol layer)"))
+            self.assertIsNot(exp[1], exp[3])
+            self.assertIs(exp[4], sexpr.intern_atom("lay" + "er"))
+        finally:
+            sexpr.INTERN_TABLE_SIZE = size
@@ -7,11 +7,13 @@ License identifier:
     GPL-3.0
 """
 
+import pickle
 import unittest
 from os import path
 
 from kiutils.misc.config import KIUTILS_CREATE_NEW_VERSION_STR
 from kiutils.symbol import Symbol, SymbolLib
+from kiutils.utils.lazy import pending
 from kiutils.utils.sexpr import parse_sexp
 from tests.testfunctions import (
     TEST_BASE,
@@ -80,6 +82,82 @@ class Tests_Symbol(unittest.TestCase):
         symbolLib = SymbolLib().from_file(self.testData.pathToTestFile)
         self.assertTrue(to_file_and_compare(symbolLib, self.testData))
 
+    def test_lazySymbolLibrary(self):
+        """Tests building single symbols of a lazily loaded symbol library by their name and
+        writing back the source text of all symbols that were not changed"""
+        self.testData.compareToTestFile = True
+        self.testData.pathToTestFile = path.join(SYMBOL_BASE, "test_bigSymbolLibrary")
+        eager = SymbolLib.from_file(self.testData.pathToTestFile)
+        symbolLib = SymbolLib.from_file(self.testData.pathToTestFile, lazy=True)
+        self.assertEqual(symbolLib.names(), eager.names())
+        self.assertEqual(symbolLib.get("MN3101"), eager.get("MN3101"))
+        self.assertIsNotNone(pending(symbolLib, "symbols"))
+        self.assertTrue(to_file_and_compare(symbolLib, self.testData))
+
+        symbolLib.get("MN3101").properties[1].value = "Changed"
+        eager.get("MN3101").properties[1].value = "Changed"
+        self.assertEqual(symbolLib.to_sexpr(), eager.to_sexpr())
+        self.assertIs(
+            symbolLib.symbols[symbolLib.names().index("MN3101")],
+            symbolLib.get("MN3101"),
+        )
+        self.assertEqual(symbolLib.symbols, eager.symbols)
+        self.assertEqual(symbolLib.to_sexpr(), eager.to_sexpr())
+
+        with self.assertRaises(Exception):
+            symbolLib.get("missing")
+
+    def test_flattenDerivedSymbols(self):
+        """Tests resolving the ``extends`` token of derived symbols, that the results are copies
+        and that the memoized results are created again when a symbol is changed"""
+        symbolLib = SymbolLib.from_file(
+            path.join(SYMBOL_BASE, "test_bigSymbolLibrary"), lazy=True
+        )
+        parent = symbolLib.get("82C54")
+        derived = symbolLib.get("8253")
+        flat = symbolLib.flatten("8253")
+        self.assertIs(symbolLib.flatten("8253"), flat)
+        self.assertIsNone(flat.extends)
+        self.assertEqual(flat.libId, "8253")
+        self.assertEqual([unit.libId for unit in flat.units], ["8253_0_1", "8253_1_1"])
+        self.assertEqual(flat.units[1].pins, parent.units[1].pins)
+        self.assertEqual(
+            [item.key for item in flat.properties],
+            [item.key for item in parent.properties],
+        )
+        self.assertEqual(flat.properties[1].value, derived.properties[1].value)
+        self.assertEqual(symbolLib.flatten("82C54"), parent)
+        self.assertIsNot(symbolLib.flatten("82C54"), parent)
+
+        # Results share no objects with the library, and changed results are not reused
+        flat.units[1].pins[0].name = "Flat"
+        self.assertNotEqual(parent.units[1].pins[0].name, "Flat")
+        self.assertIsNot(symbolLib.flatten("8253"), flat)
+        self.assertNotEqual(symbolLib.flatten("8253").units[1].pins[0].name, "Flat")
+
+        # Changes of the parent are detected
+        parent.units[1].pins[0].name = "Changed"
+        self.assertEqual(symbolLib.flatten("8253").units[1].pins[0].name, "Changed")
+
+        flat = symbolLib.flatten("8253")
+        self.assertIs(symbolLib.flatten("8253"), flat)
+        symbolLib.invalidate("82C54")
+        self.assertIsNot(symbolLib.flatten("8253"), flat)
+
+        flattened = symbolLib.flatten_all()
+        self.assertEqual(len(flattened), len(symbolLib.symbols))
+        self.assertTrue(all(item.extends is None for item in flattened))
+        self.assertIs(
+            flattened[symbolLib.names().index("8253")], symbolLib.flatten("8253")
+        )
+
+        self.assertEqual(pickle.loads(pickle.dumps(symbolLib))._flattened, {})
+
+        derived.extends = "8253"
+        parent.extends = "8253"
+        with self.assertRaises(Exception):
+            symbolLib.flatten("8253")
+
     def test_createNewSymbolInEmptyLibrary(self):
         """Tests the ``create_new()`` function to create an empty symbol that is added to a
         symbol library"""